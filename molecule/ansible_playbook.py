@@ -18,17 +18,28 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
-import sh
+import os
+import signal
+import time
 
+from molecule import ansible_worker
 from molecule import logger
+from molecule import runner
 from molecule import util
 
 LOG = logger.get_logger(__name__)
 
+POLL_INTERVAL = 0.2
+
 
 class AnsiblePlaybook(object):
-    def __init__(self, inventory, playbook, config, out=LOG.out,
-                 err=LOG.error):
+    def __init__(self,
+                 inventory,
+                 playbook,
+                 config,
+                 out=LOG.out,
+                 err=LOG.error,
+                 step=None):
         """
         Sets up the requirements to execute `ansible-playbook` and returns
         None.
@@ -40,6 +51,8 @@ class AnsiblePlaybook(object):
          :func:`sh` call.
         :param err: An optional function to process STDERR for underlying
          :func:`sh` call.
+        :param step: An optional string containing the name of the step
+         executing the playbook.
         :returns: None
         """
         self._ansible_playbook_command = None
@@ -48,8 +61,11 @@ class AnsiblePlaybook(object):
         self._config = config
         self._out = out
         self._err = err
+        self._step = step
         self._cli = {}
         self._env = self._config.provisioner.env
+        events_file = self._config.provisioner.events_file(self.step)
+        self._env['MOLECULE_EVENTS_FILE'] = events_file
 
     def bake(self):
         """
@@ -63,32 +79,155 @@ class AnsiblePlaybook(object):
                                            self._cli)
         verbose_flag = util.verbose_flag(options)
 
-        self._ansible_playbook_command = sh.ansible_playbook.bake(
+        capture = {}
+        if self._out is None:
+            capture = {
+                '_spool': self.log_file,
+                '_tee': self._config.provisioner.capture_window,
+            }
+
+        cmd = runner.command('ansible-playbook')
+        self._ansible_playbook_command = cmd.bake(
             options,
             self._playbook,
             *verbose_flag,
             _cwd=self._config.scenario.directory,
             _env=self._env,
             _out=self._out,
-            _err=self._err)
+            _err=self._err,
+            **capture)
 
-    def execute(self):
+    @property
+    def step(self):
         """
-        Executes `ansible-playbook` and returns a string.
+        The name of the step executing the playbook, or the playbook's
+        basename when not given, and returns a string.
 
         :return: str
         """
+        if self._step:
+            return self._step
+
+        return os.path.splitext(os.path.basename(self._playbook))[0]
+
+    @property
+    def log_file(self):
+        """
+        The file output is spooled to when it is captured, rather than
+        processed by the `out` function, named after the step, and returns a
+        string.
+
+        :return: str
+        """
+        return os.path.join(self._config.provisioner.log_directory,
+                            '{}.log'.format(self.step))
+
+    def execute(self):
+        """
+        Executes `ansible-playbook` and returns a string.  Output which is
+        captured, rather than processed by the `out` function, is spooled to
+        the log file, and a `runner.Output` iterating over it is returned.
+
+        :return: str or runner.Output
+        """
         if self._ansible_playbook_command is None:
             self.bake()
 
+        self._remove_events_file()
+        self._setup_log_file()
+        if self._config.provisioner.engine == 'worker':
+            return self._execute_in_worker()
+
         try:
             cmd = util.run_command(
                 self._ansible_playbook_command,
                 debug=self._config.args.get('debug'))
-            return cmd.stdout
-        except sh.ErrorReturnCode as e:
+            return self._get_output(cmd.stdout)
+        except runner.ErrorReturnCode as e:
             util.sysexit(e.exit_code)
 
+    def execute_until(self, abort, interval=POLL_INTERVAL):
+        """
+        Executes `ansible-playbook` in the background, and terminates it as
+        soon as the given callable returns True, and returns a string.
+
+        The callable is only polled while the playbook runs, so the caller
+        reads what the playbook left once it returns.  A terminated playbook
+        is not an error.  Captured output is returned as in ``execute``.
+
+        :param abort: A callable taking no arguments and returning a bool.
+        :param interval: An optional float containing the seconds between
+         polls.
+        :return: str or runner.Output
+        """
+        if self._ansible_playbook_command is None:
+            self.bake()
+
+        self._remove_events_file()
+        self._setup_log_file()
+        if self._config.provisioner.engine == 'worker':
+            return self._execute_in_worker(abort=abort, interval=interval)
+
+        aborted = False
+        # Terminated when interrupted, as the background command does not
+        # receive the signals of the terminal.
+        with util.run_command(
+                self._ansible_playbook_command,
+                debug=self._config.args.get('debug'),
+                _bg=True) as cmd:
+            while cmd.is_alive():
+                if abort():
+                    # Signal the process group, so the forks of
+                    # ansible-playbook stop along with it.
+                    cmd.signal_group(signal.SIGTERM)
+                    aborted = True
+                    break
+                time.sleep(interval)
+
+        try:
+            cmd.wait()
+        except runner.ErrorReturnCode as e:
+            if not aborted:
+                util.sysexit(e.exit_code)
+
+        return self._get_output(cmd.stdout)
+
+    def _execute_in_worker(self, abort=None, interval=POLL_INTERVAL):
+        """
+        Executes the playbook in the Ansible worker of this environment and
+        returns a string.  Output which is not processed by the `out` function
+        is spooled to the log file, and returned as in ``execute``, otherwise
+        it is written to the terminal.
+
+        :param abort: An optional callable, see ``execute_until``.
+        :param interval: An optional float containing the seconds between
+         polls.
+        :return: str or runner.Output
+        """
+        cmd = self._ansible_playbook_command
+        if self._config.args.get('debug'):
+            util.print_environment_vars(self._env)
+            util.print_debug('COMMAND', str(cmd))
+
+        # The events file differs between steps, which share the worker.
+        env = dict(self._env)
+        events_file = env.pop('MOLECULE_EVENTS_FILE')
+        worker = ansible_worker.get_worker(env)
+        result = worker.run(
+            cmd.args,
+            self._config.scenario.directory,
+            spool=self.log_file if self._out is None else None,
+            env={'MOLECULE_EVENTS_FILE': events_file},
+            abort=abort,
+            interval=interval)
+        if result is None:
+            return self._get_output('')
+
+        if result:
+            util.sysexit(result)
+
+        return self._get_output('')
+
     def add_cli_arg(self, name, value):
         """
         Adds argument to CLI passed to ansible-playbook and returns None.
@@ -110,3 +249,36 @@ class AnsiblePlaybook(object):
         :return: None
         """
         self._env[name] = value
+
+    def _setup_log_file(self):
+        """
+        Prepare the log directory when output is captured, and returns None.
+
+        :return: None
+        """
+        if self._out is None:
+            util.makedirs(os.path.dirname(self.log_file))
+
+    def _get_output(self, stdout):
+        """
+        Get the output of the playbook, and returns a `runner.Output` when it
+        was captured, otherwise the given stdout.
+
+        :param stdout: The output kept by the command.
+        :return: runner.Output or str
+        """
+        if self._out is None:
+            return runner.Output(self.log_file)
+
+        return stdout
+
+    def _remove_events_file(self):
+        """
+        Remove the events of the previous run, so the events file only holds
+        the events of this run, and returns None.
+
+        :return: None
+        """
+        events_file = self._env.get('MOLECULE_EVENTS_FILE')
+        if events_file and os.path.isfile(events_file):
+            os.remove(events_file)
@@ -0,0 +1,334 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+from __future__ import print_function
+
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import traceback
+from multiprocessing import util as mp_util
+
+from molecule import logger
+
+LOG = logger.get_logger(__name__)
+
+POLL_INTERVAL = 0.2
+STOP_TIMEOUT = 10
+
+_workers = []
+
+
+class Worker(object):
+    """
+    A long-lived process which executes playbooks through Ansible's Python
+    API, rather than starting a new `ansible-playbook` for every playbook.
+
+    Ansible reads its configuration when it is imported, so a worker serves
+    a single environment.  Interpreter start-up and module imports are paid
+    once per worker, and every playbook runs in a fork of it, since Ansible
+    keeps global state between runs.  Each playbook still parses the
+    inventory, as Molecule rewrites it between steps.
+    """
+
+    def __init__(self, env):
+        """
+        Initialize a new worker class and returns None.  The process is
+        started on first use.
+
+        :param env: A dict containing the environment of the worker.
+        :return: None
+        """
+        self._env = dict(env)
+        self._process = None
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @property
+    def env(self):
+        return self._env
+
+    @property
+    def pid(self):
+        return self._process.pid if self._process else None
+
+    def is_alive(self):
+        return self._process is not None and self._process.is_alive()
+
+    def start(self):
+        """
+        Start the worker process and returns None.
+
+        :return: None
+        """
+        self._conn, child_conn = multiprocessing.Pipe()
+        # Ansible forks its own workers with multiprocessing, which daemonic
+        # processes may not do.
+        self._process = multiprocessing.Process(
+            target=_serve, args=(child_conn, self._env))
+        self._process.start()
+        child_conn.close()
+
+    def run(self,
+            args,
+            cwd,
+            spool=None,
+            env=None,
+            abort=None,
+            interval=POLL_INTERVAL):
+        """
+        Execute a playbook in the worker and returns the exit code, or None
+        when the playbook was aborted.  The worker runs one playbook at a
+        time, so concurrent steps wait for each other.
+
+        :param args: A list containing the `ansible-playbook` arguments.
+        :param cwd: A string containing the working directory.
+        :param spool: An optional string containing a filename the output is
+         written to, rather than the terminal.
+        :param env: An optional dict containing variables added to the
+         environment of this playbook only.
+        :param abort: An optional callable polled while the playbook runs,
+         which terminates the worker when it returns True.
+        :param interval: An optional float containing the seconds between
+         polls.
+        :return: int
+        """
+        with self._lock:
+            if not self.is_alive():
+                self.start()
+
+            self._conn.send({
+                'args': args,
+                'cwd': cwd,
+                'spool': spool,
+                'env': env
+            })
+            try:
+                while not self._conn.poll(interval):
+                    if abort is not None and abort():
+                        self.terminate()
+                        return
+                    if not self.is_alive():
+                        return self._exited()
+            except BaseException:
+                # Interrupted, and the worker runs in a session of its own,
+                # so it is terminated rather than left running the playbook.
+                self.terminate()
+                raise
+
+            try:
+                return self._conn.recv()
+            except (EOFError, IOError, OSError):
+                return self._exited()
+
+    def stop(self):
+        """
+        Ask the worker to exit, terminate it when it does not, and returns
+        None.
+
+        :return: None
+        """
+        if self.is_alive():
+            try:
+                self._conn.send(None)
+            except (IOError, OSError):
+                pass
+            self._process.join(STOP_TIMEOUT)
+        self.terminate()
+
+    def _exited(self):
+        msg = 'Ansible worker exited unexpectedly.'
+        LOG.error(msg)
+        self.terminate()
+
+        return 1
+
+    def terminate(self):
+        """
+        Terminate the worker along with the processes Ansible forked, and
+        returns None.
+
+        :return: None
+        """
+        if self.is_alive():
+            try:
+                os.killpg(self._process.pid, signal.SIGTERM)
+            except OSError:
+                self._process.terminate()
+            self._process.join()
+        if self._conn is not None:
+            self._conn.close()
+        self._process = None
+        self._conn = None
+
+
+def get_worker(env):
+    """
+    Get the worker serving the given environment, creating it when there is
+    none, and returns a Worker.
+
+    :param env: A dict containing the environment of the playbook.
+    :return: Worker
+    """
+    for worker in _workers:
+        if worker.env == env:
+            return worker
+
+    worker = Worker(env)
+    _workers.append(worker)
+
+    return worker
+
+
+def stop_workers():
+    """
+    Stop all workers and returns None.
+
+    :return: None
+    """
+    while _workers:
+        _workers.pop().stop()
+
+
+def terminate_workers():
+    """
+    Terminate all workers, without waiting for their playbooks, and returns
+    None.
+
+    :return: None
+    """
+    for worker in list(_workers):
+        worker.terminate()
+
+
+# At exit, multiprocessing waits for its non-daemonic children, after running
+# its finalizers, so the workers are stopped by a finalizer.
+mp_util.Finalize(None, stop_workers, exitpriority=10)
+
+
+def _serve(conn, env):  # pragma: no cover
+    """
+    The main loop of the worker process.  Executes playbooks until asked to
+    exit.
+
+    :param conn: A multiprocessing connection to the parent.
+    :param env: A dict containing the environment of the worker.
+    :return: None
+    """
+    # A session of its own, so the worker and its forks can be terminated
+    # together.
+    os.setsid()
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    os.environ.clear()
+    os.environ.update(env)
+    _preload()
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+
+        conn.send(_run(**request))
+
+
+def _run(args, cwd, spool, env=None):  # pragma: no cover
+    """
+    Execute a playbook in a fork of the worker, and returns the exit code.
+
+    :param args: A list containing the `ansible-playbook` arguments.
+    :param cwd: A string containing the working directory.
+    :param spool: A string containing a filename the output is written to, or
+     None.
+    :param env: A dict containing variables added to the environment, or
+     None.
+    :return: int
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        code = 250
+        try:
+            os.chdir(cwd)
+            os.environ.update(env or {})
+            if spool:
+                fd = os.open(spool, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                             0o644)
+                os.dup2(fd, 1)
+                os.close(fd)
+            code = _run_playbook(args)
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+
+    _, status = os.waitpid(pid, 0)
+    if os.WIFSIGNALED(status):
+        return 128 + os.WTERMSIG(status)
+
+    return os.WEXITSTATUS(status)
+
+
+def _run_playbook(args):  # pragma: no cover
+    """
+    Execute a playbook through Ansible's PlaybookCLI, and returns the exit
+    code `ansible-playbook` would exit with.
+
+    :param args: A list containing the `ansible-playbook` arguments.
+    :return: int
+    """
+    from ansible.cli.playbook import PlaybookCLI
+    from ansible.errors import AnsibleError
+
+    try:
+        cli = PlaybookCLI(['ansible-playbook'] + list(args))
+        if not _parses_in_run():
+            cli.parse()
+        return int(cli.run() or 0)
+    except AnsibleError as e:
+        print('ERROR! {}'.format(e), file=sys.stderr)
+        return 1
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else 1
+    except Exception:
+        traceback.print_exc()
+        return 250
+
+
+def _preload():  # pragma: no cover
+    # Import Ansible before forking, so every playbook starts with it loaded.
+    try:
+        from ansible.cli.playbook import PlaybookCLI  # noqa
+    except (Exception, SystemExit):
+        pass
+
+
+def _parses_in_run():  # pragma: no cover
+    # Ansible 2.8 moved argument parsing into run().
+    try:
+        from ansible import context  # noqa
+        return True
+    except ImportError:
+        return False
@@ -33,6 +33,8 @@ from molecule.command import init  # noqa
 from molecule.command import lint  # noqa
 from molecule.command import list  # noqa
 from molecule.command import login  # noqa
+from molecule.command import prune  # noqa
+from molecule.command import restore  # noqa
 from molecule.command import syntax  # noqa
 from molecule.command import test  # noqa
 from molecule.command import verify  # noqa
@@ -21,9 +21,13 @@
 import abc
 import collections
 import glob
+import multiprocessing
 import os
+from multiprocessing import pool
 
 from molecule import config
+from molecule import parallel
+from molecule import scheduler
 from molecule import util
 
 MOLECULE_GLOB = 'molecule/*/molecule.yml'
@@ -60,12 +64,17 @@ class Base(object):
             self._config.provisioner.config_file,
             self._config.provisioner.inventory_file,
             self._config.state.state_file,
+            self._config.state.lock_file,
+            self._config.timings.timings_file,
         ]
         for root, _, files in os.walk(
                 self._config.ephemeral_directory, topdown=False):
             for name in files:
                 safe_files = [
                     os.path.basename(f) for f in self._config.driver.safe_files
+                ] + [
+                    os.path.basename(f)
+                    for f in self._config.dependency.safe_files
                 ] + [os.path.basename(f) for f in default_safe_files]
 
                 if name not in safe_files:
@@ -77,8 +86,7 @@ class Base(object):
 
         :return: None
         """
-        if not os.path.isdir(self._config.ephemeral_directory):
-            os.mkdir(self._config.ephemeral_directory)
+        util.makedirs(self._config.ephemeral_directory)
 
         self._config.provisioner.write_inventory()
         self._config.provisioner.write_config()
@@ -86,6 +94,84 @@ class Base(object):
         self._config.provisioner.add_or_update_vars('group_vars')
 
 
+def verify_supports_reconcile(c):
+    """
+    Verify the driver can limit its playbooks to a subset of the platforms
+    and returns None.
+
+    :param c: An instance of a Molecule config.
+    :return: None
+    """
+    if not c.driver.supports_reconcile:
+        msg = ("The '{}' driver does not support reconciling "
+               'instances.').format(c.driver.name)
+        util.sysexit_with_message(msg)
+
+
+def execute_subcommand(c, subcommand):
+    """
+    Execute the given subcommand with the given config and returns None.
+
+    :param c: An instance of a Molecule config.
+    :param subcommand: A string containing the name of the subcommand.
+    :return: None
+    """
+    import molecule.command
+
+    command_module = getattr(molecule.command, subcommand)
+    command = getattr(command_module, subcommand.capitalize())
+    command(c).execute()
+
+
+def execute_sequence(c, sequence):
+    """
+    Execute the given sequence of subcommands with the given config, using
+    the scenario's scheduler, and returns None.  The timings of previous
+    runs are reset first.
+
+    :param c: An instance of a Molecule config.
+    :param sequence: A list containing the names of the subcommands.
+    :return: None
+    """
+    c.timings.reset()
+    if c.scenario.scheduler == 'graph':
+        scheduler.execute(sequence, lambda step: execute_subcommand(c, step))
+        return
+
+    for step in sequence:
+        execute_subcommand(c, step)
+
+
+def execute_scenarios(configs, func, processes=None, keep_going=False):
+    """
+    Execute the given function for each config and returns None.  Scenarios
+    are executed one after another in this process, unless a number of
+    processes is given, in which case they are executed concurrently in
+    processes of their own, followed by a summary of their results.
+
+    :param configs: A list of Molecule configs.
+    :param func: A callable taking a Molecule config.
+    :param processes: An optional int containing the number of scenarios to
+     execute concurrently.
+    :param keep_going: An optional bool to execute the remaining scenarios
+     after a failure, rather than terminating them.
+    :return: None
+    """
+    if not processes:
+        for c in configs:
+            func(c)
+        return
+
+    results = parallel.execute(configs, func, processes, keep_going)
+    parallel.print_summary(results)
+
+    failed = [r.scenario for r in results if r.status != parallel.PASSED]
+    if failed:
+        msg = 'Scenarios failed or cancelled: {}.'.format(', '.join(
+            "'{}'".format(name) for name in failed))
+        util.sysexit_with_message(msg)
+
+
 def _verify_configs(configs):
     """
     Verify a Molecule config was found and returns None.
@@ -94,7 +180,7 @@ def _verify_configs(configs):
     :return: None
     """
     if configs:
-        scenario_names = [c.scenario.name for c in configs]
+        scenario_names = [_get_scenario_name(c) for c in configs]
         for scenario_name, n in collections.Counter(scenario_names).items():
             if n > 1:
                 msg = ("Duplicate scenario name '{}' found.  "
@@ -115,7 +201,7 @@ def _verify_scenario_name(configs, scenario_name):
      verify.
     :return: None
     """
-    scenario_names = [c.scenario.name for c in configs]
+    scenario_names = [_get_scenario_name(c) for c in configs]
     if scenario_name not in scenario_names:
         msg = ("Scenario '{}' not found.  Exiting.").format(scenario_name)
         util.sysexit_with_message(msg)
@@ -126,26 +212,26 @@ def get_configs(args, command_args):
     Glob the current directory for Molecule config files, instantiate config
     objects, and returns a list.
 
+    Scenarios are selected by directory name before any config file is
+    parsed, so targeting a scenario only parses its own config.  When more
+    than one config remains, they are instantiated concurrently.
+
     :param args: A dict of options, arguments and commands from the CLI.
     :param command_args: A dict of options passed to the subcommand from
      the CLI.
     :return: list
     """
-    configs = [
-        config.Config(
-            molecule_file=os.path.abspath(c),
-            args=args,
-            command_args=command_args) for c in glob.glob(MOLECULE_GLOB)
-    ]
+    molecule_files = [os.path.abspath(c) for c in glob.glob(MOLECULE_GLOB)]
 
     scenario_name = command_args.get('scenario_name')
     if scenario_name:
-        configs = _filter_configs_for_scenario(scenario_name, configs)
-        _verify_scenario_name(configs, scenario_name)
+        molecule_files = _filter_configs_for_scenario(scenario_name,
+                                                      molecule_files)
+        _verify_scenario_name(molecule_files, scenario_name)
 
-    _verify_configs(configs)
+    _verify_configs(molecule_files)
 
-    return configs
+    return _load_configs(molecule_files, args, command_args)
 
 
 def _filter_configs_for_scenario(scenario_name, configs):
@@ -154,8 +240,48 @@ def _filter_configs_for_scenario(scenario_name, configs):
 
     :param scenario_name: A string representing the name of the scenario's
      config to return
-    :param configs: A list containing Molecule config instances.
+    :param configs: A list containing absolute paths to Molecule config files.
+    :return: list
+    """
+
+    return [c for c in configs if _get_scenario_name(c) == scenario_name]
+
+
+def _load_configs(molecule_files, args, command_args):
+    """
+    Instantiate a config object for each Molecule config file, in a thread
+    pool when there are several, and returns a list.
+
+    :param molecule_files: A list containing absolute paths to Molecule config
+     files.
+    :param args: A dict of options, arguments and commands from the CLI.
+    :param command_args: A dict of options passed to the subcommand from
+     the CLI.
     :return: list
     """
 
-    return [c for c in configs if c.scenario.name == scenario_name]
+    def load(molecule_file):
+        return config.Config(
+            molecule_file=molecule_file, args=args, command_args=command_args)
+
+    if len(molecule_files) < 2:
+        return [load(c) for c in molecule_files]
+
+    processes = min(len(molecule_files), multiprocessing.cpu_count())
+    p = pool.ThreadPool(processes=processes)
+    try:
+        return p.map(load, molecule_files)
+    finally:
+        p.close()
+        p.join()
+
+
+def _get_scenario_name(molecule_file):
+    """
+    Determine the scenario name of a Molecule config file without parsing it
+    and returns a string.  Mirrors :func:`.Scenario.name`.
+
+    :param molecule_file: A string containing the path to the Molecule file.
+    :return: str
+    """
+    return os.path.basename(os.path.dirname(molecule_file))
@@ -22,7 +22,6 @@ import os
 
 import click
 
-import molecule.command
 from molecule import logger
 from molecule.command import base
 
@@ -43,6 +42,10 @@ class Check(base.Base):
 
         >>> molecule check --scenario-name foo
 
+        Targeting all scenarios, executing up to four concurrently:
+
+        >>> molecule check --parallel 4
+
         Executing with `debug`:
 
         >>> molecule --debug check
@@ -64,18 +67,33 @@ class Check(base.Base):
 @click.pass_context
 @click.option(
     '--scenario-name',
-    default='default',
-    help='Name of the scenario to target. (default)')
-def check(ctx, scenario_name):  # pragma: no cover
+    help='Name of the scenario to target. (default, or all scenarios when '
+    'executing in parallel)')
+@click.option(
+    '--parallel',
+    type=click.IntRange(min=1),
+    help='Number of scenarios to execute concurrently, each with its output '
+    'prefixed by its name.')
+@click.option(
+    '--fail-fast/--keep-going',
+    default=True,
+    help='Terminate the running scenarios when one fails, or let the '
+    'remaining scenarios finish. (fail-fast)')
+def check(ctx, scenario_name, parallel, fail_fast):  # pragma: no cover
     """ Use a provisioner to perform a Dry-Run (create, converge, create). """
     args = ctx.obj.get('args')
+    if scenario_name is None and parallel is None:
+        scenario_name = 'default'
     command_args = {
         'subcommand': __name__,
         'scenario_name': scenario_name,
     }
 
-    for c in base.get_configs(args, command_args):
-        for task in c.scenario.check_sequence:
-            command_module = getattr(molecule.command, task)
-            command = getattr(command_module, task.capitalize())
-            command(c).execute()
+    def execute(c):
+        base.execute_sequence(c, c.scenario.check_sequence)
+
+    base.execute_scenarios(
+        base.get_configs(args, command_args),
+        execute,
+        processes=parallel,
+        keep_going=not fail_fast)
@@ -22,8 +22,11 @@ import os
 
 import click
 
-import molecule.command
+from molecule import events
+from molecule import fingerprint
 from molecule import logger
+from molecule import runner
+from molecule import util
 from molecule.command import base
 
 LOG = logger.get_logger(__name__)
@@ -43,6 +46,18 @@ class Converge(base.Base):
 
         >>> molecule converge --scenario-name foo
 
+        Targeting all scenarios, executing up to four concurrently:
+
+        >>> molecule converge --parallel 4
+
+        Skipping the playbook when neither the role, the scenario nor its
+        config changed since the instances were last converged:
+
+        >>> molecule converge --incremental
+
+        Drivers which snapshot the instances do so once they are converged,
+        see `molecule restore`.
+
         Executing with `debug`:
 
         >>> molecule --debug converge
@@ -57,26 +72,130 @@ class Converge(base.Base):
             os.path.basename(self._config.provisioner.playbooks.converge))
         LOG.info(msg)
 
+        # Only incremental converges are fingerprinted, others clear the
+        # fingerprint.
+        converge_fingerprint = None
+        if self._config.command_args.get('incremental'):
+            converge_fingerprint = fingerprint.converge(self._config)
+            if self._is_converged(converge_fingerprint):
+                LOG.warn('Skipping, nothing changed since the last converge.')
+                return
+
+        with self._config.state.transaction():
+            self._config.state.change_state('converged_fingerprint', None)
+            self._config.state.change_state('idempotent_fingerprint', None)
+
         self._config.provisioner.converge()
-        self._config.state.change_state('converged', True)
+        event_list = events.EventReader(
+            self._config.provisioner.events_file('converge')).read()
+        if event_list:
+            self._config.timings.record('converge', event_list)
+
+        with self._config.state.transaction():
+            self._config.state.change_state('converged', True)
+            self._config.state.change_state('converged_fingerprint',
+                                            converge_fingerprint)
+            for instance_name in self._config.state.instances.keys():
+                self._config.state.change_instance_state(
+                    instance_name, 'converged', True)
+
+        if self._config.driver.supports_snapshot:
+            self._snapshot(converge_fingerprint)
+
+    def _snapshot(self, converge_fingerprint):
+        """
+        Snapshot the converged instances, record each snapshot along with the
+        fingerprint of its inputs, remove the snapshots they replace, and
+        returns None.
+
+        :param converge_fingerprint: A string containing the fingerprint of
+         the inputs of the converge, or None when it was not computed.
+        :return: None
+        """
+        fingerprints = fingerprint.snapshot(self._config, converge_fingerprint)
+        instances = self._config.state.instances
+        instance_names = sorted(n for n in instances if n in fingerprints)
+        if not instance_names:
+            return
+
+        msg = 'Snapshotting instance(s): [{}]'.format(', '.join(
+            instance_names))
+        LOG.info(msg)
+
+        driver = self._config.driver
+        for instance_name in instance_names:
+            previous = instances[instance_name].get('snapshot')
+            try:
+                snapshot = driver.snapshot(instance_name)
+            except runner.ErrorReturnCode as e:
+                util.sysexit(e.exit_code)
+
+            with self._config.state.transaction():
+                self._config.state.change_instance_state(
+                    instance_name, 'snapshot', snapshot)
+                self._config.state.change_instance_state(
+                    instance_name, 'snapshot_fingerprint',
+                    fingerprints[instance_name])
+            if previous and previous != snapshot:
+                driver.remove_snapshot(previous)
+
+    def _is_converged(self, converge_fingerprint):
+        """
+        Determine whether every instance was converged with inputs matching
+        the given fingerprint and returns a bool.
+
+        :param converge_fingerprint: A string containing the fingerprint of
+         the inputs of the converge.
+        :return: bool
+        """
+        state = self._config.state
+        instances = state.instances.values()
+
+        return bool(
+            state.converged and instances and
+            all(i.get('converged') for i in instances) and
+            state.converged_fingerprint == converge_fingerprint)
 
 
 @click.command()
 @click.pass_context
 @click.option(
     '--scenario-name',
-    default='default',
-    help='Name of the scenario to target. (default)')
-def converge(ctx, scenario_name):  # pragma: no cover
+    help='Name of the scenario to target. (default, or all scenarios when '
+    'executing in parallel)')
+@click.option(
+    '--parallel',
+    type=click.IntRange(min=1),
+    help='Number of scenarios to execute concurrently, each with its output '
+    'prefixed by its name.')
+@click.option(
+    '--fail-fast/--keep-going',
+    default=True,
+    help='Terminate the running scenarios when one fails, or let the '
+    'remaining scenarios finish. (fail-fast)')
+@click.option(
+    '--incremental',
+    is_flag=True,
+    default=False,
+    help='Skip the playbook when nothing changed since the last converge.')
+def converge(ctx, scenario_name, parallel, fail_fast,
+             incremental):  # pragma: no cover
     """ Use a provisioner to configure instances (create, converge). """
     args = ctx.obj.get('args')
+    if scenario_name is None and parallel is None:
+        scenario_name = 'default'
     command_args = {
         'subcommand': __name__,
         'scenario_name': scenario_name,
+        'incremental': incremental,
     }
 
-    for c in base.get_configs(args, command_args):
-        for task in c.scenario.converge_sequence:
-            command_module = getattr(molecule.command, task)
-            command = getattr(command_module, task.capitalize())
-            command(c).execute()
+    def execute(c):
+        base.execute_sequence(c, c.scenario.converge_sequence)
+        c.timings.print_summary()
+
+    base.execute_scenarios(
+        base.get_configs(args, command_args),
+        execute,
+        processes=parallel,
+        keep_going=not fail_fast)
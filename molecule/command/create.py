@@ -19,11 +19,13 @@
 #  DEALINGS IN THE SOFTWARE.
 
 import os
+import time
 
 import click
 
 from molecule import config
 from molecule import logger
+from molecule import util
 from molecule.command import base
 
 LOG = logger.get_logger(__name__)
@@ -47,6 +49,15 @@ class Create(base.Base):
 
         >>> molecule converge --driver-name foo
 
+        Only create the platforms missing from the state file:
+
+        >>> molecule create --reconcile
+
+        Reset the instances which are left from a previous run, rather than
+        recreating them, and create the missing ones:
+
+        >>> molecule test --reuse-instances
+
         Executing with `debug`:
 
         >>> molecule --debug create
@@ -69,16 +80,126 @@ class Create(base.Base):
             LOG.warn('Skipping, instances managed statically.')
             return
 
+        if self._config.command_args.get('reconcile'):
+            self._reconcile()
+            return
+
+        if self._config.command_args.get('reuse_instances'):
+            self._reuse()
+            return
+
         if self._config.state.created:
             LOG.warn('Skipping, instances already created.')
             return
 
         self._config.provisioner.setup()
-        self._config.state.change_state('created', True)
+        self._record_instances(self._config.platforms.instances)
         # Add the driver's connection_options to inventory, once the instances
         # are created.
         self._config.provisioner.write_inventory()
 
+    def _reconcile(self):
+        """
+        Create only the platforms without a created instance in the state
+        file and returns None.
+
+        :return: None
+        """
+        base.verify_supports_reconcile(self._config)
+
+        platforms = self._config.platforms.uncreated
+        if not platforms:
+            LOG.warn('Skipping, instances already created.')
+            return
+
+        msg = 'Reconciling instance(s): [{}]'.format(', '.join(
+            p['name'] for p in platforms))
+        LOG.info(msg)
+
+        self._config.provisioner.setup(platforms)
+        self._record_instances(platforms)
+        self._config.provisioner.write_inventory()
+
+    def _reuse(self):
+        """
+        Reset the instances left from a previous run, create the platforms
+        without an instance, and returns None.
+
+        Drivers which recreate instances cheaply from their cached images
+        recreate the reused instances, the others keep them as they are.
+        Either way they are no longer converged.
+
+        :return: None
+        """
+        base.verify_supports_reconcile(self._config)
+
+        recorded = self._config.state.instances
+        reused = [
+            instance.platform
+            for instance in self._config.platforms.instance_models
+            if recorded.get(instance.name, {}).get('created')
+        ]
+        platforms = self._config.platforms.uncreated
+        if reused:
+            msg = 'Reusing instance(s): [{}]'.format(', '.join(
+                p['name'] for p in reused))
+            LOG.info(msg)
+            self._reset_instances(reused)
+            if self._config.driver.reset_recreates:
+                self._config.provisioner.destroy(reused)
+                platforms = reused + platforms
+
+        if platforms:
+            self._config.provisioner.setup(platforms)
+            self._record_instances(platforms)
+        self._config.provisioner.write_inventory()
+
+    def _reset_instances(self, platforms):
+        """
+        Record the given platforms' instances as no longer converged in the
+        state file and returns None.
+
+        :param platforms: A list of platforms.
+        :return: None
+        """
+        scenario_name = self._config.scenario.name
+        with self._config.state.transaction():
+            self._config.state.change_state('converged', False)
+            for platform in platforms:
+                instance_name = util.instance_with_scenario_name(
+                    platform['name'], scenario_name)
+                self._config.state.change_instance_state(
+                    instance_name, 'converged', False)
+
+    def _record_instances(self, platforms):
+        """
+        Record the given platforms as created instances in the state file,
+        along with the hash of their definition and the time they were first
+        created, and returns None.
+
+        :param platforms: A list of platforms.
+        :return: None
+        """
+        now = time.time()
+        scenario_name = self._config.scenario.name
+        with self._config.state.transaction():
+            self._config.state.change_state('created', True)
+            for platform in platforms:
+                instance_name = util.instance_with_scenario_name(
+                    platform['name'], scenario_name)
+                instance = self._config.platforms.get_instance(instance_name)
+                recorded = self._config.state.instances.get(instance_name, {})
+                self._config.state.change_instance_state(
+                    instance_name, 'created', True)
+                self._config.state.change_instance_state(
+                    instance_name, 'created_at',
+                    recorded.get('created_at', now))
+                self._config.state.change_instance_state(
+                    instance_name, 'platform', platform)
+                self._config.state.change_instance_state(
+                    instance_name, 'definition',
+                    self._config.platforms.definition(instance))
+
 
 @click.command()
 @click.pass_context
@@ -90,13 +211,19 @@ class Create(base.Base):
     '--driver-name',
     type=click.Choice(config.molecule_drivers()),
     help='Name of driver to use. (docker)')
-def create(ctx, scenario_name, driver_name):  # pragma: no cover
+@click.option(
+    '--reconcile',
+    is_flag=True,
+    default=False,
+    help='Only create platforms missing from the state file.')
+def create(ctx, scenario_name, driver_name, reconcile):  # pragma: no cover
     """ Start instances. """
     args = ctx.obj.get('args')
     command_args = {
         'subcommand': __name__,
         'scenario_name': scenario_name,
         'driver_name': driver_name,
+        'reconcile': reconcile,
     }
 
     for c in base.get_configs(args, command_args):
@@ -24,6 +24,7 @@ import click
 
 from molecule import config
 from molecule import logger
+from molecule import platforms
 from molecule.command import base
 
 LOG = logger.get_logger(__name__)
@@ -47,6 +48,15 @@ class Destroy(base.Base):
 
         >>> molecule converge --driver-name foo
 
+        Only destroy the instances whose platforms were removed or changed:
+
+        >>> molecule destroy --reconcile
+
+        Keep the instances for the next run, and only destroy the stale or
+        expired ones:
+
+        >>> molecule test --reuse-instances
+
         Executing with `debug`:
 
         >>> molecule --debug destroy
@@ -61,6 +71,14 @@ class Destroy(base.Base):
             os.path.basename(self._config.provisioner.playbooks.teardown))
         LOG.info(msg)
 
+        if self._config.command_args.get('reconcile'):
+            self._reconcile()
+            return
+
+        if self._config.command_args.get('reuse_instances'):
+            self._reuse()
+            return
+
         self.prune()
 
         if self._config.driver.name == 'static':
@@ -68,9 +86,94 @@ class Destroy(base.Base):
             return
 
         self._config.provisioner.destroy()
+        self._remove_snapshots(self._config.state.instances.keys())
 
         self._config.state.reset()
 
+    def _reconcile(self):
+        """
+        Destroy only the instances whose platforms were removed from or
+        changed in the Molecule file, and returns None.  The ephemeral
+        directory is not pruned, since the remaining instances still use it.
+
+        :return: None
+        """
+        if self._config.driver.name == 'static':
+            LOG.warn('Skipping, instances managed statically.')
+            return
+
+        base.verify_supports_reconcile(self._config)
+
+        stale = self._config.platforms.stale
+        if not stale:
+            LOG.warn('Skipping, no instances to reconcile.')
+            return
+
+        msg = 'Reconciling instance(s): [{}]'.format(', '.join(
+            sorted(stale.keys())))
+        LOG.info(msg)
+
+        self._destroy_instances(stale)
+
+    def _reuse(self):
+        """
+        Destroy only the instances which are stale, or older than the
+        instance TTL, keeping the others for reuse, and returns None.
+
+        :return: None
+        """
+        if self._config.driver.name == 'static':
+            LOG.warn('Skipping, instances managed statically.')
+            return
+
+        base.verify_supports_reconcile(self._config)
+
+        ttl = self._config.command_args.get('instance_ttl',
+                                            platforms.INSTANCE_TTL)
+        instances = self._config.platforms.expired(ttl)
+        instances.update(self._config.platforms.stale)
+        if not instances:
+            LOG.warn('Skipping, instances kept for reuse.')
+            return
+
+        msg = 'Destroying stale or expired instance(s): [{}]'.format(', '.join(
+            sorted(instances.keys())))
+        LOG.info(msg)
+
+        self._destroy_instances(instances)
+
+    def _destroy_instances(self, instances):
+        """
+        Destroy the given instances, remove them from the state file, and
+        returns None.
+
+        :param instances: A dict of platform definitions keyed by instance
+         name.
+        :return: None
+        """
+        self._config.provisioner.destroy(list(instances.values()))
+        self._remove_snapshots(instances.keys())
+
+        with self._config.state.transaction():
+            for instance_name in instances.keys():
+                self._config.state.remove_instance(instance_name)
+            if not self._config.state.instances:
+                self._config.state.reset()
+
+    def _remove_snapshots(self, instance_names):
+        """
+        Remove the snapshots of the given destroyed instances and returns
+        None.
+
+        :param instance_names: A list of instance names.
+        :return: None
+        """
+        recorded = self._config.state.instances
+        for instance_name in instance_names:
+            snapshot = recorded.get(instance_name, {}).get('snapshot')
+            if snapshot:
+                self._config.driver.remove_snapshot(snapshot)
+
 
 @click.command()
 @click.pass_context
@@ -82,13 +185,19 @@ class Destroy(base.Base):
     '--driver-name',
     type=click.Choice(config.molecule_drivers()),
     help='Name of driver to use. (docker)')
-def destroy(ctx, scenario_name, driver_name):  # pragma: no cover
+@click.option(
+    '--reconcile',
+    is_flag=True,
+    default=False,
+    help='Only destroy instances whose platforms were removed or changed.')
+def destroy(ctx, scenario_name, driver_name, reconcile):  # pragma: no cover
     """ Destroy instances. """
     args = ctx.obj.get('args')
     command_args = {
         'subcommand': __name__,
         'scenario_name': scenario_name,
         'driver_name': driver_name,
+        'reconcile': reconcile,
     }
 
     for c in base.get_configs(args, command_args):
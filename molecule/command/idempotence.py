@@ -23,6 +23,8 @@ import re
 
 import click
 
+from molecule import events
+from molecule import fingerprint
 from molecule import logger
 from molecule import util
 from molecule.command import base
@@ -44,6 +46,15 @@ class Idempotence(base.Base):
 
         >>> molecule idempotence --scenario-name foo
 
+        Terminating the playbook as soon as a task reports a change:
+
+        >>> molecule idempotence --abort-on-change
+
+        Skipping the playbook when nothing changed since idempotence was last
+        verified:
+
+        >>> molecule idempotence --incremental
+
         Executing with `debug`:
 
         >>> molecule --debug idempotence
@@ -62,33 +73,100 @@ class Idempotence(base.Base):
             msg = 'Instances not converged.  Please converge instances first.'
             util.sysexit_with_message(msg)
 
-        output = self._config.provisioner.converge(out=None, err=None)
+        converge_fingerprint = None
+        if self._config.command_args.get('incremental'):
+            converge_fingerprint = fingerprint.converge(self._config)
+            if (self._config.state.idempotent_fingerprint ==
+                    converge_fingerprint):
+                LOG.warn('Skipping, nothing changed since idempotence was '
+                         'last verified.')
+                return
+
+        self._reader = events.EventReader(
+            self._config.provisioner.events_file('idempotence'))
+        self._events = []
+        if self._config.command_args.get('abort_on_change'):
+            output = self._config.provisioner.converge(
+                out=None,
+                err=None,
+                step='idempotence',
+                abort=self._has_changed)
+        else:
+            output = self._config.provisioner.converge(
+                out=None, err=None, step='idempotence')
+
+        event_list = self._read_events()
+        if event_list:
+            self._config.timings.record('idempotence', event_list)
+            changed = events.changed(event_list)
+            idempotent = not changed
+            tasks = self._format_tasks(changed)
+        else:
+            # The callback plugin did not run, fall back to the output.
+            idempotent = self._is_idempotent(output)
+            tasks = self._non_idempotent_tasks(output)
 
-        idempotent = self._is_idempotent(output)
         if idempotent:
             LOG.success('Idempotence completed successfully.')
+            state = self._config.state
+            if (converge_fingerprint is not None and
+                    state.converged_fingerprint == converge_fingerprint):
+                state.change_state('idempotent_fingerprint',
+                                   converge_fingerprint)
         else:
             msg = ('Idempotence test failed because of the following tasks:\n'
-                   '{}').format('\n'.join(self._non_idempotent_tasks(output)))
+                   '{}').format('\n'.join(tasks))
             util.sysexit_with_message(msg)
 
-    def _is_idempotent(self, output):
+    def _read_events(self):
         """
-        Parses the output of the provisioning for changed and returns a bool.
+        Reads the events written since the previous read and returns a list of
+        all events read.
+
+        :return: list
+        """
+        self._events.extend(self._reader.read())
+
+        return self._events
+
+    def _has_changed(self):
+        """
+        Reads the events written since the previous read, and returns True
+        when any task reported a change.
 
-        :param output: A string containing the output of the ansible run.
         :return: bool
         """
+        if events.changed(self._read_events()):
+            LOG.warn('Task reported a change, terminating the playbook.')
+            return True
+
+        return False
+
+    def _format_tasks(self, results):
+        """
+        Formats the changed results of the callback plugin's events.
 
-        # Remove blank lines to make regex matches easier
-        output = re.sub(r'\n\s*\n*', '\n', output)
+        :param results: A list of result events.
+        :return: A list containing the names of the non idempotent tasks.
+        """
+        return [
+            '* [{}] => {}'.format(result['host'], result['task'])
+            for result in results
+        ]
 
-        # Look for any non-zero changed lines
-        changed = re.search(r'(changed=[1-9][0-9]*)', output)
+    def _is_idempotent(self, output):
+        """
+        Parses the output of the provisioning for changed and returns a bool.
 
-        if changed:
-            # Not idempotent
-            return False
+        :param output: A string containing the output of the ansible run, or
+         an iterable of its lines.
+        :return: bool
+        """
+        for line in self._lines(output):
+            # Look for any non-zero changed lines
+            if re.search(r'(changed=[1-9][0-9]*)', line):
+                # Not idempotent
+                return False
 
         return True
 
@@ -96,20 +174,15 @@ class Idempotence(base.Base):
         """
         Parses the output to identify the non idempotent tasks.
 
-        :param (str) output: A string containing the output of the ansible run.
+        :param (str) output: A string containing the output of the ansible run,
+         or an iterable of its lines.
         :return: A list containing the names of the non idempotent tasks.
         """
-        # Remove blank lines to make regex matches easier.
-        output = re.sub(r'\n\s*\n*', '\n', output)
-
-        # Remove ansi escape sequences.
-        output = util.strip_ansi_escape(output)
-
-        # Split the output into a list and go through it.
-        output_lines = output.split('\n')
         res = []
         task_line = ''
-        for _, line in enumerate(output_lines):
+        for line in self._lines(output):
+            # Remove ansi escape sequences.
+            line = util.strip_ansi_escape(line)
             if line.startswith('TASK'):
                 task_line = line
             elif line.startswith('changed'):
@@ -119,6 +192,24 @@ class Idempotence(base.Base):
 
         return res
 
+    def _lines(self, output):
+        """
+        Iterates over the non-blank lines of the output, which is read lazily
+        when it is not a string.
+
+        :param output: A string, or an iterable of lines.
+        :return: A generator of strings.
+        """
+        if isinstance(output, bytes):
+            output = output.decode('utf-8', 'replace')
+        if isinstance(output, type(u'')):
+            output = output.splitlines()
+
+        for line in output:
+            line = line.rstrip('\r\n')
+            if line.strip():
+                yield line
+
 
 @click.command()
 @click.pass_context
@@ -126,7 +217,19 @@ class Idempotence(base.Base):
     '--scenario-name',
     default='default',
     help='Name of the scenario to target. (default)')
-def idempotence(ctx, scenario_name):  # pragma: no cover
+@click.option(
+    '--abort-on-change',
+    is_flag=True,
+    default=False,
+    help='Terminate the playbook as soon as a task reports a change.')
+@click.option(
+    '--incremental',
+    is_flag=True,
+    default=False,
+    help='Skip the playbook when nothing changed since idempotence was last '
+    'verified.')
+def idempotence(ctx, scenario_name, abort_on_change,
+                incremental):  # pragma: no cover
     """
     Use a provisioner to configure the instances and parse the output to
     determine idempotence.
@@ -135,6 +238,8 @@ def idempotence(ctx, scenario_name):  # pragma: no cover
     command_args = {
         'subcommand': __name__,
         'scenario_name': scenario_name,
+        'abort_on_change': abort_on_change,
+        'incremental': incremental,
     }
 
     for c in base.get_configs(args, command_args):
@@ -64,10 +64,7 @@ class Login(base.Base):
             msg = 'Instances not created.  Please create instances first.'
             util.sysexit_with_message(msg)
 
-        hosts = [
-            d['name']
-            for d in self._config.platforms.instances_with_scenario_name
-        ]
+        hosts = [i.name for i in self._config.platforms.instance_models]
         hostname = self._get_hostname(hosts)
         self._get_login(hostname)
 
@@ -0,0 +1,77 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+
+import click
+
+from molecule import logger
+from molecule import runner
+from molecule import util
+from molecule.driver import image_cache
+
+LOG = logger.get_logger(__name__)
+
+DAY = 24 * 60 * 60
+MIB = 1024 * 1024
+
+
+def execute(max_age=image_cache.MAX_AGE, max_size=image_cache.MAX_SIZE):
+    """
+    Remove the images of the Docker image cache which were not used for
+    longer than the given age, and then the least recently used ones until
+    the cached images take no more than the given size, and returns None.
+
+    >>> molecule prune
+
+    Keeping only the images used in the last week, up to 2 GiB:
+
+    >>> molecule prune --max-age 7 --max-size 2048
+
+    :param max_age: An optional int containing the age in seconds.
+    :param max_size: An optional int containing the size in bytes.
+    :return: None
+    """
+    cache = image_cache.ImageCache()
+    try:
+        removed = cache.prune(max_age=max_age, max_size=max_size)
+    except runner.CommandNotFound:
+        msg = "Unable to prune the image cache, 'docker' not found."
+        util.sysexit_with_message(msg)
+
+    msg = 'Removed {} cached image(s).'.format(len(removed))
+    LOG.success(msg)
+
+
+@click.command()
+@click.option(
+    '--max-age',
+    type=click.IntRange(min=0),
+    default=image_cache.MAX_AGE // DAY,
+    help='Days after which unused cached images are removed. ({})'.format(
+        image_cache.MAX_AGE // DAY))
+@click.option(
+    '--max-size',
+    type=click.IntRange(min=0),
+    default=image_cache.MAX_SIZE // MIB,
+    help='MiB the cached images may take. ({})'.format(
+        image_cache.MAX_SIZE // MIB))
+def prune(max_age, max_size):  # pragma: no cover
+    """ Remove unused images from Molecule's image cache. """
+    execute(max_age=max_age * DAY, max_size=max_size * MIB)
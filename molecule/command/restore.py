@@ -0,0 +1,115 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import click
+
+from molecule import fingerprint
+from molecule import logger
+from molecule import runner
+from molecule import util
+from molecule.command import base
+
+LOG = logger.get_logger(__name__)
+
+
+class Restore(base.Base):
+    def execute(self):
+        """
+        Execute the actions necessary to perform a `molecule restore` and
+        returns None.
+
+        Replace the instances with the snapshots the driver took when they
+        were last converged.  Snapshots whose role, scenario or platform
+        changed since are stale, and are not restored.
+
+        Target the default scenario:
+
+        >>> molecule restore
+
+        Targeting a specific scenario:
+
+        >>> molecule restore --scenario-name foo
+
+        Executing with `debug`:
+
+        >>> molecule --debug restore
+
+        :return: None
+        """
+        msg = 'Scenario: [{}]'.format(self._config.scenario.name)
+        LOG.info(msg)
+        msg = 'Driver: [{}]'.format(self._config.driver.name)
+        LOG.info(msg)
+
+        driver = self._config.driver
+        if not driver.supports_snapshot:
+            msg = "Driver '{}' does not snapshot instances.".format(
+                driver.name)
+            util.sysexit_with_message(msg)
+
+        instances = self._config.state.instances
+        if not instances:
+            LOG.warn('Skipping, no instances to restore.')
+            return
+
+        fingerprints = fingerprint.snapshot(self._config)
+        stale = sorted(
+            instance_name for instance_name, d in instances.items()
+            if not d.get('snapshot') or
+            d.get('snapshot_fingerprint') != fingerprints.get(instance_name))
+        if stale:
+            msg = ('No current snapshot of instance(s): [{}].  Converge '
+                   'them first.').format(', '.join(stale))
+            util.sysexit_with_message(msg)
+
+        msg = 'Restoring instance(s): [{}]'.format(', '.join(
+            sorted(instances.keys())))
+        LOG.info(msg)
+
+        for instance_name, d in sorted(instances.items()):
+            instance = self._config.platforms.get_instance(instance_name)
+            try:
+                driver.restore(instance, d['snapshot'])
+            except runner.ErrorReturnCode as e:
+                util.sysexit(e.exit_code)
+
+        with self._config.state.transaction():
+            self._config.state.change_state('converged', True)
+            for instance_name in instances.keys():
+                self._config.state.change_instance_state(
+                    instance_name, 'converged', True)
+
+
+@click.command()
+@click.pass_context
+@click.option(
+    '--scenario-name',
+    default='default',
+    help='Name of the scenario to target. (default)')
+def restore(ctx, scenario_name):  # pragma: no cover
+    """ Restore instances from their post-converge snapshots. """
+    args = ctx.obj.get('args')
+    command_args = {
+        'subcommand': __name__,
+        'scenario_name': scenario_name,
+    }
+
+    for c in base.get_configs(args, command_args):
+        Restore(c).execute()
@@ -20,9 +20,9 @@
 
 import click
 
-import molecule.command
 from molecule import config
 from molecule import logger
+from molecule import platforms
 from molecule.command import base
 
 LOG = logger.get_logger(__name__)
@@ -46,6 +46,22 @@ class Test(base.Base):
 
         >>> molecule converge --driver-name foo
 
+        Terminating the idempotence playbook as soon as a task reports a
+        change:
+
+        >>> molecule test --abort-on-change
+
+        Executing up to four scenarios concurrently, letting the remaining
+        scenarios finish when one fails:
+
+        >>> molecule test --parallel 4 --keep-going
+
+        Reusing the instances of a previous run, unless their definition
+        changed or they are older than an hour, and keeping them for the next
+        run rather than destroying them:
+
+        >>> molecule test --reuse-instances --instance-ttl 3600
+
         Executing with `debug`:
 
         >>> molecule --debug test
@@ -61,17 +77,53 @@ class Test(base.Base):
     '--driver-name',
     type=click.Choice(config.molecule_drivers()),
     help='Name of driver to use. (docker)')
-def test(ctx, scenario_name, driver_name):  # pragma: no cover
+@click.option(
+    '--abort-on-change',
+    is_flag=True,
+    default=False,
+    help='Terminate the idempotence playbook as soon as a task reports a '
+    'change.')
+@click.option(
+    '--parallel',
+    type=click.IntRange(min=1),
+    help='Number of scenarios to execute concurrently, each with its output '
+    'prefixed by its name.')
+@click.option(
+    '--fail-fast/--keep-going',
+    default=True,
+    help='Terminate the running scenarios when one fails, or let the '
+    'remaining scenarios finish. (fail-fast)')
+@click.option(
+    '--reuse-instances',
+    is_flag=True,
+    default=False,
+    help='Reset the instances of a previous run rather than recreating '
+    'them, and keep them for the next run rather than destroying them.')
+@click.option(
+    '--instance-ttl',
+    type=click.IntRange(min=0),
+    default=platforms.INSTANCE_TTL,
+    help='Seconds after which reused instances are recreated. ({})'.format(
+        platforms.INSTANCE_TTL))
+def test(ctx, scenario_name, driver_name, abort_on_change, parallel,
+         fail_fast, reuse_instances, instance_ttl):  # pragma: no cover
     """ Test (destroy, create, converge, lint, verify, destroy). """
     args = ctx.obj.get('args')
     command_args = {
         'subcommand': __name__,
         'scenario_name': scenario_name,
         'driver_name': driver_name,
+        'abort_on_change': abort_on_change,
+        'reuse_instances': reuse_instances,
+        'instance_ttl': instance_ttl,
     }
 
-    for c in base.get_configs(args, command_args):
-        for task in c.scenario.test_sequence:
-            command_module = getattr(molecule.command, task)
-            command = getattr(command_module, task.capitalize())
-            command(c).execute()
+    def execute(c):
+        base.execute_sequence(c, c.scenario.test_sequence)
+        c.timings.print_summary()
+
+    base.execute_scenarios(
+        base.get_configs(args, command_args),
+        execute,
+        processes=parallel,
+        keep_going=not fail_fast)
@@ -40,6 +40,10 @@ class Verify(base.Base):
 
         >>> molecule verify --scenario-name foo
 
+        Targeting all scenarios, executing up to four concurrently:
+
+        >>> molecule verify --parallel 4
+
         Executing with `debug`:
 
         >>> molecule --debug verify
@@ -58,16 +62,33 @@ class Verify(base.Base):
 @click.pass_context
 @click.option(
     '--scenario-name',
-    default='default',
-    help='Name of the scenario to target. (default)')
-def verify(ctx, scenario_name):  # pragma: no cover
+    help='Name of the scenario to target. (default, or all scenarios when '
+    'executing in parallel)')
+@click.option(
+    '--parallel',
+    type=click.IntRange(min=1),
+    help='Number of scenarios to execute concurrently, each with its output '
+    'prefixed by its name.')
+@click.option(
+    '--fail-fast/--keep-going',
+    default=True,
+    help='Terminate the running scenarios when one fails, or let the '
+    'remaining scenarios finish. (fail-fast)')
+def verify(ctx, scenario_name, parallel, fail_fast):  # pragma: no cover
     """ Run automated tests against instances. """
     args = ctx.obj.get('args')
-
+    if scenario_name is None and parallel is None:
+        scenario_name = 'default'
     command_args = {
         'subcommand': __name__,
         'scenario_name': scenario_name,
     }
 
-    for c in base.get_configs(args, command_args):
+    def execute(c):
         Verify(c).execute()
+
+    base.execute_scenarios(
+        base.get_configs(args, command_args),
+        execute,
+        processes=parallel,
+        keep_going=not fail_fast)
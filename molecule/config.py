@@ -18,15 +18,19 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import functools
 import os
+import threading
 
 import anyconfig
 
+from molecule import config_cache
 from molecule import interpolation
 from molecule import logger
 from molecule import platforms
 from molecule import scenario
 from molecule import state
+from molecule import timings
 from molecule import util
 from molecule.dependency import ansible_galaxy
 from molecule.dependency import gilt
@@ -49,6 +53,25 @@ MOLECULE_FILE = 'molecule.yml'
 MERGE_STRATEGY = anyconfig.MS_DICTS
 
 
+def cache(func):
+    """
+    Memoize the decorated :class:`.Config` method on the config instance, so
+    each component of the object graph is built once per config, even when
+    steps of a sequence execute concurrently.  Entries are dropped through
+    :func:`.Config.invalidate`.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self):
+        with self._cache_lock:
+            if func.__name__ not in self._cache:
+                self._cache[func.__name__] = func(self)
+
+            return self._cache[func.__name__]
+
+    return wrapper
+
+
 class Config(object):
     """
     Molecule searches the current directory for `molecule.yml` files by
@@ -61,7 +84,9 @@ class Config(object):
 
     The :class:`.Config` object has instantiated Dependency_, Driver_, Lint_,
     Platforms_, Provisioner_, Verifier_, :class:`.Scenario`, and State_
-    references.
+    references.  Each reference is built on first access and reused for the
+    lifetime of the config.  Changes to the State_ drop the Driver_ reference,
+    since the driver in use is recorded in the state file.
     """
 
     def __init__(self, molecule_file, args={}, command_args={}):
@@ -80,12 +105,15 @@ class Config(object):
         self.args = args
         self.command_args = command_args
         self.config = self._combine()
+        self._cache = {}
+        self._cache_lock = threading.RLock()
 
     @property
     def ephemeral_directory(self):
         return molecule_ephemeral_directory(self.scenario.directory)
 
     @property
+    @cache
     def dependency(self):
         dependency_name = self.config['dependency']['name']
         if dependency_name == 'galaxy':
@@ -96,6 +124,7 @@ class Config(object):
             self._exit_with_invalid_section('dependency', dependency_name)
 
     @property
+    @cache
     def driver(self):
         driver_name = self._get_driver_name()
         driver = None
@@ -142,6 +171,7 @@ class Config(object):
         }
 
     @property
+    @cache
     def lint(self):
         lint_name = self.config['lint']['name']
         if lint_name == 'ansible-lint':
@@ -150,10 +180,12 @@ class Config(object):
             self._exit_with_invalid_section('lint', lint_name)
 
     @property
+    @cache
     def platforms(self):
         return platforms.Platforms(self)
 
     @property
+    @cache
     def provisioner(self):
         provisioner_name = self.config['provisioner']['name']
         if provisioner_name == 'ansible':
@@ -162,14 +194,22 @@ class Config(object):
             self._exit_with_invalid_section('provisioner', provisioner_name)
 
     @property
+    @cache
     def scenario(self):
         return scenario.Scenario(self)
 
     @property
+    @cache
     def state(self):
         return state.State(self)
 
     @property
+    @cache
+    def timings(self):
+        return timings.Timings(self)
+
+    @property
+    @cache
     def verifier(self):
         verifier_name = self.config['verifier']['name']
         if verifier_name == 'testinfra':
@@ -183,6 +223,22 @@ class Config(object):
     def verifiers(self):
         return molecule_verifiers()
 
+    def invalidate(self, *names):
+        """
+        Drop the memoized components with the given names, or every memoized
+        component when no names are given, and returns None.  The components
+        are rebuilt on their next access.
+
+        :param names: An optional list of component names (e.g. `driver`).
+        :return: None
+        """
+        with self._cache_lock:
+            if not names:
+                names = list(self._cache.keys())
+
+            for name in names:
+                self._cache.pop(name, None)
+
     def merge_dicts(self, a, b):
         return merge_dicts(a, b)
 
@@ -211,15 +267,29 @@ class Config(object):
         defaults, interpolate the result with environment variables, and
         returns a new dict.
 
+        The result is stored in the :class:`.ConfigCache`, keyed by the
+        content of the `molecule_file`, the defaults, and the environment
+        variables it references.  A cache hit skips interpolation, parsing and
+        merging entirely.
+
         :return: dict
         """
         i = interpolation.Interpolator(interpolation.TemplateWithDefaults,
                                        os.environ)
 
-        base = self._get_defaults()
         with open(self.molecule_file, 'r') as stream:
-            interpolated_config = i.interpolate(stream.read())
-            base = self.merge_dicts(base, util.safe_load(interpolated_config))
+            content = stream.read()
+
+        base = self._get_defaults()
+        cache = config_cache.ConfigCache()
+        key = cache.key(content, base, i.referenced_variables(content))
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        interpolated_config = i.interpolate(content)
+        base = self.merge_dicts(base, util.safe_load(interpolated_config))
+        cache.set(key, base)
 
         return base
 
@@ -244,6 +314,9 @@ class Config(object):
             'platforms': [],
             'provisioner': {
                 'name': 'ansible',
+                'performance': None,
+                'engine': 'subprocess',
+                'capture_window': 1048576,
                 'config_options': {},
                 'connection_options': {},
                 'options': {},
@@ -259,6 +332,7 @@ class Config(object):
             },
             'scenario': {
                 'name': 'default',
+                'scheduler': 'linear',
                 'check_sequence':
                 ['destroy', 'create', 'converge', 'check', 'destroy'],
                 'converge_sequence': ['create', 'converge'],
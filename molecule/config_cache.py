@@ -0,0 +1,166 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import hashlib
+import json
+import os
+
+from molecule import logger
+from molecule import util
+
+LOG = logger.get_logger(__name__)
+MAX_ENTRIES = 256
+# Entries hold the values of the environment variables the Molecule file
+# references, so only the user may read them.
+DIRECTORY_MODE = 0o700
+FILE_MODE = 0o600
+
+
+class ConfigCache(object):
+    """
+    A class which persists merged Molecule configs to disk, so an unchanged
+    `molecule.yml` is not interpolated, parsed, and merged on every
+    invocation.
+
+    Each entry is a JSON document named after its key.  A key is derived from
+    the content of the Molecule file, the version of the defaults it is merged
+    with, and the values of the environment variables the file references.
+    Reading an entry refreshes its modification time, and the least recently
+    used entries are evicted once the cache holds more than `max_entries`.
+
+    The cache is an optimization only.  Entries which cannot be read or
+    written are treated as misses.
+    """
+
+    def __init__(self, directory=None, max_entries=MAX_ENTRIES):
+        """
+        Initialize a new config cache class and returns None.
+
+        :param directory: An optional string containing the path to the cache
+         directory.
+        :param max_entries: An optional int containing the number of entries
+         to keep.
+        :returns: None
+        """
+        self._directory = directory or util.cache_directory('config')
+        self._max_entries = max_entries
+
+    @property
+    def directory(self):
+        return self._directory
+
+    def key(self, content, defaults, variables):
+        """
+        Build the cache key of a Molecule file and returns a string.
+
+        :param content: A string containing the raw Molecule file.
+        :param defaults: A dict containing the defaults the file is merged
+         with.
+        :param variables: A dict containing the environment variables
+         referenced by the file, and their values.
+        :return: str
+        """
+        d = {
+            'content': _hash(content),
+            'defaults': _hash(_dump(defaults)),
+            'variables': variables,
+        }
+
+        return _hash(_dump(d))
+
+    def get(self, key):
+        """
+        Load the entry with the given key and returns a dict, or None on a
+        miss.
+
+        :param key: A string containing the cache key.
+        :return: dict
+        """
+        path = self._get_path(key)
+        try:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            os.utime(path, None)
+        except (IOError, OSError, ValueError):
+            return
+
+        return data
+
+    def set(self, key, data):
+        """
+        Store the data under the given key and returns None.  Data which does
+        not survive a round trip through JSON unchanged is not cached.
+
+        :param key: A string containing the cache key.
+        :param data: A dict containing the merged config.
+        :return: None
+        """
+        try:
+            content = _dump(data)
+            if json.loads(content) != data:
+                return
+        except (TypeError, ValueError):
+            return
+
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory, DIRECTORY_MODE)
+            os.chmod(self.directory, DIRECTORY_MODE)
+            util.atomic_write(self._get_path(key), content, mode=FILE_MODE)
+            self._evict()
+        except (IOError, OSError):
+            pass
+
+    def _evict(self):
+        """
+        Remove the least recently used entries above the size cap and returns
+        None.
+
+        :return: None
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                path = os.path.join(self.directory, name)
+                try:
+                    entries.append((os.path.getmtime(path), path))
+                except OSError:
+                    pass
+
+        entries.sort()
+        for _, path in entries[:max(0, len(entries) - self._max_entries)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _get_path(self, key):
+        return os.path.join(self.directory, '{}.json'.format(key))
+
+
+def _dump(data):
+    return json.dumps(data, sort_keys=True)
+
+
+def _hash(string):
+    if not isinstance(string, bytes):
+        string = string.encode('utf-8')
+
+    return hashlib.sha256(string).hexdigest()
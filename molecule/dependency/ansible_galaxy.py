@@ -20,11 +20,11 @@
 
 import os
 
-import sh
-
 from molecule import logger
+from molecule import runner
 from molecule import util
 from molecule.dependency import base
+from molecule.dependency import role_cache
 
 LOG = logger.get_logger(__name__)
 
@@ -62,6 +62,16 @@ class AnsibleGalaxy(base.Base):
           env:
             FOO: bar
 
+    Roles are installed once into a cache shared by every scenario, keyed by
+    their entry in the requirements file, and linked into the scenario's
+    roles path.  Requirements missing from the cache are installed
+    concurrently.  When the requirements are those installed last, and their
+    roles are still linked, nothing is installed at all.  Requirements files
+    which include other files or list collections are installed as they are,
+    without the cache.  So are requirements files with an entry which is not
+    pinned, that is without a version, or installed from an scm at a branch
+    rather than a tag or a commit, so it is installed afresh on every run.
+
     .. _`Ansible Galaxy`: http://docs.ansible.com/ansible/galaxy.html
     """
 
@@ -108,7 +118,7 @@ class AnsibleGalaxy(base.Base):
         options = self.options
         verbose_flag = util.verbose_flag(options)
 
-        self._ansible_galaxy_command = sh.ansible_galaxy.bake(
+        self._ansible_galaxy_command = runner.command('ansible-galaxy').bake(
             'install',
             options,
             *verbose_flag,
@@ -130,26 +140,78 @@ class AnsibleGalaxy(base.Base):
             LOG.warn('Skipping, missing the requirements file.')
             return
 
+        self._setup()
+        requirements = self._get_requirements()
+        if requirements is not None:
+            self._install_from_cache(requirements)
+            return
+
         if self._ansible_galaxy_command is None:
             self.bake()
 
-        self._setup()
         try:
             util.run_command(
                 self._ansible_galaxy_command,
                 debug=self._config.args.get('debug'))
             LOG.success('Dependency completed successfully.')
-        except sh.ErrorReturnCode as e:
+        except runner.ErrorReturnCode as e:
             util.sysexit(e.exit_code)
 
+    def _install_from_cache(self, requirements):
+        """
+        Install the given requirements through the role cache, unless they
+        are those installed last, and returns None.
+
+        :param requirements: A list of the entries of the requirements file.
+        :return: None
+        """
+        cache = role_cache.RoleCache()
+        roles_path = self._get_roles_path()
+        if cache.is_installed(requirements, roles_path):
+            LOG.warn('Skipping, requirements unchanged since the last '
+                     'install.')
+            return
+
+        options = self.options
+        del options['role-file']
+        del options['roles-path']
+        verbose_flag = util.verbose_flag(options)
+        cmd = runner.command('ansible-galaxy').bake(
+            'install',
+            options,
+            *verbose_flag,
+            _env=self.env,
+            _out=LOG.out,
+            _err=LOG.error)
+        cache.install(requirements, roles_path, cmd)
+        LOG.success('Dependency completed successfully.')
+
+    def _get_requirements(self):
+        """
+        Parse the requirements file and returns a list of its entries, or
+        None when the role cache cannot install them.
+
+        :return: list
+        """
+        try:
+            requirements = util.safe_load_file(self.options['role-file'])
+        except (IOError, OSError):
+            return
+
+        if role_cache.cacheable(requirements):
+            return requirements
+
+    def _get_roles_path(self):
+        return os.path.join(self._config.scenario.directory,
+                            self.options['roles-path'])
+
     def _setup(self):
         """
         Prepare the system for using `ansible-galaxy` and returns None.
 
         :return: None
         """
-        role_directory = os.path.join(self._config.scenario.directory,
-                                      self.options['roles-path'])
+        role_directory = self._get_roles_path()
         if not os.path.isdir(role_directory):
             os.makedirs(role_directory)
 
@@ -53,6 +53,15 @@ class Base(object):
     def enabled(self):
         return self._config.config['dependency']['enabled']
 
+    @property
+    def safe_files(self):
+        """
+        Files of the ephemeral directory to be preserved and returns a list.
+
+        :returns: list
+        """
+        return []
+
     @property
     def options(self):
         return self._config.merge_dicts(
@@ -0,0 +1,276 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import contextlib
+import fcntl
+import glob
+import os
+import shutil
+import tempfile
+
+from molecule import fingerprint
+from molecule import logger
+from molecule import runner
+from molecule import util
+
+LOG = logger.get_logger(__name__)
+
+
+class CloneCache(object):
+    """
+    A cache of the repositories `Gilt`_ overlays, shared by every scenario.
+
+    Each repository is cloned once, as a mirror, and fetched again only when
+    it lacks a version.  Every version overlaid is checked out once, in a
+    directory named after the hash of the repository and the version, whose
+    files are hard linked into the overlays.  Versions are expected to be
+    pinned, since a branch is checked out once, at the commit it pointed to
+    at the time.
+
+    .. _`Gilt`: http://gilt.readthedocs.io
+    """
+
+    def __init__(self, directory=None):
+        """
+        Initialize a new clone cache class and returns None.
+
+        :param directory: An optional string containing the path to the cache
+         directory.
+        :returns: None
+        """
+        self._directory = directory or util.cache_directory('gilt')
+        self._git = None
+
+    @property
+    def directory(self):
+        return self._directory
+
+    @property
+    def git(self):
+        if self._git is None:
+            self._git = runner.command('git')
+
+        return self._git
+
+    def key(self, *args):
+        """
+        Build the cache key of a repository, or of one of its versions, and
+        returns a string.
+
+        :param args: A list of strings containing the repository, and the
+         version.
+        :return: str
+        """
+        f = fingerprint.Fingerprint()
+        for arg in args:
+            f.update(arg)
+
+        return f.hexdigest()
+
+    def checkout(self, repository, version):
+        """
+        Check out the given version of the repository, unless it is cached,
+        and returns the path to the checkout.
+
+        :param repository: A string containing the URL of the repository.
+        :param version: A string containing the branch, tag or commit.
+        :return: str
+        """
+        name = '{}@{}'.format(repository, version)
+        path = os.path.join(self.directory, 'checkouts',
+                            self.key(repository, version))
+        with self._lock(self.key(repository)):
+            if os.path.isdir(path):
+                msg = 'Using cached checkout: [{}]'.format(name)
+                LOG.info(msg)
+                return path
+
+            msg = 'Checking out: [{}]'.format(name)
+            LOG.info(msg)
+            mirror = self._mirror(repository, version)
+            directory = tempfile.mkdtemp(
+                prefix='.checkout-', dir=os.path.dirname(path))
+            try:
+                self._run('clone', '--quiet', '--shared', '--no-checkout',
+                          mirror, directory)
+                self._run('checkout', '--quiet', version, _cwd=directory)
+                shutil.rmtree(os.path.join(directory, '.git'))
+                os.rename(directory, path)
+            finally:
+                shutil.rmtree(directory, ignore_errors=True)
+
+        return path
+
+    def overlay(self, overlay):
+        """
+        Materialize the given overlay of a Gilt config from the checkout of
+        its version, and returns None.  Destinations are relative to the
+        working directory, as they are for Gilt.  As with Gilt, a file is
+        copied into its destination when the destination is a directory, or
+        ends with a slash, or the source is a glob, otherwise it is copied to
+        the destination.
+
+        :param overlay: A dict containing an entry of the Gilt config.
+        :return: None
+        """
+        checkout = self.checkout(overlay['git'], overlay['version'])
+        if overlay.get('dst'):
+            _link_tree(checkout, os.path.abspath(overlay['dst']))
+
+        for f in overlay.get('files', []):
+            destination = os.path.abspath(f['dst'])
+            into = (glob.has_magic(f['src']) or f['dst'].endswith('/')
+                    or os.path.isdir(destination))
+            for source in sorted(glob.glob(os.path.join(checkout, f['src']))):
+                if os.path.isdir(source):
+                    _link_tree(source, destination)
+                    continue
+                filename = destination
+                if into:
+                    filename = os.path.join(destination,
+                                            os.path.basename(source))
+                if os.path.lexists(filename):
+                    os.remove(filename)
+                util.link_or_copy(source, filename)
+
+    def _mirror(self, repository, version):
+        """
+        Clone a mirror of the repository, or fetch it when it lacks the given
+        version, and returns the path to the mirror.
+
+        :return: str
+        """
+        path = os.path.join(self.directory, 'repositories',
+                            self.key(repository))
+        if not os.path.isdir(path):
+            directory = tempfile.mkdtemp(
+                prefix='.mirror-', dir=os.path.dirname(path))
+            try:
+                self._run('clone', '--quiet', '--mirror', repository,
+                          directory)
+                os.rename(directory, path)
+            finally:
+                shutil.rmtree(directory, ignore_errors=True)
+        elif not self._has_version(path, version):
+            self._run('fetch', '--quiet', '--prune', _cwd=path)
+
+        return path
+
+    def _has_version(self, mirror, version):
+        try:
+            self._run(
+                'rev-parse',
+                '--verify',
+                '--quiet',
+                '{}^{{commit}}'.format(version),
+                _cwd=mirror)
+        except runner.ErrorReturnCode:
+            return False
+
+        return True
+
+    def _run(self, *args, **kwargs):
+        return self.git.bake(
+            *args, _out=None, _err=None, _tty_out=False, **kwargs)()
+
+    @contextlib.contextmanager
+    def _lock(self, key):
+        """
+        Hold an exclusive lock on the given repository while the block
+        executes, so concurrent Molecule processes clone and check it out
+        once, and returns None.
+
+        :return: None
+        """
+        for name in ['repositories', 'checkouts']:
+            util.makedirs(os.path.join(self.directory, name))
+        path = os.path.join(self.directory, '{}.lock'.format(key))
+        with open(path, 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def cacheable(overlays):
+    """
+    Determine whether the given content of a Gilt config is a list of
+    overlays the cache can materialize, rather than overlays with post
+    commands, and returns a bool.
+
+    :param overlays: The parsed content of a Gilt config.
+    :return: bool
+    """
+    if not isinstance(overlays, list):
+        return False
+
+    return all(
+        isinstance(o, dict) and 'git' in o and 'version' in o and
+        'post_commands' not in o and not any('post_commands' in f
+                                             for f in o.get('files', [])) and
+        (o.get('dst') or o.get('files')) for o in overlays)
+
+
+def destinations(overlays):
+    """
+    List the absolute paths the given overlays materialize into and returns
+    a list.
+
+    :param overlays: A list of the entries of a Gilt config.
+    :return: list
+    """
+    paths = []
+    for o in overlays:
+        if o.get('dst'):
+            paths.append(os.path.abspath(o['dst']))
+        paths.extend(os.path.abspath(f['dst']) for f in o.get('files', []))
+
+    return paths
+
+
+def _link_tree(source, destination):
+    """
+    Replace the destination with a tree of hard links to the files of the
+    source and returns None.
+
+    :return: None
+    """
+    if os.path.islink(destination) or os.path.isfile(destination):
+        os.remove(destination)
+    elif os.path.isdir(destination):
+        shutil.rmtree(destination)
+
+    os.makedirs(destination)
+    for root, dirs, files in os.walk(source):
+        for name in dirs:
+            path = os.path.join(destination,
+                                os.path.relpath(
+                                    os.path.join(root, name), source))
+            if not os.path.isdir(path):
+                os.makedirs(path)
+        for name in files:
+            filename = os.path.join(root, name)
+            target = os.path.join(destination,
+                                  os.path.relpath(filename, source))
+            if os.path.islink(filename):
+                os.symlink(os.readlink(filename), target)
+            else:
+                util.link_or_copy(filename, target)
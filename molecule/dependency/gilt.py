@@ -20,14 +20,17 @@
 
 import os
 
-import sh
-
+from molecule import fingerprint
 from molecule import logger
+from molecule import runner
 from molecule import util
 from molecule.dependency import base
+from molecule.dependency import clone_cache
 
 LOG = logger.get_logger(__name__)
 
+MODES = ['overlay', 'cache']
+
 
 class Gilt(base.Base):
     """
@@ -61,6 +64,20 @@ class Gilt(base.Base):
           env:
             FOO: bar
 
+    The `cache` mode materializes the overlays without `gilt`.  Molecule
+    clones each repository once, into a cache shared by every scenario,
+    checks out each version once, and hard links the files of the checkout
+    into the overlays.  The overlays are only materialized again when
+    `gilt.yml` changed, or they were removed.  Versions are expected to be
+    pinned, since a branch is checked out once.  Configs with
+    `post_commands` are overlaid by `gilt`.
+
+    .. code-block:: yaml
+
+        dependency:
+          name: gilt
+          mode: cache
+
     .. _`Gilt`: http://gilt.readthedocs.io
     """
 
@@ -82,6 +99,26 @@ class Gilt(base.Base):
 
         return d
 
+    @property
+    def mode(self):
+        """
+        How overlays are materialized and returns a string.
+
+        :return: str
+        """
+        mode = self._config.config['dependency'].get('mode', 'overlay')
+        if mode not in MODES:
+            msg = ("Invalid gilt mode '{}'.  Valid modes are: "
+                   '{}.').format(mode, ', '.join("'{}'".format(m)
+                                                 for m in MODES))
+            util.sysexit_with_message(msg)
+
+        return mode
+
+    @property
+    def safe_files(self):
+        return [self._get_fingerprint_file()]
+
     @property
     def default_env(self):
         """
@@ -98,7 +135,7 @@ class Gilt(base.Base):
 
         :return: None
         """
-        self._gilt_command = sh.gilt.bake(
+        self._gilt_command = runner.command('gilt').bake(
             self.options,
             'overlay',
             _env=self.env,
@@ -119,6 +156,12 @@ class Gilt(base.Base):
             LOG.warn('Skipping, missing the requirements file.')
             return
 
+        if self.mode == 'cache':
+            overlays = util.safe_load_file(self.options['config'])
+            if clone_cache.cacheable(overlays):
+                self._overlay_from_cache(overlays)
+                return
+
         if self._gilt_command is None:
             self.bake()
 
@@ -126,9 +169,54 @@ class Gilt(base.Base):
             util.run_command(
                 self._gilt_command, debug=self._config.args.get('debug'))
             LOG.success('Dependency completed successfully.')
-        except sh.ErrorReturnCode as e:
+        except runner.ErrorReturnCode as e:
             util.sysexit(e.exit_code)
 
+    def _overlay_from_cache(self, overlays):
+        """
+        Materialize the given overlays from the clone cache, unless the Gilt
+        config is unchanged since they were last materialized, record the
+        fingerprint of the config, and returns None.
+
+        :param overlays: A list of the entries of the Gilt config.
+        :return: None
+        """
+        f = fingerprint.Fingerprint()
+        f.update(os.getcwd())
+        f.add_file(self.options['config'], 'gilt.yml')
+        config_fingerprint = f.hexdigest()
+        fingerprint_file = self._get_fingerprint_file()
+        if (self._read_fingerprint() == config_fingerprint and all(
+                os.path.exists(d)
+                for d in clone_cache.destinations(overlays))):
+            LOG.warn('Skipping, overlays unchanged since the last '
+                     'dependency.')
+            return
+
+        cache = clone_cache.CloneCache()
+        try:
+            for overlay in overlays:
+                cache.overlay(overlay)
+        except runner.ErrorReturnCode as e:
+            util.sysexit(e.exit_code)
+        except runner.CommandNotFound:
+            util.sysexit_with_message(
+                "Unable to materialize the overlays, 'git' not found.")
+
+        util.atomic_write(fingerprint_file, config_fingerprint)
+        LOG.success('Dependency completed successfully.')
+
+    def _read_fingerprint(self):
+        try:
+            with open(self._get_fingerprint_file(), 'r') as f:
+                return f.read()
+        except (IOError, OSError):
+            return
+
+    def _get_fingerprint_file(self):
+        return os.path.join(self._config.ephemeral_directory,
+                            'gilt.fingerprint')
+
     def _has_requirements_file(self):
         config_file = self.options.get('config')
 
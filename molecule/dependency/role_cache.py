@@ -0,0 +1,284 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import contextlib
+import fcntl
+import json
+import multiprocessing.pool
+import os
+import re
+import shutil
+import tempfile
+
+from molecule import fingerprint
+from molecule import logger
+from molecule import runner
+from molecule import util
+
+LOG = logger.get_logger(__name__)
+
+WORKERS = 8
+MARKER = '.molecule_requirements'
+# The versions of scm requirements which cannot move, that is tags named
+# after a version and commits.
+PINNED_VERSION = re.compile(r'^(v?\d[\w.+-]*|[0-9a-f]{7,40})$')
+
+
+class RoleCache(object):
+    """
+    A cache of the roles `ansible-galaxy` installs, shared by every scenario.
+
+    Each requirement is installed once, in a directory of the cache named
+    after the hash of the requirement's entry, that is its source, version,
+    scm and name.  The roles it installs, including the roles it depends
+    on, are then linked into the roles path of each scenario.  Entries are
+    never refreshed, so only pinned requirements are cacheable.
+    """
+
+    def __init__(self, directory=None):
+        """
+        Initialize a new role cache class and returns None.
+
+        :param directory: An optional string containing the path to the cache
+         directory.
+        :returns: None
+        """
+        self._directory = directory or util.cache_directory('roles')
+
+    @property
+    def directory(self):
+        return self._directory
+
+    def key(self, requirement):
+        """
+        Build the cache key of a requirement and returns a string.
+
+        :param requirement: A string or a dict containing an entry of the
+         requirements file.
+        :return: str
+        """
+        f = fingerprint.Fingerprint()
+        f.update(json.dumps(requirement, sort_keys=True))
+
+        return f.hexdigest()
+
+    def install(self, requirements, roles_path, command):
+        """
+        Install the given requirements into the given roles path, from the
+        cache, and returns None.  Missing requirements are installed into the
+        cache with the given command, up to :data:`WORKERS` at a time.
+
+        :param requirements: A list of the entries of the requirements file.
+        :param roles_path: A string containing the path to link the roles
+         into.
+        :param command: A `runner.Command` of `ansible-galaxy install`, to be
+         baked with the role file and the roles path.
+        :return: None
+        """
+        keys = [self.key(r) for r in requirements]
+        pool = multiprocessing.pool.ThreadPool(
+            max(1, min(WORKERS, len(requirements))))
+        try:
+            errors = pool.map(
+                lambda args: self._try_fetch(*args),
+                [(k, r, command) for k, r in zip(keys, requirements)])
+        finally:
+            pool.close()
+            pool.join()
+
+        for e in errors:
+            if e is not None:
+                util.sysexit(e.exit_code)
+
+        self._link(keys, roles_path)
+
+    def is_installed(self, requirements, roles_path):
+        """
+        Determine whether the given requirements were the last ones installed
+        into the given roles path, and their roles are still there, and
+        returns a bool.
+
+        :param requirements: A list of the entries of the requirements file.
+        :param roles_path: A string containing the path of the roles.
+        :return: bool
+        """
+        try:
+            with open(os.path.join(roles_path, MARKER), 'r') as f:
+                links = json.load(f)
+        except (IOError, OSError, ValueError):
+            return False
+
+        keys = [self.key(r) for r in requirements]
+        if links.get('keys') != keys:
+            return False
+
+        return all(
+            os.path.realpath(
+                os.path.join(roles_path, name)) == os.path.realpath(target)
+            for name, target in links.get('roles', {}).items())
+
+    def _try_fetch(self, key, requirement, command):
+        try:
+            self._fetch(key, requirement, command)
+        except runner.ErrorReturnCode as e:
+            return e
+
+    def _fetch(self, key, requirement, command):
+        """
+        Install the given requirement into the cache, unless it is there, and
+        returns None.
+
+        :return: None
+        """
+        path = self._get_path(key)
+        with self._lock(key):
+            if os.path.isdir(path):
+                return
+
+            directory = tempfile.mkdtemp(
+                prefix='.{}-'.format(key), dir=self.directory)
+            try:
+                role_file = os.path.join(directory, 'requirements.yml')
+                roles_path = os.path.join(directory, 'roles')
+                util.write_file(role_file, util.safe_dump([requirement]))
+                cmd = command.bake(
+                    **{'role-file': role_file,
+                       'roles-path': roles_path})
+                util.run_command(cmd)
+                if os.path.isdir(roles_path):
+                    os.rename(roles_path, path)
+            finally:
+                shutil.rmtree(directory, ignore_errors=True)
+
+    def _link(self, keys, roles_path):
+        """
+        Link the roles of the given keys into the given roles path, replacing
+        the roles there and unlinking the cached roles no longer required,
+        record what was linked, and returns None.
+
+        :return: None
+        """
+        roles = {}
+        for key in keys:
+            path = self._get_path(key)
+            if not os.path.isdir(path):
+                continue
+            for name in sorted(os.listdir(path)):
+                roles[name] = os.path.join(path, name)
+
+        if not os.path.isdir(roles_path):
+            os.makedirs(roles_path)
+        directory = os.path.realpath(self.directory)
+        for name in os.listdir(roles_path):
+            link = os.path.join(roles_path, name)
+            if name not in roles and os.path.islink(link) and os.path.realpath(
+                    link).startswith(directory + os.sep):
+                os.remove(link)
+
+        for name, target in roles.items():
+            link = os.path.join(roles_path, name)
+            if os.path.islink(link) or os.path.isfile(link):
+                os.remove(link)
+            elif os.path.isdir(link):
+                shutil.rmtree(link)
+            os.symlink(target, link)
+
+        util.atomic_write(
+            os.path.join(roles_path, MARKER),
+            json.dumps(
+                {
+                    'keys': keys,
+                    'roles': roles
+                }, sort_keys=True))
+
+    def _get_path(self, key):
+        return os.path.join(self.directory, key)
+
+    @contextlib.contextmanager
+    def _lock(self, key):
+        """
+        Hold an exclusive lock on the given key while the block executes, so
+        concurrent Molecule processes install a requirement once, and returns
+        None.
+
+        :return: None
+        """
+        util.makedirs(self.directory)
+        path = os.path.join(self.directory, '{}.lock'.format(key))
+        with open(path, 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def cacheable(requirements):
+    """
+    Determine whether the given content of a requirements file is a list of
+    pinned roles the cache can install one by one, rather than including
+    other files or listing collections, and returns a bool.
+
+    :param requirements: The parsed content of a requirements file.
+    :return: bool
+    """
+    if not isinstance(requirements, list):
+        return False
+
+    for r in requirements:
+        if isinstance(r, dict):
+            if 'src' not in r or 'include' in r:
+                return False
+        elif not isinstance(r, (str, type(u''))):
+            return False
+        if not pinned(r):
+            return False
+
+    return True
+
+
+def pinned(requirement):
+    """
+    Determine whether the given requirement always installs the same role,
+    that is it has a version, and the version of a requirement installed
+    from an scm is a tag or a commit rather than a branch, and returns a
+    bool.
+
+    :param requirement: A string or a dict containing an entry of the
+     requirements file.
+    :return: bool
+    """
+    if isinstance(requirement, dict):
+        src = requirement['src']
+        version = requirement.get('version')
+        scm = requirement.get('scm')
+    else:
+        parts = requirement.split(',')
+        src = parts[0]
+        version = parts[1] if len(parts) > 1 else None
+        scm = None
+
+    if version is None or not str(version).strip():
+        return False
+    if scm or '://' in src or src.startswith('git+') or '@' in src:
+        return bool(PINNED_VERSION.match(str(version).strip()))
+
+    # Galaxy versions are releases, which do not move.
+    return True
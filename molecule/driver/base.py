@@ -22,6 +22,7 @@ import abc
 import os
 
 from molecule import status
+from molecule import util
 
 Status = status.get_status()
 
@@ -37,6 +38,8 @@ class Base(object):
         :returns: None
         """
         self._config = config
+        self._instance_config_index = None
+        self._instance_config_stamp = None
 
     @property
     @abc.abstractmethod
@@ -114,6 +117,132 @@ class Base(object):
     def options(self):
         return self._config.config['driver']['options']
 
+    @property
+    def supports_reconcile(self):
+        """
+        Whether the driver's setup and teardown playbooks manage exactly the
+        instances in `molecule_yml.platforms`, so they can be limited to a
+        subset of the platforms, and returns a bool.
+
+        Drivers whose playbooks rewrite the instance config wholesale do not.
+
+        :returns: bool
+        """
+        return False
+
+    @property
+    def reset_recreates(self):
+        """
+        Whether a reused instance is reset by recreating it, which the driver
+        does cheaply from the image it cached, rather than kept as it is, and
+        returns a bool.
+
+        :returns: bool
+        """
+        return False
+
+    @property
+    def native_lifecycle(self):
+        """
+        Whether the driver creates and destroys the instances itself, rather
+        than through the setup and teardown playbooks, and returns a bool.
+
+        :returns: bool
+        """
+        return False
+
+    def create_instances(self, platforms):
+        """
+        Create the instances of the given platforms and returns None.  Only
+        drivers with a native lifecycle create instances themselves.
+
+        :param platforms: A list of platforms.
+        :returns: None
+        """
+        self._exit_unsupported('create instances natively')
+
+    def destroy_instances(self, platforms):
+        """
+        Destroy the instances of the given platforms and returns None.  Only
+        drivers with a native lifecycle destroy instances themselves.
+
+        :param platforms: A list of platforms.
+        :returns: None
+        """
+        self._exit_unsupported('destroy instances natively')
+
+    @property
+    def supports_snapshot(self):
+        """
+        Whether the driver snapshots the instances after every successful
+        converge, and can restore them from their snapshots, and returns a
+        bool.
+
+        :returns: bool
+        """
+        return False
+
+    def snapshot(self, instance_name):
+        """
+        Snapshot the given converged instance and returns the id of the
+        snapshot.  Only drivers supporting snapshots snapshot instances.
+
+        :param instance_name: A string containing the instance to snapshot.
+        :returns: str
+        """
+        self._exit_unsupported('snapshot instances')
+
+    def restore(self, instance, snapshot):
+        """
+        Replace the given instance with one restored from the given snapshot
+        and returns None.  Only drivers supporting snapshots restore
+        instances.
+
+        :param instance: An Instance.
+        :param snapshot: A string containing the id of the snapshot.
+        :returns: None
+        """
+        self._exit_unsupported('restore instances')
+
+    def remove_snapshot(self, snapshot):
+        """
+        Remove the given snapshot and returns None.  Drivers without
+        snapshots have none to remove.
+
+        :param snapshot: A string containing the id of the snapshot.
+        :returns: None
+        """
+        pass
+
+    def prepare_platforms(self, platforms):
+        """
+        Prepare what the instances of the given platforms are created from,
+        before the setup playbook runs, and returns None.
+
+        :param platforms: A list of platforms.
+        :returns: None
+        """
+        pass
+
+    def definition_files(self, platform):
+        """
+        Files the instance of the given platform is built from, whose changes
+        make the instance stale, and returns a list.
+
+        :param platform: A dict containing the platform definition.
+        :returns: list
+        """
+        return []
+
+    @property
+    def ssh_connection(self):
+        """
+        Whether Ansible connects to the instances over SSH and returns a bool.
+
+        :returns: bool
+        """
+        return True
+
     @property
     def instance_config(self):
         return os.path.join(self._config.ephemeral_directory,
@@ -134,8 +263,8 @@ class Base(object):
         :returns: list
         """
         status_list = []
-        for platform in self._config.platforms.instances_with_scenario_name:
-            instance_name = platform['name']
+        for instance in self._config.platforms.instance_models:
+            instance_name = instance.name
             driver_name = self.name.capitalize()
             provisioner_name = self._config.provisioner.name.capitalize()
             scenario_name = self._config.scenario.name
@@ -151,6 +280,37 @@ class Base(object):
 
         return status_list
 
+    def _get_instance_config(self, instance_name):
+        """
+        Look up the given instance in the instance config and returns a dict.
+
+        :param instance_name: A string containing the instance to look up.
+        :returns: dict
+        :raises: KeyError when the instance is not in the instance config, and
+         IOError when the instance config does not exist.
+        """
+        return self._get_instance_config_index()[instance_name]
+
+    def _get_instance_config_index(self):
+        """
+        Index the instance config by instance name and returns a dict.
+
+        The inventory looks up every platform once per group, so the instance
+        config is parsed once and reused until the file changes on disk.
+
+        :returns: dict
+        """
+        stamp = util.file_stamp(self.instance_config)
+        if stamp is None or stamp != self._instance_config_stamp:
+            instance_config_list = util.safe_load_file(self.instance_config)
+            self._instance_config_index = {
+                item['instance']: item
+                for item in instance_config_list or []
+            }
+            self._instance_config_stamp = stamp
+
+        return self._instance_config_index
+
     def _get_ssh_connection_options(self):
         return [
             '-o UserKnownHostsFile=/dev/null',
@@ -159,3 +319,7 @@ class Base(object):
             '-o IdentitiesOnly=yes',
             '-o StrictHostKeyChecking=no',
         ]
+
+    def _exit_unsupported(self, action):
+        msg = "The '{}' driver does not {}.".format(self.name, action)
+        util.sysexit_with_message(msg)
@@ -0,0 +1,284 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import json
+import os
+import socket
+
+try:
+    import http.client as httplib
+    from urllib.parse import quote
+    from urllib.parse import urlencode
+except ImportError:  # pragma: no cover
+    import httplib
+    from urllib import quote
+    from urllib import urlencode
+
+DEFAULT_HOST = 'unix:///var/run/docker.sock'
+TIMEOUT = 300
+
+
+class DockerAPIError(Exception):
+    """
+    Exception class raised when the Docker daemon rejects a request.
+    """
+
+    def __init__(self, status, message):
+        super(DockerAPIError, self).__init__(message)
+        self.status = status
+        self.message = message
+
+
+class UnixHTTPConnection(httplib.HTTPConnection):
+    """
+    An HTTP connection over a Unix domain socket.
+    """
+
+    def __init__(self, path, timeout=TIMEOUT):
+        httplib.HTTPConnection.__init__(self, 'localhost', timeout=timeout)
+        self._path = path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self._path)
+        self.sock = sock
+
+
+class Client(object):
+    """
+    A minimal client of the `Docker Engine API`_, covering the image and
+    container operations of the instances' lifecycle.
+
+    Every request is made on a connection of its own, so a client can be
+    shared by threads.
+
+    .. _`Docker Engine API`: https://docs.docker.com/engine/api/
+    """
+
+    def __init__(self, host=None):
+        """
+        Initialize a new client class and returns None.
+
+        :param host: An optional string containing the address of the daemon,
+         either `unix://<path>` or `tcp://<host>:<port>`, which defaults to
+         `DOCKER_HOST`.
+        :returns: None
+        """
+        self._host = host or os.environ.get('DOCKER_HOST') or DEFAULT_HOST
+
+    @property
+    def host(self):
+        return self._host
+
+    def inspect_image(self, name):
+        """
+        Look up the given image and returns a dict, or None when there is no
+        such image.
+
+        :param name: A string containing the image name.
+        :return: dict
+        """
+        return self._inspect('/images/{}/json'.format(quote(name)))
+
+    def pull_image(self, name):
+        """
+        Pull the given image and returns None.
+
+        :param name: A string containing the image name.
+        :return: None
+        """
+        repository, tag = _parse_image(name)
+        _, body = self._request(
+            'POST',
+            '/images/create',
+            params={'fromImage': repository,
+                    'tag': tag})
+        # Pull errors are reported in the progress stream.
+        _raise_for_stream(body)
+
+    def build_image(self, name, context, dockerfile='Dockerfile'):
+        """
+        Build an image tagged with the given name from the given build context
+        and returns None.
+
+        :param name: A string containing the image name.
+        :param context: A bytes containing the build context as a tar
+         archive.
+        :param dockerfile: An optional string containing the path to the
+         Dockerfile within the build context.
+        :return: None
+        """
+        _, body = self._request(
+            'POST',
+            '/build',
+            params={'t': name,
+                    'dockerfile': dockerfile},
+            tarball=context)
+        # Build errors are reported in the progress stream.
+        _raise_for_stream(body)
+
+    def inspect_container(self, name):
+        """
+        Look up the given container and returns a dict, or None when there is
+        no such container.
+
+        :param name: A string containing the container name.
+        :return: dict
+        """
+        return self._inspect('/containers/{}/json'.format(quote(name)))
+
+    def create_container(self, name, config):
+        """
+        Create a container with the given name and config, and returns its id.
+
+        :param name: A string containing the container name.
+        :param config: A dict containing the container config.
+        :return: str
+        """
+        _, body = self._request(
+            'POST', '/containers/create', params={'name': name}, data=config)
+
+        return json.loads(body.decode('utf-8'))['Id']
+
+    def start_container(self, name):
+        """
+        Start the given container, unless it is running, and returns None.
+
+        :param name: A string containing the container name or id.
+        :return: None
+        """
+        self._request('POST', '/containers/{}/start'.format(quote(name)))
+
+    def remove_container(self, name):
+        """
+        Remove the given container and its volumes, stopping it if it runs,
+        and returns None.  A missing container is not an error.
+
+        :param name: A string containing the container name or id.
+        :return: None
+        """
+        try:
+            self._request(
+                'DELETE',
+                '/containers/{}'.format(quote(name)),
+                params={'force': 1,
+                        'v': 1})
+        except DockerAPIError as e:
+            if e.status != 404:
+                raise
+
+    def _inspect(self, path):
+        try:
+            _, body = self._request('GET', path)
+        except DockerAPIError as e:
+            if e.status == 404:
+                return
+            raise
+
+        return json.loads(body.decode('utf-8'))
+
+    def _request(self, method, path, params=None, data=None, tarball=None):
+        """
+        Make a request to the daemon, with either a JSON or a tar archive
+        body, and returns a tuple containing the status and the body of the
+        response.
+
+        :return: tuple
+        :raises: DockerAPIError when the daemon responds with an error.
+        """
+        params = sorted(
+            (k, v) for k, v in (params or {}).items() if v is not None)
+        if params:
+            path = '{}?{}'.format(path, urlencode(params))
+        headers = {}
+        body = None
+        if data is not None:
+            body = json.dumps(data)
+            headers['Content-Type'] = 'application/json'
+        elif tarball is not None:
+            body = tarball
+            headers['Content-Type'] = 'application/x-tar'
+
+        connection = self._get_connection()
+        try:
+            connection.request(method, path, body, headers)
+            response = connection.getresponse()
+            content = response.read()
+        except (socket.error, httplib.HTTPException) as e:
+            msg = 'Unable to reach the Docker daemon at {}: {}'.format(
+                self.host, e)
+            raise DockerAPIError(None, msg)
+        finally:
+            connection.close()
+
+        if response.status >= 400:
+            raise DockerAPIError(response.status, _get_message(content))
+
+        return response.status, content
+
+    def _get_connection(self):
+        if self.host.startswith('unix://'):
+            return UnixHTTPConnection(self.host[len('unix://'):])
+        if self.host.startswith('tcp://'):
+            return httplib.HTTPConnection(
+                self.host[len('tcp://'):], timeout=TIMEOUT)
+
+        msg = 'Unsupported Docker host: {}'.format(self.host)
+        raise DockerAPIError(None, msg)
+
+
+def _parse_image(name):
+    """
+    Split the given image name into its repository and tag, which defaults to
+    `latest`, and returns a tuple.
+
+    :return: tuple
+    """
+    if '@' in name:
+        return name, None
+    repository, _, tag = name.rpartition(':')
+    if not repository or '/' in tag:
+        return name, 'latest'
+
+    return repository, tag
+
+
+def _raise_for_stream(content):
+    """
+    Raise the first error of the given progress stream and returns None.
+
+    :return: None
+    :raises: DockerAPIError when the stream reports an error.
+    """
+    for line in content.splitlines():
+        try:
+            message = json.loads(line.decode('utf-8'))
+        except ValueError:
+            continue
+        if 'error' in message:
+            raise DockerAPIError(500, message['error'])
+
+
+def _get_message(content):
+    try:
+        return json.loads(content.decode('utf-8'))['message']
+    except (ValueError, KeyError, TypeError):
+        return content.decode('utf-8', 'replace').strip()
@@ -18,11 +18,26 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import io
+import multiprocessing.pool
+import os
+import shlex
+import tarfile
+
+from molecule import fingerprint
 from molecule import logger
+from molecule import runner
+from molecule import util
 from molecule.driver import base
+from molecule.driver import docker_api
+from molecule.driver import image_cache
 
 LOG = logger.get_logger(__name__)
 
+SNAPSHOT_REPOSITORY = 'molecule_snapshot'
+LIFECYCLES = ['ansible', 'native']
+LIFECYCLE_WORKERS = 10
+
 
 class Dockr(base.Base):
     """
@@ -38,6 +53,52 @@ class Dockr(base.Base):
 
         $ sudo pip install docker-py
 
+    The images of the platforms are built before the setup playbook runs, and
+    cached by the content they are built from.  Unchanged platforms are not
+    built again, and identical platforms share one image across scenarios.
+    The cache can be disabled.
+
+    .. code-block:: yaml
+
+        driver:
+          name: docker
+          options:
+            image_cache: False
+
+    Unused images are removed from the cache with `molecule prune`.
+
+    Containers can be committed to snapshot images after every successful
+    converge.  `molecule restore` then replaces the containers with ones run
+    from their snapshots, rather than converging them again, for instance
+    after a verify damaged them.  Snapshots taken before the role, the
+    scenario or the platform changed are not restored.
+
+    .. code-block:: yaml
+
+        driver:
+          name: docker
+          options:
+            snapshot: True
+
+    .. code-block:: bash
+
+        $ molecule restore
+
+    Rather than running the setup and teardown playbooks, which create and
+    destroy the containers one by one, Molecule can manage the containers
+    itself, through the Docker API and up to `lifecycle_workers` at a time.
+    Containers are created from the platforms' `image` and `command`, the way
+    the default playbooks create them.  Missing images are built from the
+    platform's Dockerfile, or pulled when it has none.
+
+    .. code-block:: yaml
+
+        driver:
+          name: docker
+          options:
+            lifecycle: native
+            lifecycle_workers: 10
+
     .. _`Docker`: https://www.docker.com
     """
 
@@ -61,6 +122,240 @@ class Dockr(base.Base):
     def safe_files(self):
         return []
 
+    @property
+    def supports_reconcile(self):
+        return True
+
+    @property
+    def reset_recreates(self):
+        return True
+
+    @property
+    def supports_snapshot(self):
+        return bool(self.options.get('snapshot', False))
+
+    @property
+    def native_lifecycle(self):
+        lifecycle = self.options.get('lifecycle', 'ansible')
+        if lifecycle not in LIFECYCLES:
+            msg = ("Invalid docker lifecycle '{}'.  Valid lifecycles are: "
+                   '{}.').format(lifecycle, ', '.join(
+                       "'{}'".format(c) for c in LIFECYCLES))
+            util.sysexit_with_message(msg)
+
+        return lifecycle == 'native'
+
+    def definition_files(self, platform):
+        return [self._get_dockerfile(platform)]
+
+    def prepare_platforms(self, platforms):
+        """
+        Build the images of the given platforms through the image cache, and
+        returns None.  Platforms without a Dockerfile are left to the setup
+        playbook.
+
+        :param platforms: A list of platforms.
+        :returns: None
+        """
+        if not self.options.get('image_cache', True):
+            return
+
+        cache = image_cache.ImageCache()
+        for platform in platforms:
+            dockerfile = self._get_dockerfile(platform)
+            if 'image' not in platform or not os.path.isfile(dockerfile):
+                continue
+            try:
+                cache.build(dockerfile, self._config.scenario.directory,
+                            platform['image'])
+            except runner.CommandNotFound:
+                LOG.warn('Skipping image cache, docker not found.')
+                return
+
+    def create_instances(self, platforms):
+        """
+        Create and start the containers of the given platforms concurrently,
+        and returns None.  Existing containers are started rather than
+        recreated, and missing images are built from the platform's
+        Dockerfile, or pulled when it has none.
+
+        :param platforms: A list of platforms.
+        :returns: None
+        """
+        self._execute_lifecycle('create', self._create_instance, platforms)
+
+    def destroy_instances(self, platforms):
+        """
+        Remove the containers of the given platforms concurrently, and returns
+        None.
+
+        :param platforms: A list of platforms.
+        :returns: None
+        """
+        self._execute_lifecycle('destroy', self._destroy_instance, platforms)
+
+    def snapshot(self, instance_name):
+        """
+        Commit the given container to the scenario's snapshot image of it,
+        and returns the id of the image.
+
+        :param instance_name: A string containing the instance to snapshot.
+        :returns: str
+        """
+        result = self._run_docker('commit', instance_name,
+                                  self._get_snapshot_tag(instance_name))
+
+        return result.stdout.decode('utf-8').strip()
+
+    def restore(self, instance, snapshot):
+        """
+        Replace the container of the given instance with one run from the
+        given snapshot, the way the create playbook runs it, and returns None.
+
+        :param instance: An Instance.
+        :param snapshot: A string containing the id of the snapshot image.
+        :returns: None
+        """
+        try:
+            self._run_docker('rm', '--force', instance.name)
+        except runner.ErrorReturnCode:
+            pass
+
+        args = [
+            'run', '--detach', '--name', instance.name, '--hostname',
+            instance.platform_name, '--log-driver', 'syslog', snapshot
+        ]
+        command = instance.platform.get('command')
+        if command:
+            args.extend(shlex.split(command))
+        self._run_docker(*args)
+
+    def remove_snapshot(self, snapshot):
+        """
+        Remove the given snapshot image, unless a container still uses it,
+        and returns None.
+
+        :param snapshot: A string containing the id of the snapshot image.
+        :returns: None
+        """
+        try:
+            self._run_docker('rmi', snapshot)
+        except runner.ErrorReturnCode:
+            pass
+
+    def _execute_lifecycle(self, action, func, platforms):
+        """
+        Execute the given function with a Docker API client and each of the
+        given platforms, in a bounded pool of threads, and returns None.
+        Every platform is acted on, even when another failed.
+
+        :param action: A string containing the name of the action, used in
+         error messages.
+        :param func: A callable taking a client and a platform.
+        :param platforms: A list of platforms.
+        :returns: None
+        """
+        if not platforms:
+            return
+
+        instance_names = [self._get_instance_name(p) for p in platforms]
+        client = docker_api.Client()
+
+        def execute(platform):
+            try:
+                func(client, platform)
+            except docker_api.DockerAPIError as e:
+                return e.message
+
+        workers = self.options.get('lifecycle_workers', LIFECYCLE_WORKERS)
+        pool = multiprocessing.pool.ThreadPool(min(workers, len(platforms)))
+        try:
+            errors = pool.map(execute, platforms)
+        finally:
+            pool.close()
+            pool.join()
+
+        failed = [(n, e) for n, e in zip(instance_names, errors) if e]
+        if failed:
+            msg = 'Failed to {} instance(s):\n{}'.format(action, '\n'.join(
+                '* [{}] => {}'.format(n, e) for n, e in failed))
+            util.sysexit_with_message(msg)
+
+    def _create_instance(self, client, platform):
+        instance_name = self._get_instance_name(platform)
+        if client.inspect_container(instance_name) is None:
+            image = platform['image']
+            if client.inspect_image(image) is None:
+                dockerfile = self._get_dockerfile(platform)
+                if os.path.isfile(dockerfile):
+                    client.build_image(image,
+                                       self._get_build_context(dockerfile))
+                else:
+                    client.pull_image(image)
+            container = {
+                'Image': image,
+                'Hostname': platform['name'],
+                'HostConfig': {
+                    'LogConfig': {
+                        'Type': 'syslog',
+                        'Config': {}
+                    }
+                },
+            }
+            if platform.get('command'):
+                container['Cmd'] = shlex.split(platform['command'])
+            client.create_container(instance_name, container)
+        client.start_container(instance_name)
+
+    def _destroy_instance(self, client, platform):
+        client.remove_container(self._get_instance_name(platform))
+
+    def _get_instance_name(self, platform):
+        return util.instance_with_scenario_name(platform['name'],
+                                                self._config.scenario.name)
+
+    def _get_snapshot_tag(self, instance_name):
+        f = fingerprint.Fingerprint()
+        f.update(os.path.abspath(self._config.scenario.directory))
+        f.update(instance_name)
+
+        return '{}:{}'.format(SNAPSHOT_REPOSITORY, f.hexdigest()[:16])
+
+    def _run_docker(self, *args):
+        docker = runner.command('docker')
+
+        return docker.bake(*args, _out=None, _err=None, _tty_out=False)()
+
+    def _get_build_context(self, dockerfile):
+        """
+        Archive the Dockerfile along with the files of the scenario directory
+        it references, the build context the setup playbook builds from, and
+        returns a bytes.
+
+        :param dockerfile: A string containing the path to the Dockerfile.
+        :returns: bytes
+        """
+        context = self._config.scenario.directory
+        f = io.BytesIO()
+        with tarfile.open(fileobj=f, mode='w') as tar:
+            tar.add(dockerfile, arcname='Dockerfile')
+            dockerignore = os.path.join(context, '.dockerignore')
+            if os.path.isfile(dockerignore):
+                tar.add(dockerignore, arcname='.dockerignore')
+            for path in image_cache.referenced_files(dockerfile, context):
+                if os.path.isabs(path):
+                    tar.add(path, arcname=os.path.relpath(path, context))
+
+        return f.getvalue()
+
+    def _get_dockerfile(self, platform):
+        return os.path.join(self._config.scenario.directory,
+                            platform.get('dockerfile', 'Dockerfile'))
+
+    @property
+    def ssh_connection(self):
+        return False
+
     def login_options(self, instance_name):
         return {'instance': instance_name}
 
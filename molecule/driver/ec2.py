@@ -21,8 +21,6 @@
 from molecule import logger
 from molecule.driver import base
 
-from molecule import util
-
 LOG = logger.get_logger(__name__)
 
 
@@ -88,16 +86,9 @@ class Ec2(base.Base):
                 'ansible_ssh_extra_args':
                 ' '.join(self._get_ssh_connection_options()),
             }
-        except StopIteration:
+        except KeyError:
             return {}
         except IOError:
             # Instance has yet to be provisioned , therefore the
             # instance_config is not on disk.
             return {}
-
-    def _get_instance_config(self, instance_name):
-        instance_config_dict = util.safe_load_file(
-            self._config.driver.instance_config)
-
-        return next(item for item in instance_config_dict
-                    if item['instance'] == instance_name)
@@ -0,0 +1,390 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import contextlib
+import errno
+import fcntl
+import glob
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from molecule import fingerprint
+from molecule import logger
+from molecule import runner
+from molecule import util
+
+LOG = logger.get_logger(__name__)
+
+REPOSITORY = 'molecule_cache'
+MAX_AGE = 30 * 24 * 60 * 60
+MAX_SIZE = 10 * 1024 * 1024 * 1024
+
+
+class ImageCache(object):
+    """
+    A cache of the images built from the platforms' Dockerfiles, shared by
+    every scenario.
+
+    Images are tagged `molecule_cache:<key>`, where the key is a hash of the
+    Dockerfile, the files of the build context its `COPY` and `ADD`
+    instructions reference, and the platform's image name.  A platform whose
+    key was built before is not built again, and identical platforms of
+    different scenarios share one image.  Images are built from a context
+    holding only the referenced files, rather than the whole scenario
+    directory.
+
+    The cache directory holds an entry per image, whose modification time is
+    the time the image was last used, so unused images can be pruned.  Each
+    image is also tagged with its platform's image name, and pruning removes
+    both tags, so the image itself is removed.
+    """
+
+    def __init__(self, directory=None):
+        """
+        Initialize a new image cache class and returns None.
+
+        :param directory: An optional string containing the path to the cache
+         directory.
+        :returns: None
+        """
+        self._directory = directory or util.cache_directory('images')
+        self._docker = None
+
+    @property
+    def directory(self):
+        return self._directory
+
+    @property
+    def docker(self):
+        if self._docker is None:
+            self._docker = runner.command('docker')
+
+        return self._docker
+
+    def key(self, dockerfile, context, image):
+        """
+        Build the cache key of an image and returns a string.
+
+        :param dockerfile: A string containing the path to the Dockerfile.
+        :param context: A string containing the path to the build context.
+        :param image: A string containing the platform's image name.
+        :return: str
+        """
+        f = fingerprint.Fingerprint()
+        f.update(image)
+        f.add_file(dockerfile, 'Dockerfile')
+        f.add_file(os.path.join(context, '.dockerignore'), '.dockerignore')
+        for path in referenced_files(dockerfile, context):
+            if os.path.isabs(path):
+                f.add_file(path, os.path.relpath(path, context))
+            else:
+                f.update(path)
+
+        return f.hexdigest()
+
+    def tag(self, key):
+        return '{}:{}'.format(REPOSITORY, key)
+
+    def build(self, dockerfile, context, image):
+        """
+        Build the image unless it is cached, tag it with the given image name,
+        and returns the cache key.
+
+        :param dockerfile: A string containing the path to the Dockerfile.
+        :param context: A string containing the path to the build context.
+        :param image: A string containing the platform's image name.
+        :return: str
+        """
+        key = self.key(dockerfile, context, image)
+        tag = self.tag(key)
+        with self._lock(key):
+            size = self._size(tag)
+            if size is None:
+                msg = 'Building image: [{}]'.format(image)
+                LOG.info(msg)
+                self._build(dockerfile, context, tag)
+                size = self._size(tag) or 0
+            else:
+                msg = 'Using cached image: [{}]'.format(image)
+                LOG.info(msg)
+            self._write_entry(key, {'image': image, 'size': size})
+
+        self._run('tag', tag, image)
+
+        return key
+
+    def prune(self, max_age=MAX_AGE, max_size=MAX_SIZE):
+        """
+        Remove the images unused for longer than the given age, then the
+        least recently used images until the images take no more than the
+        given size, and returns a list of the tags of the removed images.
+
+        Images which are being built, or which containers were created from,
+        are in use and kept.
+
+        :param max_age: An optional int containing the age in seconds.
+        :param max_size: An optional int containing the size in bytes.
+        :return: list
+        """
+        now = time.time()
+        entries = sorted(self._entries(), reverse=True)
+        removed = []
+        size = 0
+        for used, key, data in entries:
+            size += data.get('size', 0)
+            if now - used <= max_age and size <= max_size:
+                continue
+            with self._lock(key, blocking=False) as locked:
+                if locked and self._remove(key, data):
+                    removed.append(self.tag(key))
+
+        return removed
+
+    def _remove(self, key, data):
+        """
+        Remove the image of the given key unless it is in use, along with its
+        cache entry, and returns True when the image was removed.
+
+        The platform's tag is removed as well when it still points at the
+        image, since removing only the cache tag frees no space.
+
+        :return: bool
+        """
+        tag = self.tag(key)
+        image_id = self._id(tag)
+        if image_id is not None:
+            if self._run('ps', '--all', '--quiet', '--filter',
+                         'ancestor={}'.format(image_id)).stdout.strip():
+                return False
+
+            tags = [tag]
+            image = data.get('image')
+            if image and self._id(image) == image_id:
+                tags.append(image)
+            msg = 'Removing cached image: [{}]'.format(image or tag)
+            LOG.info(msg)
+            try:
+                self._run('rmi', *tags)
+            except runner.ErrorReturnCode:
+                return False
+
+        for path in [self._get_path(key), self._get_lock_path(key)]:
+            try:
+                os.remove(path)
+            except OSError as e:
+                if e.errno != errno.ENOENT:
+                    raise
+
+        # Images tagged otherwise outside of the cache are left in place.
+        return image_id is not None and self._id(image_id) is None
+
+    def _build(self, dockerfile, context, tag):
+        """
+        Build the image from a copy of the context holding only the files the
+        Dockerfile references, and returns None.
+
+        :return: None
+        """
+        directory = tempfile.mkdtemp(prefix='molecule-build-')
+        try:
+            shutil.copy2(dockerfile, os.path.join(directory, 'Dockerfile'))
+            dockerignore = os.path.join(context, '.dockerignore')
+            if os.path.isfile(dockerignore):
+                shutil.copy2(dockerignore, directory)
+            for path in referenced_files(dockerfile, context):
+                if os.path.isabs(path):
+                    util.link_or_copy(path,
+                                      os.path.join(
+                                          directory,
+                                          os.path.relpath(path, context)))
+
+            cmd = self.docker.bake(
+                'build', '-t', tag, directory, _out=LOG.out, _err=LOG.error)
+            try:
+                util.run_command(cmd)
+            except runner.ErrorReturnCode as e:
+                util.sysexit(e.exit_code)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def _size(self, tag):
+        """
+        Look up the size of the given image and returns an int, or None when
+        there is no such image.
+
+        :return: int
+        """
+        size = self._inspect(tag, '{{.Size}}')
+        if size is None:
+            return
+
+        return int(size or 0)
+
+    def _id(self, image):
+        """
+        Look up the ID of the given image and returns a string, or None when
+        there is no such image.
+
+        :return: str
+        """
+        return self._inspect(image, '{{.Id}}')
+
+    def _inspect(self, image, template):
+        try:
+            result = self._run('image', 'inspect', '--format', template,
+                               image)
+        except runner.ErrorReturnCode:
+            return
+
+        return result.stdout.decode('utf-8').strip()
+
+    def _run(self, *args):
+        return self.docker.bake(*args, _out=None, _err=None, _tty_out=False)()
+
+    def _entries(self):
+        """
+        Read the cache entries and returns a list of tuples containing the
+        time each image was last used, its key and its entry.
+
+        :return: list
+        """
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, '*.json')):
+            try:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+                used = os.path.getmtime(path)
+            except (IOError, OSError, ValueError):
+                continue
+            key = os.path.splitext(os.path.basename(path))[0]
+            entries.append((used, key, data))
+
+        return entries
+
+    def _write_entry(self, key, data):
+        util.atomic_write(self._get_path(key), json.dumps(data))
+
+    def _get_path(self, key):
+        return os.path.join(self.directory, '{}.json'.format(key))
+
+    def _get_lock_path(self, key):
+        return os.path.join(self.directory, '{}.lock'.format(key))
+
+    @contextlib.contextmanager
+    def _lock(self, key, blocking=True):
+        """
+        Hold an exclusive lock on the given key while the block executes, so
+        concurrent Molecule processes build an image once, and returns a
+        bool, which is False when not blocking and the key is locked.
+
+        :return: bool
+        """
+        util.makedirs(self.directory)
+        path = self._get_lock_path(key)
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        while True:
+            with open(path, 'a') as f:
+                try:
+                    fcntl.flock(f, flags)
+                except (IOError, OSError) as e:
+                    if e.errno not in (errno.EAGAIN, errno.EACCES):
+                        raise
+                    yield False
+                    return
+                try:
+                    # Pruning removes the lock file while holding the lock,
+                    # so a lock on a removed file is taken again.
+                    if _is_same_file(f, path):
+                        yield True
+                        return
+                finally:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def referenced_files(dockerfile, context):
+    """
+    Find the sources of the Dockerfile's `COPY` and `ADD` instructions and
+    returns a sorted list of the absolute paths of the files of the context
+    they match, followed by the remote URLs they reference.  Sources copied
+    from other build stages are left out.
+
+    :param dockerfile: A string containing the path to the Dockerfile.
+    :param context: A string containing the path to the build context.
+    :return: list
+    """
+    files = set()
+    urls = set()
+    for args in _instructions(dockerfile, ('ADD', 'COPY')):
+        if any(a.startswith('--from') for a in args):
+            continue
+        sources = [a for a in args if not a.startswith('--')][:-1]
+        for source in sources:
+            if '://' in source:
+                urls.add(source)
+                continue
+            pattern = os.path.join(context, source.lstrip('/'))
+            for path in glob.glob(pattern):
+                files.update(_walk(os.path.abspath(path)))
+
+    return sorted(files) + sorted(urls)
+
+
+def _instructions(dockerfile, names):
+    """
+    Parse the given Dockerfile and yields the arguments of each instruction
+    with one of the given names, as a list.
+
+    :return: generator
+    """
+    with open(dockerfile, 'r') as f:
+        content = f.read()
+
+    for line in content.replace('\\\n', ' ').splitlines():
+        parts = line.strip().split(None, 1)
+        if len(parts) < 2 or parts[0].upper() not in names:
+            continue
+        args = parts[1].strip()
+        if args.startswith('['):
+            try:
+                yield [str(a) for a in json.loads(args)]
+                continue
+            except ValueError:
+                pass
+        yield args.split()
+
+
+def _is_same_file(f, path):
+    try:
+        return os.path.samestat(os.fstat(f.fileno()), os.stat(path))
+    except OSError:
+        return False
+
+
+def _walk(path):
+    if not os.path.isdir(path):
+        return [path]
+
+    return [
+        os.path.join(root, name)
+        for root, _, files in os.walk(path) for name in files
+    ]
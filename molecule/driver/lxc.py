@@ -61,6 +61,14 @@ class Lxc(base.Base):
     def safe_files(self):
         return []
 
+    @property
+    def supports_reconcile(self):
+        return True
+
+    @property
+    def ssh_connection(self):
+        return False
+
     def login_options(self, instance_name):
         return {'instance': instance_name}
 
@@ -21,7 +21,6 @@
 import os
 
 from molecule import logger
-from molecule import util
 from molecule.driver import base
 
 LOG = logger.get_logger(__name__)
@@ -121,7 +120,7 @@ class Vagrant(base.Base):
                 'ansible_ssh_extra_args':
                 ' '.join(self._get_ssh_connection_options()),
             }
-        except StopIteration:
+        except KeyError:
             return {}
         except IOError:
             # Instance has yet to be provisioned , therefore the
@@ -135,10 +134,3 @@ class Vagrant(base.Base):
     @property
     def vagrantfile_config(self):
         return os.path.join(self._config.ephemeral_directory, 'vagrant.yml')
-
-    def _get_instance_config(self, instance_name):
-        instance_config_dict = util.safe_load_file(
-            self._config.driver.instance_config)
-
-        return next(item for item in instance_config_dict
-                    if item['instance'] == instance_name)
@@ -0,0 +1,107 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import json
+
+from molecule import logger
+
+LOG = logger.get_logger(__name__)
+
+
+class EventReader(object):
+    """
+    Reads the newline-delimited JSON events written by the bundled
+    `molecule_events` Ansible callback plugin.
+
+    Events are read incrementally, each call to ``read`` returns the events
+    written since the previous call, so a run can be followed while
+    `ansible-playbook` is still executing.  A partially written line is kept
+    until the rest of it is written.
+    """
+
+    def __init__(self, filename):
+        """
+        Initialize a new event reader class and returns None.
+
+        :param filename: A string containing the path to the events file.
+        :return: None
+        """
+        self._filename = filename
+        self._position = 0
+        self._partial = ''
+
+    def read(self):
+        """
+        Read the events written since the previous read and returns a list.
+
+        :return: list
+        """
+        try:
+            with open(self._filename, 'r') as f:
+                f.seek(self._position)
+                data = f.read()
+                self._position = f.tell()
+        except (IOError, OSError):
+            return []
+
+        lines = (self._partial + data).split('\n')
+        self._partial = lines.pop()
+
+        events = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                msg = 'Skipping malformed event: {}'.format(line)
+                LOG.warn(msg)
+
+        return events
+
+    def __iter__(self):
+        return iter(self.read())
+
+
+def results(events, status=None):
+    """
+    Filter the per-host task results from the events and returns a list.
+
+    :param events: A list of events.
+    :param status: An optional string containing the status to filter on.
+    :return: list
+    """
+    return [
+        event for event in events
+        if event.get('event') == 'result' and
+        (status is None or event.get('status') == status)
+    ]
+
+
+def changed(events):
+    """
+    Filter the per-host task results which reported a change from the events
+    and returns a list.  Failed results count when they report a change, as
+    they do in the play recap.
+
+    :param events: A list of events.
+    :return: list
+    """
+    return [event for event in results(events) if event.get('changed')]
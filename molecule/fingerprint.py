@@ -0,0 +1,154 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import fnmatch
+import hashlib
+import os
+
+from molecule import util
+
+READ_SIZE = 65536
+
+# Files which never affect a converge.
+IGNORE = [
+    '*.pyc', '*.retry', '.cache', '.git', '.molecule', '.pytest_cache', '.tox',
+    '__pycache__'
+]
+
+
+class Fingerprint(object):
+    """
+    A SHA-256 digest of the content of files, directories and data, used to
+    tell whether the inputs of a step changed since it last completed.
+    """
+
+    def __init__(self):
+        """
+        Initialize a new fingerprint class and returns None.
+
+        :return: None
+        """
+        self._hash = hashlib.sha256()
+
+    def update(self, data):
+        """
+        Add the given data to the fingerprint and returns None.
+
+        :param data: A string or bytes.
+        :return: None
+        """
+        if not isinstance(data, bytes):
+            data = data.encode('utf-8')
+        self._hash.update(data)
+        self._hash.update(b'\0')
+
+    def add_file(self, filename, name=None):
+        """
+        Add the name and content of the given file to the fingerprint and
+        returns None.  A missing file is added as such.
+
+        :param filename: A string containing the filename.
+        :param name: An optional string the file is known as, which defaults
+         to the filename.
+        :return: None
+        """
+        self.update(name or filename)
+        try:
+            with open(filename, 'rb') as f:
+                for chunk in iter(lambda: f.read(READ_SIZE), b''):
+                    self._hash.update(chunk)
+        except (IOError, OSError):
+            self.update('<missing>')
+        self._hash.update(b'\0')
+
+    def add_directory(self, directory, exclude=[]):
+        """
+        Add the files of the given directory to the fingerprint, in a stable
+        order and by their path relative to the directory, and returns None.
+
+        :param directory: A string containing the directory.
+        :param exclude: An optional list of absolute paths to leave out,
+         along with the files matching :data:`IGNORE`.
+        :return: None
+        """
+        exclude = set(os.path.abspath(e) for e in exclude)
+        for root, dirs, files in os.walk(directory):
+            dirs[:] = sorted(
+                d for d in dirs
+                if not _ignored(d) and os.path.join(root, d) not in exclude)
+            for name in sorted(files):
+                filename = os.path.join(root, name)
+                if _ignored(name) or filename in exclude:
+                    continue
+                self.add_file(filename, os.path.relpath(filename, directory))
+
+    def hexdigest(self):
+        return self._hash.hexdigest()
+
+
+def converge(c):
+    """
+    Fingerprint the inputs of a converge and returns a string.  These are the
+    role's files, the scenario's files with the exception of the verifier's
+    tests, the converge playbook and the resolved config, which holds the
+    host and group vars.
+
+    :param c: An instance of a Molecule config.
+    :return: str
+    """
+    scenario_directory = os.path.abspath(c.scenario.directory)
+    molecule_directory = os.path.dirname(scenario_directory)
+    project_directory = os.path.dirname(molecule_directory)
+
+    f = Fingerprint()
+    f.update(util.safe_dump(c.config))
+    f.add_directory(project_directory, exclude=[molecule_directory])
+    f.add_directory(
+        scenario_directory,
+        exclude=[c.ephemeral_directory, c.verifier.directory])
+    f.add_file(c.provisioner.playbooks.converge)
+
+    return f.hexdigest()
+
+
+def snapshot(c, converge_fingerprint=None):
+    """
+    Fingerprint the inputs of the snapshot of every instance, which are the
+    inputs of the converge along with the instance's definition, and returns
+    a dict keyed by instance name.
+
+    :param c: An instance of a Molecule config.
+    :param converge_fingerprint: An optional string containing the
+     fingerprint of the inputs of the converge, computed when omitted.
+    :return: dict
+    """
+    converge_fingerprint = converge_fingerprint or converge(c)
+    fingerprints = {}
+    for instance in c.platforms.instance_models:
+        f = Fingerprint()
+        f.update(converge_fingerprint)
+        f.update(c.platforms.definition(instance))
+        fingerprints[instance.name] = f.hexdigest()
+
+    return fingerprints
+
+
+def _ignored(name):
+    return any(fnmatch.fnmatch(name, pattern) for pattern in IGNORE)
@@ -60,10 +60,39 @@ class Interpolator(object):
         except ValueError:
             raise InvalidInterpolation(string)
 
+    def referenced_variables(self, string):
+        """
+        Look up the variables referenced by the string in the mapping and
+        returns a dict.  Variables missing from the mapping have a value of
+        None, so an unset variable can be told apart from an empty one.
+
+        :param string: A string to be scanned for variables.
+        :return: dict
+        """
+        return {
+            var: self.mapping.get(var)
+            for var in self.templater(string).variables()
+        }
+
 
 class TemplateWithDefaults(string.Template):
     idpattern = r'[_a-z][_a-z0-9]*(?::?-[^}]+)?'
 
+    def variables(self):
+        """
+        Collect the names of the variables referenced by the template, without
+        their defaults, and returns a sorted list.
+
+        :return: list
+        """
+        names = set()
+        for mo in self.pattern.finditer(self.template):
+            named = mo.group('named') or mo.group('braced')
+            if named is not None:
+                names.add(_variable_name(named))
+
+        return sorted(names)
+
     # Modified from python2.7/string.py
     def substitute(self, mapping):
         # Helper function for .sub()
@@ -85,3 +114,12 @@ class TemplateWithDefaults(string.Template):
                 self._invalid(mo)
 
         return self.pattern.sub(convert, self.template)
+
+
+def _variable_name(named):
+    if ':-' in named:
+        return named.partition(':-')[0]
+    if '-' in named:
+        return named.partition('-')[0]
+
+    return named
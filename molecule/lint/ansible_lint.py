@@ -20,9 +20,8 @@
 
 import os
 
-import sh
-
 from molecule import logger
+from molecule import runner
 from molecule import util
 from molecule.lint import base
 
@@ -112,7 +111,7 @@ class AnsibleLint(base.Base):
         options = self.options
         excludes = options.pop('excludes')
         exclude_args = ['--exclude={}'.format(exclude) for exclude in excludes]
-        self._ansible_lint_command = sh.ansible_lint.bake(
+        self._ansible_lint_command = runner.command('ansible-lint').bake(
             options,
             exclude_args,
             self._config.provisioner.playbooks.converge,
@@ -138,5 +137,5 @@ class AnsibleLint(base.Base):
                 self._ansible_lint_command,
                 debug=self._config.args.get('debug'))
             LOG.success('Lint completed successfully.')
-        except sh.ErrorReturnCode as e:
+        except runner.ErrorReturnCode as e:
             util.sysexit(e.exit_code)
@@ -74,6 +74,21 @@ class TrailingNewlineFormatter(logging.Formatter):
         return super(TrailingNewlineFormatter, self).format(record)
 
 
+class IndentFormatter(TrailingNewlineFormatter):
+    """
+    A custom logging formatter which indents every line of a message, as
+    command output is logged a batch of lines at a time.
+    """
+
+    def __init__(self, indent):
+        self._indent = indent
+        super(IndentFormatter, self).__init__(indent + '%(message)s')
+
+    def format(self, record):
+        s = super(IndentFormatter, self).format(record)
+        return s.replace('\n', '\n' + self._indent)
+
+
 def get_logger(name=None):
     """
     Build a logger with the given name and returns the logger.
@@ -113,7 +128,7 @@ def _get_out_handler():
     handler = logging.StreamHandler(sys.stdout)
     handler.setLevel(OUT)
     handler.addFilter(LogFilter(OUT))
-    handler.setFormatter(TrailingNewlineFormatter('    %(message)s'))
+    handler.setFormatter(IndentFormatter('    '))
 
     return handler
 
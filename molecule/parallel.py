@@ -0,0 +1,290 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+from __future__ import print_function
+
+import collections
+import errno
+import multiprocessing
+import os
+import signal
+import sys
+import time
+import traceback
+
+import tabulate
+
+from molecule import ansible_worker
+from molecule import logger
+from molecule import runner
+
+try:
+    import selectors
+except ImportError:  # pragma: no cover
+    import selectors2 as selectors
+
+LOG = logger.get_logger(__name__)
+
+READ_SIZE = 65536
+
+PASSED = 'passed'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+
+Result = collections.namedtuple('Result', ['scenario', 'status', 'duration'])
+
+# Scenarios are forked, so the functions and configs they execute are not
+# pickled.
+try:
+    _context = multiprocessing.get_context('fork')
+except AttributeError:  # pragma: no cover
+    _context = multiprocessing
+
+
+class Scenario(object):
+    """
+    A scenario executing in a process of its own, whose stdout and stderr are
+    read through a pipe.
+    """
+
+    def __init__(self, c, func):
+        """
+        Start executing the given function with the given config and returns
+        None.
+
+        :param c: An instance of a Molecule config.
+        :param func: A callable taking a Molecule config.
+        :return: None
+        """
+        self._name = c.scenario.name
+        self._start = time.time()
+        self._partial = b''
+        self._terminated = False
+        self.closed = False
+
+        self.fd, fd = os.pipe()
+        self._process = _context.Process(target=_run, args=(func, c, fd))
+        self._process.start()
+        os.close(fd)
+
+    @property
+    def name(self):
+        return self._name
+
+    def read(self):
+        """
+        Read the output available and returns a list of complete lines.  At
+        the end of the output, the pipe is closed and `closed` is True.
+
+        :return: list
+        """
+        try:
+            data = os.read(self.fd, READ_SIZE)
+        except OSError as e:  # pragma: no cover
+            if e.errno != errno.EIO:
+                raise
+            data = b''
+
+        if not data:
+            os.close(self.fd)
+            self.closed = True
+            lines = [self._partial] if self._partial else []
+        else:
+            lines = (self._partial + data).split(b'\n')
+            self._partial = lines.pop()
+
+        return [_decode(line) for line in lines]
+
+    def wait(self):
+        """
+        Wait for the scenario to exit and returns its Result.
+
+        :return: Result
+        """
+        self._process.join()
+        duration = time.time() - self._start
+        if self._process.exitcode == 0:
+            status = PASSED
+        elif self._terminated:
+            status = CANCELLED
+        else:
+            status = FAILED
+
+        return Result(self._name, status, duration)
+
+    def terminate(self):
+        """
+        Terminate the scenario along with the processes it started, and
+        returns None.
+
+        :return: None
+        """
+        self._terminated = True
+        try:
+            os.killpg(self._process.pid, signal.SIGTERM)
+        except OSError:
+            # The scenario has not started a session of its own yet.
+            try:
+                os.kill(self._process.pid, signal.SIGTERM)
+            except OSError:
+                pass
+
+
+def execute(configs, func, processes, keep_going=False):
+    """
+    Execute the given function for each config, in up to the given number of
+    processes at a time, and returns a list of Results, in the order of the
+    configs.  The output of each scenario is prefixed with its name.
+
+    Unless keeping going, the first failure terminates the running scenarios
+    and cancels the remaining ones.
+
+    :param configs: A list of Molecule configs.
+    :param func: A callable taking a Molecule config.
+    :param processes: An int containing the number of concurrent scenarios.
+    :param keep_going: An optional bool to execute the remaining scenarios
+     after a failure.
+    :return: list
+    """
+    pending = collections.deque(configs)
+    width = max(len(c.scenario.name) for c in configs)
+    results = {}
+    running = {}
+    sel = selectors.DefaultSelector()
+    failed = False
+
+    try:
+        while pending or running:
+            while pending and len(running) < processes and not failed:
+                scenario = Scenario(pending.popleft(), func)
+                running[scenario.fd] = scenario
+                sel.register(scenario.fd, selectors.EVENT_READ, scenario)
+
+            for key, _ in sel.select():
+                scenario = key.data
+                lines = scenario.read()
+                if lines:
+                    _print(scenario.name, width, lines)
+                if not scenario.closed:
+                    continue
+
+                sel.unregister(key.fd)
+                del running[key.fd]
+                result = scenario.wait()
+                results[scenario.name] = result
+                if result.status == FAILED and not keep_going and not failed:
+                    failed = True
+                    for s in running.values():
+                        s.terminate()
+
+            if failed:
+                while pending:
+                    c = pending.popleft()
+                    results[c.scenario.name] = Result(c.scenario.name,
+                                                      CANCELLED, 0)
+    except BaseException:
+        for s in running.values():
+            s.terminate()
+        raise
+    finally:
+        sel.close()
+
+    return [results[c.scenario.name] for c in configs]
+
+
+def print_summary(results):
+    """
+    Print a table of the result and duration of each scenario and returns
+    None.
+
+    :param results: A list of Results.
+    :return: None
+    """
+    LOG.info('Scenario results:')
+    headers = ['Scenario', 'Result', 'Duration (s)']
+    data = [[r.scenario, r.status, float(r.duration)] for r in results]
+    print(
+        tabulate.tabulate(data, headers, tablefmt='simple', floatfmt='.2f'))
+
+
+def _print(name, width, lines):
+    prefix = '{} | '.format(name.ljust(width))
+    sys.stdout.write(''.join('{}{}\n'.format(prefix, line) for line in lines))
+    sys.stdout.flush()
+
+
+def _run(func, c, fd):  # pragma: no cover
+    """
+    The main function of a scenario's process.  Executes the given function
+    with its stdout and stderr written to the given pipe, and exits with the
+    exit code Molecule would exit with.
+
+    :param func: A callable taking a Molecule config.
+    :param c: An instance of a Molecule config.
+    :param fd: An int containing the write end of the pipe.
+    :return: None
+    """
+    # A session of its own, so the scenario can be terminated along with the
+    # processes it started.  Commands and Ansible workers run in sessions of
+    # their own, so they are terminated by the handler.
+    signal.signal(signal.SIGTERM, _terminate)
+    os.setsid()
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.dup2(fd, 1)
+    os.dup2(fd, 2)
+    os.close(fd)
+
+    code = 1
+    try:
+        func(c)
+        code = 0
+    except SystemExit as e:
+        if e.code is None:
+            code = 0
+        elif isinstance(e.code, int):
+            code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def _terminate(signum, frame):  # pragma: no cover
+    """
+    The SIGTERM handler of a scenario's process.  Terminates the commands and
+    Ansible workers the scenario started, and exits.
+
+    :param signum: An int containing the signal.
+    :param frame: The interrupted stack frame.
+    :return: None
+    """
+    runner.signal_running(signal.SIGTERM)
+    ansible_worker.terminate_workers()
+    os._exit(128 + signum)
+
+
+def _decode(line):
+    return line.rstrip(b'\r').decode('utf-8', 'replace')
@@ -18,13 +18,19 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
-import copy
+import collections
+import os
+import time
 
+from molecule import fingerprint
 from molecule import logger
 from molecule import util
 
 LOG = logger.get_logger(__name__)
 
+# The default lifetime of reused instances in seconds.
+INSTANCE_TTL = 86400
+
 
 class Platforms(object):
     """
@@ -66,6 +72,27 @@ class Platforms(object):
               - group2
             children:
               - child_group1
+
+    Molecule records the platform definition of every instance it creates in
+    the state file.  Create and destroy can reconcile the instances with this
+    section, and only act on the platforms which were added, removed, or
+    changed since.
+
+    .. code-block:: bash
+
+        $ molecule destroy --reconcile
+        $ molecule create --reconcile
+
+    Along with the platform definition, a hash of everything the instance is
+    built from, such as the driver's Dockerfile, is recorded.  Instances whose
+    hash changed are stale as well.  This lets `molecule test` reuse the
+    instances of a previous run, and recreate only the stale ones, or the ones
+    older than the given TTL in seconds.  The instances are then kept until an
+    explicit `molecule destroy`, or a run after they expired.
+
+    .. code-block:: bash
+
+        $ molecule test --reuse-instances --instance-ttl 3600
     """
 
     def __init__(self, config):
@@ -76,6 +103,10 @@ class Platforms(object):
         :return: None
         """
         self._config = config
+        self._platforms = None
+        self._instance_models = []
+        self._instances_by_name = {}
+        self._groups = {}
 
     @property
     def instances(self):
@@ -83,11 +114,184 @@ class Platforms(object):
 
     @property
     def instances_with_scenario_name(self):
-        instances = copy.deepcopy(self.instances)
-        for instance in instances:
-            instance_name = instance['name']
-            scenario_name = self._config.scenario.name
-            instance['name'] = util.instance_with_scenario_name(instance_name,
-                                                                scenario_name)
-
-        return instances
+        """
+        Copies of the platforms, named after the instance in the scenario, and
+        returns a list.
+
+        :return: list
+        """
+        return [
+            dict(instance.platform, name=instance.name)
+            for instance in self.instance_models
+        ]
+
+    @property
+    def instance_models(self):
+        """
+        Instances of the scenario, in the order of the platforms section, and
+        returns a list.
+
+        :return: list
+        """
+        self._index()
+
+        return self._instance_models
+
+    @property
+    def groups(self):
+        """
+        Instances by the group they belong to, and returns a dict.  Instances
+        without groups belong to the ``ungrouped`` group.
+
+        :return: dict
+        """
+        self._index()
+
+        return self._groups
+
+    def get_instance(self, instance_name):
+        """
+        Look up an instance by the name it has in the scenario and returns an
+        Instance, or None when there is no such instance.
+
+        :param instance_name: A string containing the instance name.
+        :return: Instance
+        """
+        self._index()
+
+        return self._instances_by_name.get(instance_name)
+
+    @property
+    def uncreated(self):
+        """
+        Platforms without a created instance recorded in the state file and
+        returns a list.
+
+        :return: list
+        """
+        recorded = self._config.state.instances
+        return [
+            instance.platform for instance in self.instance_models
+            if not recorded.get(instance.name, {}).get('created')
+        ]
+
+    @property
+    def stale(self):
+        """
+        Platform definitions of the created instances, which were removed from
+        or changed in the platforms section since they were recorded in the
+        state file, and returns a dict keyed by instance name.
+
+        :return: dict
+        """
+        current = {
+            instance.name: instance.platform
+            for instance in self.instance_models
+        }
+
+        definitions = {}
+
+        def is_stale(instance_name, d):
+            if current.get(instance_name) != d.get('platform'):
+                return True
+            if d.get('definition') is None:
+                return False
+            if instance_name not in definitions:
+                definitions[instance_name] = self.definition(
+                    self.get_instance(instance_name))
+
+            return definitions[instance_name] != d['definition']
+
+        return {
+            instance_name: d.get('platform')
+            for instance_name, d in self._config.state.instances.items()
+            if d.get('created') and is_stale(instance_name, d)
+        }
+
+    def expired(self, ttl):
+        """
+        Platform definitions of the created instances, which were created
+        longer than the given number of seconds ago, or before their creation
+        time was recorded, and returns a dict keyed by instance name.
+
+        :param ttl: An int containing the lifetime of instances in seconds.
+        :return: dict
+        """
+        now = time.time()
+
+        return {
+            instance_name: d.get('platform')
+            for instance_name, d in self._config.state.instances.items()
+            if d.get('created') and now - d.get('created_at', 0) > ttl
+        }
+
+    def definition(self, instance):
+        """
+        Hash the definition of the given instance, which is its platform
+        along with the driver and the files it builds the instance from, and
+        returns a string.
+
+        :param instance: An Instance.
+        :return: str
+        """
+        driver = self._config.driver
+        f = fingerprint.Fingerprint()
+        f.update(driver.name)
+        f.update(util.safe_dump(instance.platform))
+        for filename in driver.definition_files(instance.platform):
+            f.add_file(filename,
+                       os.path.relpath(filename,
+                                       self._config.scenario.directory))
+
+        return f.hexdigest()
+
+    def _index(self):
+        """
+        Build the instance models once, and again only when the platforms
+        section is replaced, and returns None.
+
+        :return: None
+        """
+        platforms = self.instances
+        if platforms is self._platforms:
+            return
+
+        scenario_name = self._config.scenario.name
+        instance_models = [
+            Instance(platform, scenario_name) for platform in platforms
+        ]
+        groups = collections.OrderedDict()
+        for instance in instance_models:
+            for group in instance.groups or ('ungrouped', ):
+                groups.setdefault(group, []).append(instance)
+
+        self._instance_models = instance_models
+        self._instances_by_name = {i.name: i for i in instance_models}
+        self._groups = groups
+        self._platforms = platforms
+
+
+class Instance(object):
+    """
+    An instance of a scenario, built from its platform definition.
+
+    :param platform: A dict containing the platform definition.
+    :param scenario_name: A string containing the scenario name.
+    """
+    __slots__ = ('name', 'platform_name', 'groups', 'children', 'platform')
+
+    def __init__(self, platform, scenario_name):
+        #: The instance name qualified with the scenario name.
+        self.name = util.instance_with_scenario_name(platform['name'],
+                                                     scenario_name)
+        #: The instance name as given in the platforms section.
+        self.platform_name = platform['name']
+        #: A tuple of the groups the instance belongs to.
+        self.groups = tuple(platform.get('groups', ()))
+        #: A tuple of the child groups of the instance's groups.
+        self.children = tuple(platform.get('children', ()))
+        #: The platform definition.
+        self.platform = platform
+
+    def __repr__(self):
+        return '{}({!r})'.format(type(self).__name__, self.name)
@@ -20,6 +20,9 @@
 
 import copy
 import collections
+import hashlib
+import json
+import multiprocessing
 import os
 
 from molecule import ansible_playbook
@@ -29,6 +32,9 @@ from molecule import util
 LOG = logger.get_logger(__name__)
 
 
+ENGINES = ['subprocess', 'worker']
+
+
 class Namespace(object):
     def __init__(self, config):
         """
@@ -156,6 +162,54 @@ class Ansible(object):
             ssh_connection:
               scp_if_ssh: True
 
+    Execution engine.  Molecule starts a new `ansible-playbook` for every
+    playbook by default.  The `worker` engine executes the playbooks of a
+    scenario through Ansible's Python API instead, from a long-lived process
+    which pays interpreter start-up and imports once, and forks for every
+    playbook.
+
+    .. code-block:: yaml
+
+        provisioner:
+          name: ansible
+          engine: worker
+
+    Molecule ships a `molecule_events` callback plugin, which writes the
+    events of each `ansible-playbook` run as newline-delimited JSON to
+    `events.ndjson` in the ephemeral directory.  Idempotence reads the task
+    results from it, rather than parsing the output of the run.
+
+    Output which Molecule captures, rather than prints, such as the output of
+    the idempotence run, is written to a log file per step in `logs/` of the
+    ephemeral directory.  Only the last `capture_window` bytes are kept in
+    memory, one MiB by default.
+
+    .. code-block:: yaml
+
+        provisioner:
+          name: ansible
+          capture_window: 1048576
+
+    Performance profile.  Molecule tunes the generated ansible.cfg for the
+    scenario, and records the settings it chose, and why, in the file's header.
+    Options set in `config_options` take precedence over the profile.
+
+    .. code-block:: yaml
+
+        provisioner:
+          name: ansible
+          performance: fast
+
+    The `fast` profile sets:
+
+    * `forks` to the number of platforms, capped at four per CPU.
+    * `gathering` to `smart`, and a `jsonfile` fact cache in the ephemeral
+      directory, so facts are gathered once per instance.
+    * For drivers connecting over SSH, `pipelining`, and SSH multiplexing with
+      `ControlPersist`, keeping the control sockets in a short directory of
+      Molecule's cache, so their paths stay within the length limit of unix
+      sockets.  Docker, LXC and LXD get no SSH settings.
+
     Roles which require host/groups to have certain variables set.  Molecule
     uses the same `variables defined in a playbook`_ syntax as `Ansible`_.
 
@@ -216,6 +270,8 @@ class Ansible(object):
                 '{}:$ANSIBLE_LIBRARY'.format(self._get_libraries_directory()),
                 'filter_plugins': '{}:$ANSIBLE_FILTER_PLUGINS'.format(
                     self._get_filter_plugin_directory()),
+                'callback_plugins': '{}:$ANSIBLE_CALLBACK_PLUGINS'.format(
+                    self._get_callback_plugin_directory()),
             },
             'ssh_connection': {
                 'ssh_args': '-o UserKnownHostsFile=/dev/null',
@@ -246,8 +302,9 @@ class Ansible(object):
         :return: dict
         """
         env = self._config.merge_dicts(os.environ.copy(), self._config.env)
-        env = self._config.merge_dicts(
-            env, {'ANSIBLE_CONFIG': self._config.provisioner.config_file})
+        env = self._config.merge_dicts(env, {
+            'ANSIBLE_CONFIG': self._config.provisioner.config_file,
+        })
         env = self._config.merge_dicts(env, self._config.env)
 
         return env
@@ -256,10 +313,48 @@ class Ansible(object):
     def name(self):
         return self._config.config['provisioner']['name']
 
+    @property
+    def engine(self):
+        """
+        How playbooks are executed and returns a string.
+
+        :return: str
+        """
+        engine = self._config.config['provisioner'].get('engine',
+                                                        'subprocess')
+        if engine not in ENGINES:
+            msg = ("Invalid provisioner engine '{}'.  Valid engines are: "
+                   '{}.').format(engine, ', '.join(
+                       "'{}'".format(e) for e in ENGINES))
+            util.sysexit_with_message(msg)
+
+        return engine
+
+    @property
+    def performance(self):
+        return self._config.config['provisioner'].get('performance')
+
+    @property
+    def performance_config_options(self):
+        """
+        Options of the performance profile provided to construct ansible.cfg
+        and returns a dict.
+
+        :return: dict
+        """
+        d = collections.defaultdict(dict)
+        for section, key, value, _ in self._get_performance_profile():
+            d[section][key] = value
+
+        return dict(d)
+
     @property
     def config_options(self):
+        config_options = self._config.merge_dicts(
+            self.default_config_options, self.performance_config_options)
+
         return self._config.merge_dicts(
-            self.default_config_options,
+            config_options,
             self._config.config['provisioner']['config_options'])
 
     @property
@@ -308,16 +403,16 @@ class Ansible(object):
         :return: str
         """
         dd = self._vivify()
-        for platform in self._config.platforms.instances_with_scenario_name:
-            for group in platform.get('groups', ['ungrouped']):
-                instance_name = platform['name']
-                connection_options = self.connection_options(instance_name)
-                dd['all']['hosts'][instance_name] = connection_options
+        for instance in self._config.platforms.instance_models:
+            instance_name = instance.name
+            connection_options = self.connection_options(instance_name)
+            dd['all']['hosts'][instance_name] = connection_options
+            # Ungrouped
+            dd['ungrouped']['vars'] = {}
+            for group in instance.groups or ('ungrouped', ):
                 dd[group]['hosts'][instance_name] = connection_options
-                # Ungrouped
-                dd['ungrouped']['vars'] = {}
                 # Children
-                for child_group in platform.get('children', []):
+                for child_group in instance.children:
                     dd[group]['children'][child_group]['hosts'][
                         instance_name] = connection_options
 
@@ -332,6 +427,27 @@ class Ansible(object):
     def config_file(self):
         return os.path.join(self._config.ephemeral_directory, 'ansible.cfg')
 
+    def events_file(self, step):
+        """
+        Path to the events of the last `ansible-playbook` run of the given
+        step, written by the bundled `molecule_events` callback plugin, and
+        returns a str.  Each step has a file of its own, so steps executing
+        concurrently do not mix their events.
+
+        :param step: A string containing the name of the step.
+        :return: str
+        """
+        return os.path.join(self._config.ephemeral_directory,
+                            'events-{}.ndjson'.format(step))
+
+    @property
+    def log_directory(self):
+        return os.path.join(self._config.ephemeral_directory, 'logs')
+
+    @property
+    def capture_window(self):
+        return self._config.config['provisioner']['capture_window']
+
     @property
     def playbooks(self):
         return self._ns
@@ -349,45 +465,72 @@ class Ansible(object):
 
         :return: None
         """
-        pb = self._get_ansible_playbook(self.playbooks.converge)
+        pb = self._get_ansible_playbook(self.playbooks.converge, step='check')
         pb.add_cli_arg('check', True)
         pb.execute()
 
-    def converge(self, playbook=None, **kwargs):
+    def converge(self, playbook=None, abort=None, **kwargs):
         """
         Executes `ansible-playbook` against the converge playbook unless
         specified otherwise and returns a string.
 
         :param playbook: An optional string containing an absolute path to a
          playbook.
+        :param abort: An optional callable, polled while the playbook runs,
+         which terminates the playbook when it returns True.
         :param kwargs: An optional keyword arguments.
         :return: str
         """
         if playbook is None:
+            kwargs.setdefault('step', 'converge')
             pb = self._get_ansible_playbook(self.playbooks.converge, **kwargs)
         else:
             pb = self._get_ansible_playbook(playbook, **kwargs)
 
+        if abort is not None:
+            return pb.execute_until(abort)
+
         return pb.execute()
 
-    def destroy(self):
+    def destroy(self, platforms=None):
         """
         Executes `ansible-playbook` against the destroy playbook and returns
-        None.
+        None.  Drivers with a native lifecycle destroy the instances
+        themselves instead.
 
+        :param platforms: An optional list of platforms to limit the playbook
+         to.
         :return: None
         """
-        pb = self._get_ansible_playbook(self.playbooks.teardown)
+        if self._config.driver.native_lifecycle:
+            self._config.driver.destroy_instances(
+                platforms or self._config.platforms.instances)
+            return
+
+        pb = self._get_ansible_playbook(
+            self.playbooks.teardown, step='destroy')
+        self._limit_platforms(pb, platforms)
         pb.execute()
 
-    def setup(self):
+    def setup(self, platforms=None):
         """
-        Executes `ansible-playbook` against the setup playbook and returns
-        None.
+        Executes `ansible-playbook` against the setup playbook, once the
+        driver prepared the platforms, and returns None.  Drivers with a
+        native lifecycle create the instances themselves instead.
 
+        :param platforms: An optional list of platforms to limit the playbook
+         to.
         :return: None
         """
-        pb = self._get_ansible_playbook(self.playbooks.setup)
+        self._config.driver.prepare_platforms(
+            platforms or self._config.platforms.instances)
+        if self._config.driver.native_lifecycle:
+            self._config.driver.create_instances(
+                platforms or self._config.platforms.instances)
+            return
+
+        pb = self._get_ansible_playbook(self.playbooks.setup, step='create')
+        self._limit_platforms(pb, platforms)
         pb.execute()
 
     def syntax(self):
@@ -397,7 +540,7 @@ class Ansible(object):
 
         :return: None
         """
-        pb = self._get_ansible_playbook(self.playbooks.converge)
+        pb = self._get_ansible_playbook(self.playbooks.converge, step='syntax')
         pb.add_cli_arg('syntax-check', True)
         pb.execute()
 
@@ -420,8 +563,14 @@ class Ansible(object):
         # self._verify_config()
 
         template = util.render_template(
-            self._get_config_template(), config_options=self.config_options)
+            self._get_config_template(),
+            config_options=self.config_options,
+            performance=self.performance,
+            performance_profile=self._get_performance_profile())
         util.write_file(self.config_file, template)
+        if self.performance and self._config.driver.ssh_connection:
+            # ssh does not create the directory of its control sockets.
+            util.makedirs(self._get_control_path_directory())
 
     def add_or_update_vars(self, target):
         """
@@ -451,8 +600,7 @@ class Ansible(object):
         ephemeral_directory = self._config.ephemeral_directory
         target_vars_directory = os.path.join(ephemeral_directory, target)
 
-        if not os.path.isdir(os.path.abspath(target_vars_directory)):
-            os.mkdir(os.path.abspath(target_vars_directory))
+        util.makedirs(os.path.abspath(target_vars_directory))
 
         for target in vars_target.keys():
             target_var_content = vars_target[target]
@@ -471,6 +619,28 @@ class Ansible(object):
         return ansible_playbook.AnsiblePlaybook(self.inventory_file, playbook,
                                                 self._config, **kwargs)
 
+    def _limit_platforms(self, pb, platforms):
+        """
+        Limit the setup or teardown playbook to the given platforms and
+        returns None.
+
+        The playbooks load `molecule_yml` from the Molecule file.  Passing a
+        copy of the config, with only the given platforms, as an extra var
+        overrides it, since extra vars have the highest precedence.
+
+        :param pb: An instance of AnsiblePlaybook.
+        :param platforms: A list of platforms, or None for all platforms.
+        :return: None
+        """
+        if platforms is None:
+            return
+
+        molecule_yml = copy.copy(self._config.config)
+        molecule_yml['platforms'] = platforms
+        pb.add_cli_arg('extra-vars', json.dumps({
+            'molecule_yml': molecule_yml
+        }))
+
     def _verify_inventory(self):
         """
         Verify the inventory is valid and returns None.
@@ -489,6 +659,13 @@ class Ansible(object):
         :return: str
         """
         return """
+{% if performance_profile -%}
+# Performance profile: {{ performance }}
+{% for section, k, v, reason in performance_profile -%}
+#   [{{ section }}] {{ k }} = {{ v }}
+#       {{ reason }}
+{% endfor -%}
+{% endif -%}
 {% for section, section_dict in config_options.items() -%}
 [{{ section }}]
 {% for k, v in section_dict.items() -%}
@@ -497,6 +674,69 @@ class Ansible(object):
 {% endfor -%}
 """.strip()
 
+    def _get_performance_profile(self):
+        """
+        Derive the settings of the performance profile from the platforms, the
+        CPUs and the driver, and returns a list of (section, key, value,
+        reason) tuples.
+
+        :return: list
+        """
+        if not self.performance:
+            return []
+
+        if self.performance != 'fast':
+            msg = ("Invalid provisioner performance profile '{}'.  Valid "
+                   "profiles are: 'fast'.").format(self.performance)
+            util.sysexit_with_message(msg)
+
+        platforms = len(self._config.platforms.instances)
+        cpus = _get_cpu_count()
+        forks = max(1, min(platforms, cpus * 4))
+        ephemeral_directory = self._config.ephemeral_directory
+
+        profile = [
+            ('defaults', 'forks', forks,
+             'One fork per platform ({}), capped at four per CPU ({}).'.format(
+                 platforms, cpus)),
+            ('defaults', 'gathering', 'smart',
+             'Gather facts only when missing from the fact cache.'),
+            ('defaults', 'fact_caching', 'jsonfile',
+             'Cache facts between playbook runs.'),
+            ('defaults', 'fact_caching_connection',
+             os.path.join(ephemeral_directory, 'facts'),
+             'Keep the fact cache in the ephemeral directory.'),
+        ]
+
+        if self._config.driver.ssh_connection:
+            profile.extend([
+                ('ssh_connection', 'pipelining', True,
+                 'Execute modules without copying them to the instance.'),
+                ('ssh_connection', 'ssh_args',
+                 ('-o UserKnownHostsFile=/dev/null -o ControlMaster=auto '
+                  '-o ControlPersist=60s'),
+                 'Reuse one SSH connection per instance between tasks.'),
+                ('ssh_connection', 'control_path',
+                 os.path.join(self._get_control_path_directory(), '%%C'),
+                 'Keep the SSH control sockets in a short cache directory.'),
+            ])
+
+        return profile
+
+    def _get_control_path_directory(self):
+        """
+        Build the directory of the scenario's SSH control sockets and returns
+        a string.  Unix socket paths are limited to about 104 bytes, so the
+        sockets are kept in the cache, in a directory named after a hash of
+        the ephemeral directory, rather than in the ephemeral directory.
+
+        :return: str
+        """
+        ephemeral_directory = self._config.ephemeral_directory
+        digest = hashlib.sha256(ephemeral_directory.encode('utf-8'))
+
+        return util.cache_directory('ssh', digest.hexdigest()[:12])
+
     def _vivify(self):
         """
         Return an autovivification default dict.
@@ -521,3 +761,13 @@ class Ansible(object):
 
     def _get_filter_plugin_directory(self):
         return os.path.join(self._get_plugin_directory(), 'filters')
+
+    def _get_callback_plugin_directory(self):
+        return os.path.join(self._get_plugin_directory(), 'callback')
+
+
+def _get_cpu_count():
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:  # pragma: no cover
+        return 1
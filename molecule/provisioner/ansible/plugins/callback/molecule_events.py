@@ -0,0 +1,148 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+from __future__ import absolute_import
+
+import json
+import os
+import time
+
+from ansible.plugins.callback import CallbackBase
+
+DOCUMENTATION = """
+    callback: molecule_events
+    type: aggregate
+    short_description: Writes playbook events as newline-delimited JSON.
+    description:
+      - Appends an event per line to the file named by the
+        MOLECULE_EVENTS_FILE environment variable, and does nothing when it
+        is not set.
+"""
+
+EVENTS_FILE_ENV = 'MOLECULE_EVENTS_FILE'
+
+
+class CallbackModule(CallbackBase):
+    """
+    Writes playbook events as newline-delimited JSON, so Molecule can follow
+    a run without parsing its output.
+
+    Every event is a JSON object with an ``event`` key, one of
+    ``playbook_start``, ``play_start``, ``task_start``, ``result`` and
+    ``stats``.  Events are flushed as they happen.
+    """
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = 'aggregate'
+    CALLBACK_NAME = 'molecule_events'
+    CALLBACK_NEEDS_WHITELIST = False
+
+    def __init__(self, *args, **kwargs):
+        super(CallbackModule, self).__init__(*args, **kwargs)
+        self._filename = os.environ.get(EVENTS_FILE_ENV)
+        self._file = None
+        self._task_started = {}
+        self._host_started = {}
+
+    def v2_playbook_on_start(self, playbook):
+        self._emit('playbook_start', playbook=playbook._file_name)
+
+    def v2_playbook_on_play_start(self, play):
+        self._emit('play_start', play=play.get_name().strip())
+
+    def v2_playbook_on_task_start(self, task, is_conditional):
+        self._task_start(task, handler=False)
+
+    def v2_playbook_on_handler_task_start(self, task):
+        self._task_start(task, handler=True)
+
+    def v2_runner_on_start(self, host, task):
+        self._host_started[(host.get_name(), task._uuid)] = time.time()
+
+    def v2_runner_on_ok(self, result):
+        status = 'changed' if result._result.get('changed') else 'ok'
+        self._result(result, status)
+
+    def v2_runner_on_failed(self, result, ignore_errors=False):
+        self._result(result, 'failed', ignore_errors=ignore_errors)
+
+    def v2_runner_on_skipped(self, result):
+        self._result(result, 'skipped')
+
+    def v2_runner_on_unreachable(self, result):
+        self._result(result, 'unreachable')
+
+    def v2_playbook_on_stats(self, stats):
+        hosts = {
+            host: stats.summarize(host)
+            for host in sorted(stats.processed.keys())
+        }
+        self._emit('stats', hosts=hosts)
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _task_start(self, task, handler):
+        self._task_started[task._uuid] = time.time()
+        self._emit('task_start', **self._describe_task(task, handler))
+
+    def _result(self, result, status, **kwargs):
+        task = result._task
+        host = result._host.get_name()
+        now = time.time()
+        started = self._host_started.pop(
+            (host, task._uuid), self._task_started.get(task._uuid, now))
+
+        d = self._describe_task(task, _is_handler(task))
+        d.update(kwargs)
+        self._emit(
+            'result',
+            host=host,
+            status=status,
+            changed=bool(result._result.get('changed')),
+            duration=round(now - started, 6),
+            **d)
+
+    def _describe_task(self, task, handler):
+        role = task._role.get_name() if task._role else None
+
+        return {
+            'task': task.get_name().strip(),
+            'role': role,
+            'handler': handler,
+            'path': task.get_path(),
+            'uuid': task._uuid,
+        }
+
+    def _emit(self, event, **kwargs):
+        if not self._filename:
+            return
+
+        if self._file is None:
+            self._file = open(self._filename, 'a')
+
+        kwargs['event'] = event
+        kwargs['time'] = time.time()
+        self._file.write(json.dumps(kwargs, sort_keys=True) + '\n')
+        self._file.flush()
+
+
+def _is_handler(task):
+    return type(task).__name__ == 'Handler'
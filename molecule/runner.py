@@ -0,0 +1,539 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import collections
+import errno
+import io
+import os
+import pty
+import signal
+import subprocess
+import threading
+import tty
+
+try:
+    import selectors
+except ImportError:  # pragma: no cover
+    import selectors2 as selectors
+
+READ_SIZE = 65536
+# The bytes of streamed output kept for the ``stdout`` and ``stderr``
+# attributes, and for errors.
+TEE_SIZE = 65536
+# A partial line is handed out once it grows past this many bytes.
+LINE_SIZE = 65536
+
+_executables = {}
+# The commands which have not exited yet, see ``signal_running``.
+_running = set()
+# Reentrant, as ``signal_running`` may be called by a signal handler.
+_running_lock = threading.RLock()
+
+try:
+    string_types = basestring  # noqa
+except NameError:  # pragma: no cover
+    string_types = str
+
+
+class CommandNotFound(Exception):
+    """
+    Raised when an executable cannot be found in the PATH.
+    """
+
+
+class ErrorReturnCode(Exception):
+    """
+    Raised when a command exits with a non-zero exit code.
+    """
+
+    def __init__(self, full_cmd, exit_code, stdout=b'', stderr=b''):
+        self.full_cmd = full_cmd
+        self.exit_code = exit_code
+        self.stdout = stdout
+        self.stderr = stderr
+
+        msg = ('\n\n  RAN: {}\n\n  EXIT CODE: {}\n\n  STDOUT:\n{}\n\n  '
+               'STDERR:\n{}').format(full_cmd, exit_code,
+                                     _decode(stdout[-1000:]),
+                                     _decode(stderr[-1000:]))
+        super(ErrorReturnCode, self).__init__(msg)
+
+
+def which(name, path=None):
+    """
+    Resolve the given executable in the PATH and returns a string, or None
+    when it cannot be found.  Lookups are cached per PATH.
+
+    :param name: A string containing the name of the executable.
+    :param path: An optional string containing the PATH to search, defaults
+     to the PATH of the environment.
+    :return: str
+    """
+    if path is None:
+        path = os.environ.get('PATH', os.defpath)
+    key = (name, path)
+    if key in _executables:
+        return _executables[key]
+
+    executable = None
+    if os.path.dirname(name):
+        if _is_executable(name):
+            executable = os.path.abspath(name)
+    else:
+        for directory in path.split(os.pathsep):
+            candidate = os.path.join(directory, name)
+            if _is_executable(candidate):
+                executable = candidate
+                break
+
+    _executables[key] = executable
+
+    return executable
+
+
+def command(name):
+    """
+    Build a command executing the given executable and returns a Command.
+
+    :param name: A string containing the name of the executable.
+    :return: Command
+    """
+    path = which(name)
+    if path is None:
+        raise CommandNotFound(name)
+
+    return Command(path)
+
+
+def signal_running(sig):
+    """
+    Send the given signal to the process groups of the commands which have
+    not exited yet, and returns None.  Each command runs in a session of its
+    own, so signalling the process group of Molecule does not reach them.
+
+    :param sig: An int containing the signal.
+    :return: None
+    """
+    with _running_lock:
+        commands = list(_running)
+    for cmd in commands:
+        cmd.signal_group(sig)
+
+
+class Command(object):
+    """
+    An executable along with baked arguments and call options, baked and
+    called the way `sh`_ commands are.  Each call is a single `subprocess`
+    child, whose output is read through `selectors` by the calling thread, or
+    by one thread when running in the background.  Output is handed out a
+    batch of lines at a time, and only a bounded tail of streamed output is
+    kept in memory.
+
+    Options are passed as keyword arguments prefixed with an underscore:
+
+    ``_cwd``
+        The working directory.
+    ``_env``
+        A dict containing the environment.
+    ``_out`` and ``_err``
+        A callable receiving a string of one or more lines of output, or None
+        to capture the output in full.
+    ``_bg``
+        Return as soon as the command started.  The command runs in a
+        session of its own, so the signals of the terminal do not reach it;
+        use the returned :class:`.RunningCommand` as a context manager to
+        terminate it when the block polling it raises.
+    ``_tee``
+        The bytes of streamed or spooled output to keep, defaults to
+        ``TEE_SIZE``.
+    ``_spool``
+        A filename stdout is written to as it is read, so only the tail of
+        captured output is kept in memory.  See :class:`.Output`.
+    ``_tty_out``
+        Attach stdout to a pseudo-terminal, so commands keep colors and line
+        buffering, defaults to True.
+
+    .. _`sh`: https://amoffat.github.io/sh/
+    """
+
+    def __init__(self, path, args=None, call_args=None):
+        self._path = path
+        self._args = list(args or [])
+        self._call_args = dict(call_args or {})
+
+    def __str__(self):
+        return ' '.join([self._path] + self._args)
+
+    def __eq__(self, other):
+        return str(self) == str(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(str(self))
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def args(self):
+        return list(self._args)
+
+    @property
+    def env(self):
+        return self._call_args.get('env')
+
+    @property
+    def call_args(self):
+        return dict(self._call_args)
+
+    def bake(self, *args, **kwargs):
+        """
+        Bake the given arguments and options into a new command and returns a
+        Command.  Lists are flattened and dicts are converted into options,
+        the same as keyword arguments not prefixed with an underscore.
+
+        :return: Command
+        """
+        call_args, kwargs = _split_call_args(kwargs)
+        merged = dict(self._call_args)
+        merged.update(call_args)
+
+        return Command(self._path, self._args + _compile_args(args, kwargs),
+                       merged)
+
+    def __call__(self, *args, **kwargs):
+        """
+        Execute the command and returns a RunningCommand.  Unless running in
+        the background, waits for the command to exit, and raises
+        ErrorReturnCode when it exits with a non-zero exit code.
+
+        :return: RunningCommand
+        """
+        cmd = self.bake(*args, **kwargs)
+        running = RunningCommand(cmd)
+        if not cmd._call_args.get('bg'):
+            running.wait()
+
+        return running
+
+
+class RunningCommand(object):
+    """
+    A started command.
+    """
+
+    def __init__(self, cmd):
+        call_args = cmd.call_args
+        self._cmd = cmd
+        tee = call_args.get('tee', TEE_SIZE)
+        spool = call_args.get('spool')
+        out, err = call_args.get('out'), call_args.get('err')
+        self._out = _Stream(
+            out,
+            tee if out is not None or spool else None,
+            open(spool, 'wb') if spool else None)
+        self._err = _Stream(err, tee if err is not None or spool else None)
+        self._exit_code = None
+        self._thread = None
+
+        self._process, fds = _spawn(cmd, call_args.get('tty_out', True))
+        self._fds = {fds[0]: self._out, fds[1]: self._err}
+        with _running_lock:
+            _running.add(self)
+        if call_args.get('bg'):
+            self._thread = threading.Thread(target=self._pump)
+            self._thread.daemon = True
+            self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # Interrupted while the command runs in the background, so it is
+        # terminated rather than left running.
+        if exc_type is not None:
+            self.signal_group(signal.SIGTERM)
+            if self._thread is not None:
+                self._thread.join()
+
+    @property
+    def pid(self):
+        return self._process.pid
+
+    @property
+    def exit_code(self):
+        return self._exit_code
+
+    @property
+    def stdout(self):
+        return self._out.value
+
+    @property
+    def stderr(self):
+        return self._err.value
+
+    def is_alive(self):
+        return self._process.poll() is None
+
+    def wait(self):
+        """
+        Wait for the command to exit and returns the RunningCommand.  Raises
+        ErrorReturnCode when it exits with a non-zero exit code.
+
+        :return: RunningCommand
+        """
+        if self._thread is not None:
+            self._thread.join()
+        elif self._exit_code is None:
+            self._pump()
+
+        if self._exit_code:
+            raise ErrorReturnCode(
+                str(self._cmd), self._exit_code, self.stdout, self.stderr)
+
+        return self
+
+    def signal(self, sig):
+        self._process.send_signal(sig)
+
+    def signal_group(self, sig):
+        """
+        Send the given signal to the process group of the command, which
+        includes the processes it forked, and returns None.
+
+        :param sig: An int containing the signal.
+        :return: None
+        """
+        try:
+            os.killpg(self._process.pid, sig)
+        except OSError as e:
+            if e.errno != errno.ESRCH:
+                raise
+
+    def _pump(self):
+        sel = selectors.DefaultSelector()
+        try:
+            for fd, stream in self._fds.items():
+                sel.register(fd, selectors.EVENT_READ, stream)
+            while sel.get_map():
+                for key, _ in sel.select():
+                    data = _read(key.fd)
+                    if data:
+                        key.data.feed(data)
+                    else:
+                        sel.unregister(key.fd)
+                        os.close(key.fd)
+                        key.data.close()
+        except BaseException:
+            # Interrupted, or a callable raised, so the command is terminated
+            # rather than waited for.
+            self.signal_group(signal.SIGTERM)
+            raise
+        finally:
+            for key in list(sel.get_map().values()):
+                os.close(key.fd)
+                key.data.close()
+            sel.close()
+            self._exit_code = self._process.wait()
+            with _running_lock:
+                _running.discard(self)
+
+
+class Output(object):
+    """
+    Output captured to a log file, which is iterated over a line at a time,
+    rather than read into memory.
+    """
+
+    def __init__(self, filename):
+        self._filename = filename
+
+    @property
+    def filename(self):
+        return self._filename
+
+    def __iter__(self):
+        with io.open(
+                self._filename, encoding='utf-8', errors='replace') as f:
+            for line in f:
+                yield line
+
+
+class _Stream(object):
+    """
+    Splits output into batches of lines for a callable, writes it to a spool
+    file, and keeps the output, or the tail of it when bounded.
+    """
+
+    def __init__(self, callback, tee, spool=None):
+        self._callback = callback
+        self._tee = tee
+        self._spool = spool
+        self._partial = b''
+        self._chunks = collections.deque()
+        self._size = 0
+
+    @property
+    def value(self):
+        value = b''.join(self._chunks)
+        if self._tee is not None:
+            return value[-self._tee:] if self._tee else b''
+
+        return value
+
+    def feed(self, data):
+        self._keep(data)
+        if self._spool is not None:
+            self._spool.write(data)
+        if self._callback is None:
+            return
+
+        data = self._partial + data
+        end = data.rfind(b'\n') + 1
+        if not end and len(data) > LINE_SIZE:
+            end = len(data)
+        self._partial = data[end:]
+        if end:
+            self._callback(_decode(data[:end]))
+
+    def close(self):
+        if self._callback is not None and self._partial:
+            self._callback(_decode(self._partial))
+        self._partial = b''
+        if self._spool is not None:
+            self._spool.close()
+
+    def _keep(self, data):
+        self._chunks.append(data)
+        self._size += len(data)
+        if self._tee is None:
+            return
+        while self._chunks and self._size - len(self._chunks[0]) >= self._tee:
+            self._size -= len(self._chunks.popleft())
+
+
+def _spawn(cmd, tty_out):
+    call_args = cmd.call_args
+    if tty_out:
+        out_fd, child_out = pty.openpty()
+        # Raw mode, so newlines are not translated to carriage returns.
+        tty.setraw(child_out)
+    else:
+        out_fd, child_out = os.pipe()
+    err_fd, child_err = os.pipe()
+
+    try:
+        with open(os.devnull, 'rb') as devnull:
+            process = subprocess.Popen(
+                [cmd.path] + cmd.args,
+                stdin=devnull,
+                stdout=child_out,
+                stderr=child_err,
+                cwd=call_args.get('cwd'),
+                env=call_args.get('env'),
+                close_fds=True,
+                # A session of its own, so the command can be signalled
+                # along with the processes it forks.
+                preexec_fn=os.setsid)
+    except BaseException:
+        os.close(out_fd)
+        os.close(err_fd)
+        raise
+    finally:
+        os.close(child_out)
+        os.close(child_err)
+
+    return process, (out_fd, err_fd)
+
+
+def _read(fd):
+    try:
+        return os.read(fd, READ_SIZE)
+    except OSError as e:
+        # Reading a pseudo-terminal whose other end was closed fails with
+        # EIO, rather than returning EOF.
+        if e.errno == errno.EIO:
+            return b''
+        raise
+
+
+def _split_call_args(kwargs):
+    call_args = {}
+    options = {}
+    for k, v in kwargs.items():
+        if k.startswith('_'):
+            call_args[k[1:]] = v
+        else:
+            options[k] = v
+
+    return call_args, options
+
+
+def _compile_args(args, kwargs):
+    compiled = []
+    for arg in args:
+        if isinstance(arg, (list, tuple)):
+            compiled.extend(_to_str(a) for a in arg)
+        elif isinstance(arg, dict):
+            compiled.extend(_compile_options(arg, raw=True))
+        else:
+            compiled.append(_to_str(arg))
+    compiled.extend(_compile_options(kwargs))
+
+    return compiled
+
+
+def _compile_options(options, raw=False):
+    compiled = []
+    for k, v in options.items():
+        if len(k) == 1:
+            if v is not False:
+                compiled.append('-{}'.format(k))
+                if v is not True:
+                    compiled.append(_to_str(v))
+        else:
+            if not raw:
+                k = k.replace('_', '-')
+            if v is True:
+                compiled.append('--{}'.format(k))
+            elif v is not False:
+                compiled.append('--{}={}'.format(k, _to_str(v)))
+
+    return compiled
+
+
+def _to_str(value):
+    if isinstance(value, bytes) and not isinstance(value, str):
+        return value.decode('utf-8')
+    if isinstance(value, string_types):
+        return value
+
+    return str(value)
+
+
+def _decode(data):
+    return data.decode('utf-8', 'replace')
+
+
+def _is_executable(path):
+    return os.path.isfile(path) and os.access(path, os.X_OK)
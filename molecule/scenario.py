@@ -21,6 +21,8 @@
 import os
 
 from molecule import logger
+from molecule import scheduler
+from molecule import util
 
 LOG = logger.get_logger(__name__)
 
@@ -40,6 +42,7 @@ class Scenario(object):
 
         scenario:
           name: default
+          scheduler: linear
           converge_sequence:
             - create
             - converge
@@ -51,6 +54,20 @@ class Scenario(object):
             - verify
             - destroy
 
+    The steps of a sequence are executed one after another by the `linear`
+    scheduler.  The `graph` scheduler executes each step as soon as the steps
+    it depends on completed, so `dependency`, `syntax` and `lint`, which do not
+    need the instances, overlap `create`.  Steps acting on instances keep the
+    order of the sequence, and `converge` waits for both `create` and
+    `dependency`.  No step overlaps a `destroy`, which prunes the ephemeral
+    directory.
+
+    .. code-block:: yaml
+
+        scenario:
+          name: default
+          scheduler: graph
+
     A good source of examples are the `scenario`_ functional tests.
 
     .. important::
@@ -80,6 +97,22 @@ class Scenario(object):
     def directory(self):
         return os.path.dirname(self._config.molecule_file)
 
+    @property
+    def scheduler(self):
+        """
+        How the steps of a sequence are executed and returns a string.
+
+        :return: str
+        """
+        name = self._config.config['scenario'].get('scheduler', 'linear')
+        if name not in scheduler.SCHEDULERS:
+            msg = ("Invalid scenario scheduler '{}'.  Valid schedulers are: "
+                   '{}.').format(name, ', '.join(
+                       "'{}'".format(s) for s in scheduler.SCHEDULERS))
+            util.sysexit_with_message(msg)
+
+        return name
+
     @property
     def check_sequence(self):
         return self._config.config['scenario']['check_sequence']
@@ -0,0 +1,142 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+
+import collections
+import threading
+
+try:
+    import queue
+except ImportError:  # pragma: no cover
+    import Queue as queue
+
+SCHEDULERS = ['linear', 'graph']
+
+# Steps which neither need nor change the instances, and are free to overlap
+# the steps which do.  Every other step waits for the instance step before it
+# in the sequence.
+STANDALONE = ['dependency', 'lint', 'syntax']
+
+# Steps which change the scenario's ephemeral directory, and neither overlap
+# the steps before them nor the steps after them.
+BARRIERS = ['destroy']
+
+# The steps each step waits for, when they precede it in the sequence.
+PREREQUISITES = {
+    'converge': ['create', 'dependency'],
+    'lint': ['dependency'],
+    'syntax': ['dependency'],
+}
+
+Step = collections.namedtuple('Step', ['index', 'name', 'requires'])
+
+
+def graph(sequence):
+    """
+    Build the dependency graph of the given sequence and returns a list of
+    Steps, each with the indexes of the steps it waits for.
+
+    A step waits for the latest occurrence of each of its prerequisites
+    earlier in the sequence.  Steps acting on instances also wait for the
+    instance step before them, so they keep the order of the sequence.
+    Every step waits for the barrier step before it, and a barrier step waits
+    for every step since the previous one.
+
+    :param sequence: A list containing the names of the steps.
+    :return: list
+    """
+    steps = []
+    latest = {}
+    previous = None
+    barrier = None
+    for index, name in enumerate(sequence):
+        requires = set(latest[p] for p in PREREQUISITES.get(name, [])
+                       if p in latest)
+        if barrier is not None:
+            requires.add(barrier)
+        if name in BARRIERS:
+            start = 0 if barrier is None else barrier
+            requires.update(range(start, index))
+            barrier = index
+        if name not in STANDALONE:
+            if previous is not None:
+                requires.add(previous)
+            previous = index
+
+        steps.append(Step(index, name, sorted(requires)))
+        latest[name] = index
+
+    return steps
+
+
+def execute(sequence, func):
+    """
+    Execute the given function with the name of each step of the sequence,
+    each in a thread of its own as soon as the steps it waits for completed,
+    and returns None.
+
+    When a step fails, no further step is started, and the first failure is
+    raised once the running steps completed.
+
+    :param sequence: A list containing the names of the steps.
+    :param func: A callable taking the name of a step.
+    :return: None
+    """
+    pending = graph(sequence)
+    completed = queue.Queue()
+    running = {}
+    done = set()
+    failure = None
+
+    while pending or running:
+        if failure is None:
+            ready = [s for s in pending if done.issuperset(s.requires)]
+            for step in ready:
+                pending.remove(step)
+                running[step.index] = _start(func, step, completed)
+
+        if not running:
+            break
+
+        index, e = completed.get()
+        running.pop(index).join()
+        if e is not None:
+            failure = failure or e
+        else:
+            done.add(index)
+
+    if failure is not None:
+        raise failure
+
+
+def _start(func, step, completed):
+    def run():
+        try:
+            func(step.name)
+        except BaseException as e:
+            completed.put((step.index, e))
+        else:
+            completed.put((step.index, None))
+
+    t = threading.Thread(target=run, name=step.name)
+    t.daemon = True
+    t.start()
+
+    return t
@@ -62,6 +62,8 @@ main.add_command(command.init.init)
 main.add_command(command.lint.lint)
 main.add_command(command.list.list)
 main.add_command(command.login.login)
+main.add_command(command.prune.prune)
+main.add_command(command.restore.restore)
 main.add_command(command.syntax.syntax)
 main.add_command(command.test.test)
 main.add_command(command.verify.verify)
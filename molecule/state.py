@@ -18,7 +18,11 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import contextlib
+import copy
+import fcntl
 import os
+import threading
 
 from molecule import logger
 from molecule import util
@@ -27,7 +31,18 @@ LOG = logger.get_logger(__name__)
 VALID_KEYS = [
     'created',
     'converged',
+    'converged_fingerprint',
     'driver',
+    'idempotent_fingerprint',
+]
+INSTANCE_VALID_KEYS = [
+    'created',
+    'created_at',
+    'converged',
+    'definition',
+    'platform',
+    'snapshot',
+    'snapshot_fingerprint',
 ]
 
 
@@ -49,6 +64,14 @@ class State(object):
     State is not a top level option in Molecule's config.  It's purpose is for
     bookkeeping, and each Config_ object has a reference to a State_ object.
 
+    The state file is replaced atomically, and every change is made while
+    holding an advisory lock on `state.yml.lock`, so concurrent Molecule
+    processes operating on the same scenario serialize their changes.  Reads
+    are served from memory, and the file is only parsed again when another
+    process has replaced it.  Several changes can be batched into a single
+    write with :func:`.State.transaction`.  Threads of one process, such as
+    steps executing concurrently, serialize their transactions as well.
+
     .. note::
 
         Currently, it's use is significantly smaller than it was in v1 of
@@ -64,13 +87,21 @@ class State(object):
         """
         self._config = config
         self._state_file = self._get_state_file()
-        self._data = self._get_data()
-        self._write_state_file()
+        self._lock_file = self._get_lock_file()
+        self._stamp = None
+        # Transactions are per thread, and threads hold the reentrant lock
+        # across them, so one thread's transaction does not unlock another.
+        self._local = threading.local()
+        self._thread_lock = threading.RLock()
+        with self._lock():
+            self._data = self._get_data()
+            if self._stamp is None:
+                self._write_state_file()
 
     def marshal(func):
         def wrapper(self, *args, **kwargs):
-            func(self, *args, **kwargs)
-            self._write_state_file()
+            with self.transaction():
+                func(self, *args, **kwargs)
 
         return wrapper
 
@@ -78,17 +109,70 @@ class State(object):
     def state_file(self):
         return self._state_file
 
+    @property
+    def lock_file(self):
+        return self._lock_file
+
     @property
     def converged(self):
-        return self._data.get('converged')
+        return self._get_current_data().get('converged')
+
+    @property
+    def converged_fingerprint(self):
+        return self._get_current_data().get('converged_fingerprint')
 
     @property
     def created(self):
-        return self._data.get('created')
+        return self._get_current_data().get('created')
 
     @property
     def driver(self):
-        return self._data.get('driver')
+        return self._get_current_data().get('driver')
+
+    @property
+    def idempotent_fingerprint(self):
+        return self._get_current_data().get('idempotent_fingerprint')
+
+    @property
+    def instances(self):
+        return self._get_current_data().get('instances') or {}
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Batch the changes made inside the block into a single write, while
+        holding the state file's lock, and returns None.  Changes are rolled
+        back when the block raises.  Nested transactions join the outermost
+        one.
+
+        .. code-block:: python
+
+            with config.state.transaction():
+                config.state.change_state('created', True)
+                config.state.change_state('driver', 'docker')
+
+        :return: None
+        """
+        if self._in_transaction:
+            yield
+            return
+
+        with self._thread_lock, self._lock():
+            self._refresh()
+            data = copy.deepcopy(self._data)
+            self._local.in_transaction = True
+            try:
+                yield
+            except BaseException:
+                self._data = data
+                raise
+            finally:
+                self._local.in_transaction = False
+            self._write_state_file()
+
+        # The driver is resolved from the state file, so the config must
+        # rebuild it on next access.
+        self._config.invalidate('driver')
 
     @marshal
     def reset(self):
@@ -110,23 +194,95 @@ class State(object):
             raise InvalidState
         self._data[key] = value
 
+    @marshal
+    def change_instance_state(self, instance_name, key, value):
+        """
+        Changes the state of the given instance with the given ``key`` and
+        the provided ``value``.
+
+        :param instance_name: A ``str`` containing the instance to update
+        :param key: A ``str`` containing the key to update
+        :param value: A value to change the ``key`` to
+        :return: None
+        """
+        if key not in INSTANCE_VALID_KEYS:
+            raise InvalidState
+        instances = self._data.setdefault('instances', {})
+        instances.setdefault(instance_name, {})[key] = value
+
+    @marshal
+    def remove_instance(self, instance_name):
+        """
+        Removes the given instance from the state and returns None.
+
+        :param instance_name: A ``str`` containing the instance to remove
+        :return: None
+        """
+        self._data.get('instances', {}).pop(instance_name, None)
+
     def _get_data(self):
         if os.path.isfile(self.state_file):
             return self._load_file()
         return self._default_data()
 
+    @property
+    def _in_transaction(self):
+        return getattr(self._local, 'in_transaction', False)
+
+    def _get_current_data(self):
+        if not self._in_transaction:
+            with self._thread_lock:
+                self._refresh()
+
+        return self._data
+
+    def _refresh(self):
+        """
+        Reload the state file when it was replaced since it was last read or
+        written and returns None.
+
+        :return: None
+        """
+        stamp = self._get_stamp()
+        if stamp is not None and stamp != self._stamp:
+            self._data = self._load_file()
+
     def _default_data(self):
         return {
             'converged': False,
             'created': False,
             'driver': None,
+            'instances': {},
         }
 
     def _load_file(self):
-        return util.safe_load_file(self.state_file)
+        # Stamped before reading, so a file replaced meanwhile is read again
+        # on the next refresh, rather than taken for the data read.
+        stamp = self._get_stamp()
+        data = util.safe_load_file(self.state_file)
+        self._stamp = stamp
+
+        return data
 
     def _write_state_file(self):
         util.write_file(self.state_file, util.safe_dump(self._data))
+        self._stamp = self._get_stamp()
+
+    def _get_stamp(self):
+        return util.file_stamp(self.state_file)
+
+    @contextlib.contextmanager
+    def _lock(self):
+        with open(self.lock_file, 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
 
     def _get_state_file(self):
         return os.path.join(self._config.ephemeral_directory, 'state.yml')
+
+    def _get_lock_file(self):
+        return os.path.join(self._config.ephemeral_directory,
+                            'state.yml.lock')
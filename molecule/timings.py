@@ -0,0 +1,191 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+from __future__ import print_function
+
+import collections
+import json
+import os
+
+import tabulate
+
+from molecule import events
+from molecule import logger
+from molecule import util
+
+LOG = logger.get_logger(__name__)
+
+TOP = 10
+
+
+class Timings(object):
+    """
+    A class which records the wall-clock time of every task and handler, by
+    host and role, of the playbook runs of a scenario.
+
+    The results are written to `timings.json` in the ephemeral directory,
+    with an entry per step, so a slow task added to a role shows up in the
+    summary printed after `molecule converge` and `molecule test`.  The
+    timings are reset when a sequence starts, so the summary only holds the
+    steps of the current run.
+
+    .. code-block:: json
+
+        {
+          "converge": {
+            "duration": 42.1,
+            "hosts": {"instance-1-default": 42.1},
+            "roles": {"foo": 40.3},
+            "tasks": [
+              {
+                "duration": 30.2,
+                "handler": false,
+                "host": "instance-1-default",
+                "path": "/path/to/roles/foo/tasks/main.yml:1",
+                "role": "foo",
+                "task": "foo : apt update"
+              }
+            ]
+          }
+        }
+    """
+
+    def __init__(self, config):
+        """
+        Initialize a new timings class and returns None.
+
+        :param config: An instance of a Molecule config.
+        :return: None
+        """
+        self._config = config
+
+    @property
+    def timings_file(self):
+        return os.path.join(self._config.ephemeral_directory, 'timings.json')
+
+    @property
+    def data(self):
+        """
+        The recorded timings and returns a dict.
+
+        :return: dict
+        """
+        try:
+            with open(self.timings_file, 'r') as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def reset(self):
+        """
+        Remove the recorded timings and returns None.
+
+        :return: None
+        """
+        if os.path.isfile(self.timings_file):
+            os.remove(self.timings_file)
+
+    def record(self, step, event_list):
+        """
+        Record the timings of the results in the given events as the given
+        step, replacing the previous timings of the step, and returns None.
+
+        :param step: A string containing the name of the step.
+        :param event_list: A list of events of the step's playbook run.
+        :return: None
+        """
+        tasks = []
+        hosts = collections.defaultdict(float)
+        roles = collections.defaultdict(float)
+        for result in events.results(event_list):
+            duration = result.get('duration', 0)
+            tasks.append({
+                'task': result.get('task'),
+                'role': result.get('role'),
+                'host': result.get('host'),
+                'handler': result.get('handler', False),
+                'path': result.get('path'),
+                'duration': duration,
+            })
+            hosts[result.get('host')] += duration
+            if result.get('role'):
+                roles[result['role']] += duration
+
+        data = self.data
+        data[step] = {
+            'duration': _duration(event_list),
+            'hosts': dict(hosts),
+            'roles': dict(roles),
+            'tasks': tasks,
+        }
+        util.atomic_write(self.timings_file,
+                          json.dumps(data, indent=2, sort_keys=True))
+
+    def slowest(self, top=TOP):
+        """
+        The slowest task results across all steps and returns a list of dicts,
+        each with the step it was recorded in.
+
+        :param top: An optional int containing the number of results.
+        :return: list
+        """
+        tasks = [
+            dict(task, step=step)
+            for step, d in sorted(self.data.items())
+            for task in d.get('tasks', [])
+        ]
+
+        return sorted(tasks, key=lambda t: t['duration'], reverse=True)[:top]
+
+    def print_summary(self, top=TOP):
+        """
+        Print the slowest task results and returns None.
+
+        :param top: An optional int containing the number of results.
+        :return: None
+        """
+        tasks = self.slowest(top)
+        if not tasks:
+            return
+
+        msg = 'Slowest tasks of scenario: [{}]'.format(
+            self._config.scenario.name)
+        LOG.info(msg)
+
+        headers = ['Step', 'Host', 'Role', 'Task', 'Duration']
+        data = [[
+            t['step'], t['host'], t['role'] or '', t['task'],
+            '{:.2f}s'.format(t['duration'])
+        ] for t in tasks]
+        print(tabulate.tabulate(data, headers, tablefmt='simple'))
+
+
+def _duration(event_list):
+    """
+    The wall-clock time from the first to the last event and returns a float.
+
+    :param event_list: A list of events.
+    :return: float
+    """
+    times = [event['time'] for event in event_list if 'time' in event]
+    if not times:
+        return 0
+
+    return round(max(times) - min(times), 6)
@@ -20,11 +20,14 @@
 
 from __future__ import print_function
 
+import errno
 import fnmatch
 import jinja2
 import os
 import re
+import shutil
 import sys
+import tempfile
 
 import colorama
 import yaml
@@ -32,9 +35,22 @@ import yaml
 from molecule import logger
 
 LOG = logger.get_logger(__name__)
+MOLECULE_HEADER = '# Molecule managed\n\n'
+# The process umask, read once, since reading it requires setting it.
+UMASK = os.umask(0)
+os.umask(UMASK)
 
 colorama.init(autoreset=True)
 
+# Prefer the libyaml bindings, which parse and emit the same documents as the
+# pure Python implementation at a fraction of the cost.
+try:
+    YAML_LOADER = yaml.CSafeLoader
+    YAML_DUMPER = yaml.CSafeDumper
+except AttributeError:  # pragma: no cover
+    YAML_LOADER = yaml.SafeLoader
+    YAML_DUMPER = yaml.SafeDumper
+
 
 def print_debug(title, data):
     title = 'DEBUG: {}'.format(title)
@@ -73,20 +89,20 @@ def sysexit_with_message(msg, code=1):
     sysexit(code)
 
 
-def run_command(cmd, debug=False):
+def run_command(cmd, debug=False, **kwargs):
     """
     Execute the given command and returns None.
 
-    :param cmd: A `sh.Command` object to execute.
+    :param cmd: A `runner.Command` object to execute.
     :param debug: An optional bool to toggle debug output.
-    :return: ``sh`` object
+    :param kwargs: Optional special keyword arguments passed to the call,
+     such as ``_bg``.
+    :return: ``runner.RunningCommand`` object
     """
     if debug:
-        # WARN(retr0h): Uses an internal ``sh`` data structure to dig
-        # the environment out of the ``sh.command`` object.
-        print_environment_vars(cmd._partial_call_args.get('env', {}))
+        print_environment_vars(cmd.env or {})
         print_debug('COMMAND', str(cmd))
-    return cmd()
+    return cmd(**kwargs)
 
 
 def os_walk(directory, pattern):
@@ -98,6 +114,20 @@ def os_walk(directory, pattern):
                 yield filename
 
 
+def cache_directory(*paths):
+    """
+    Build a path inside Molecule's user cache and returns a string.  The cache
+    lives in `$XDG_CACHE_HOME/molecule`, which defaults to `~/.cache/molecule`.
+
+    :param paths: An optional list of path components to append.
+    :return: str
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+
+    return os.path.join(cache_home, 'molecule', *paths)
+
+
 def render_template(template, **kwargs):
     t = jinja2.Environment()
     t = t.from_string(template)
@@ -107,16 +137,106 @@ def render_template(template, **kwargs):
 
 def write_file(filename, content):
     """
-    Writes a file with the given filename and content and returns None.
+    Writes a file with the given filename and content, prefixed with an
+    informational header, and returns a bool.
+
+    The file is only written when the rendered content differs from what is
+    on disk, so unchanged artifacts keep their modification time.  The file
+    is replaced atomically.
+
+    :param filename: A string containing the target filename.
+    :param content: A string containing the data to be written.
+    :return: bool
+    """
+    content = MOLECULE_HEADER + content
+    if _read_file(filename) == content:
+        return False
+
+    atomic_write(filename, content)
+
+    return True
+
+
+def atomic_write(filename, content, mode=None):
+    """
+    Writes the content to a temporary file in the target's directory, then
+    renames it over the target, and returns None.  Readers never observe a
+    partially written file.
 
     :param filename: A string containing the target filename.
     :param content: A string containing the data to be written.
+    :param mode: An optional int containing the permissions of the file,
+     which default to those of a file created under the umask.
     :return: None
     """
-    with open(filename, 'w') as f:
-        f.write(content)
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, tmp = tempfile.mkstemp(
+        dir=directory, prefix='.{}.'.format(os.path.basename(filename)))
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(content)
+        os.chmod(tmp, 0o666 & ~UMASK if mode is None else mode)
+        os.rename(tmp, filename)
+    except Exception:
+        os.remove(tmp)
+        raise
+
+
+def file_stamp(filename):
+    """
+    Identify the current version of the file and returns a tuple, or None
+    when the file does not exist.  Files written with ``atomic_write`` are
+    replaced, so the inode changes along with the modification time.
+
+    :param filename: A string containing the filename.
+    :return: tuple
+    """
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return
+
+    return (st.st_ino, st.st_mtime, st.st_size)
+
+
+def makedirs(path):
+    """
+    Create the directory along with its parents, unless it exists, and
+    returns None.  Processes creating it concurrently do not fail.
+
+    :param path: A string containing the path of the directory.
+    :return: None
+    """
+    try:
+        os.makedirs(path)
+    except OSError as e:
+        if e.errno != errno.EEXIST or not os.path.isdir(path):
+            raise
+
+
+def link_or_copy(source, destination):
+    """
+    Hard link the source file to the destination, or copy it when the
+    destination is on another filesystem, creating the destination's
+    directory, and returns None.
+
+    :param source: A string containing the source filename.
+    :param destination: A string containing the destination filename.
+    :return: None
+    """
+    makedirs(os.path.dirname(destination))
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
 
-    file_prepender(filename)
+def _read_file(filename):
+    try:
+        with open(filename, 'r') as f:
+            return f.read()
+    except (IOError, OSError):
+        return
 
 
 def file_prepender(filename):
@@ -127,11 +247,10 @@ def file_prepender(filename):
     :param filename: A string containing the target filename.
     :return: None
     """
-    molecule_header = '# Molecule managed\n\n'
     with open(filename, 'r+') as f:
         content = f.read()
         f.seek(0, 0)
-        f.write(molecule_header + content)
+        f.write(MOLECULE_HEADER + content)
 
 
 def safe_dump(data):
@@ -144,7 +263,11 @@ def safe_dump(data):
     # TODO(retr0h): Do we need to encode?
     # yaml.dump(data) produces the document as a str object in both python
     # 2 and 3.
-    return yaml.safe_dump(data, default_flow_style=False, explicit_start=True)
+    return yaml.dump(
+        data,
+        Dumper=YAML_DUMPER,
+        default_flow_style=False,
+        explicit_start=True)
 
 
 def safe_load(string):
@@ -154,7 +277,7 @@ def safe_load(string):
     :param string: A string to be parsed.
     :return: dict
     """
-    return yaml.safe_load(string) or {}
+    return yaml.load(string, Loader=YAML_LOADER) or {}
 
 
 def safe_load_file(filename):
@@ -20,9 +20,8 @@
 
 import os
 
-import sh
-
 from molecule import logger
+from molecule import runner
 from molecule import util
 from molecule.verifier import base
 
@@ -77,7 +76,7 @@ class Flake8(base.Base):
 
         :return: None
         """
-        self._flake8_command = sh.flake8.bake(
+        self._flake8_command = runner.command('flake8').bake(
             self.default_options,
             self._tests,
             _env=self.env,
@@ -100,7 +99,7 @@ class Flake8(base.Base):
         try:
             util.run_command(
                 self._flake8_command, debug=self._config.args.get('debug'))
-        except sh.ErrorReturnCode as e:
+        except runner.ErrorReturnCode as e:
             util.sysexit(e.exit_code)
 
     def _get_tests(self):
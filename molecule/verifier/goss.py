@@ -111,7 +111,7 @@ class Goss(base.Base):
         LOG.info(msg)
 
         goss_playbook = os.path.join(self.directory, 'test_default.yml')
-        self._config.provisioner.converge(goss_playbook)
+        self._config.provisioner.converge(goss_playbook, step='verify')
 
         LOG.success('Verifier completed successfully.')
 
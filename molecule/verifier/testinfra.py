@@ -20,9 +20,8 @@
 
 import os
 
-import sh
-
 from molecule import logger
+from molecule import runner
 from molecule import util
 from molecule.verifier import base
 from molecule.verifier import flake8
@@ -122,7 +121,7 @@ class Testinfra(base.Base):
         options = self.options
         verbose_flag = util.verbose_flag(options)
 
-        self._testinfra_command = sh.testinfra.bake(
+        self._testinfra_command = runner.command('testinfra').bake(
             options,
             self._tests,
             *verbose_flag,
@@ -160,7 +159,7 @@ class Testinfra(base.Base):
                 self._testinfra_command, debug=self._config.args.get('debug'))
             LOG.success('Verifier completed successfully.')
 
-        except sh.ErrorReturnCode as e:
+        except runner.ErrorReturnCode as e:
             util.sysexit(e.exit_code)
 
     def _get_tests(self):
@@ -0,0 +1,70 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+from __future__ import print_function
+
+import timeit
+
+import pytest
+
+REPEAT = 3
+
+
+@pytest.fixture(autouse=True)
+def molecule_cache_home(tmpdir, monkeypatch):
+    path = tmpdir.join('.cache').strpath
+    monkeypatch.setenv('XDG_CACHE_HOME', path)
+
+    return path
+
+
+@pytest.helpers.register
+def benchmark(func, number=1, repeat=REPEAT):
+    """
+    Time the given callable and returns the best run in seconds.
+
+    :param func: A callable to time.
+    :param number: An optional int containing the calls per run.
+    :param repeat: An optional int containing the number of runs.
+    :return: float
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+@pytest.helpers.register
+def print_benchmarks(title, headers, results):
+    """
+    Print a table comparing a baseline with a candidate implementation and
+    returns None.
+
+    :param title: A string containing the title of the table.
+    :param headers: A tuple containing the names of the baseline and the
+     candidate implementations.
+    :param results: A list of (operation, baseline seconds, candidate seconds)
+     tuples.
+    :return: None
+    """
+    row = '  {:<24} {:>14} {:>14} {:>9}'
+    print('\n{}'.format(title))
+    print(row.format('', headers[0], headers[1], 'speedup'))
+    for operation, baseline, candidate in results:
+        print(
+            row.format(operation, '{:.4f}s'.format(baseline), '{:.4f}s'.format(
+                candidate), '{:.2f}x'.format(baseline / candidate)))
@@ -0,0 +1,88 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+
+import mock
+import pytest
+
+from molecule import config
+from molecule import util
+from molecule.driver import ec2
+
+INSTANCES = 500
+
+
+@pytest.fixture
+def ec2_config(tmpdir):
+    scenario_directory = os.path.join(
+        config.molecule_directory(tmpdir.strpath), 'default')
+    os.makedirs(config.molecule_ephemeral_directory(scenario_directory))
+    molecule_file = config.molecule_file(scenario_directory)
+    platforms = [{
+        'name': 'instance-{}'.format(i),
+        'groups': ['web', 'db'],
+    } for i in range(INSTANCES)]
+    util.write_file(molecule_file,
+                    util.safe_dump({
+                        'driver': {
+                            'name': 'ec2'
+                        },
+                        'platforms': platforms,
+                    }))
+
+    c = config.Config(molecule_file)
+    util.write_file(c.driver.instance_config,
+                    util.safe_dump([{
+                        'instance': 'instance-{}-default'.format(i),
+                        'instance_ids': ['i-{:017x}'.format(i)],
+                        'address': '10.0.{}.{}'.format(i // 256, i % 256),
+                        'user': 'molecule',
+                        'port': 22,
+                        'identity_file': '/tmp/molecule/ssh_key',
+                    } for i in range(INSTANCES)]))
+
+    return c
+
+
+def _scan_instance_config(self, instance_name):
+    instance_config_dict = util.safe_load_file(self.instance_config)
+
+    return next(item for item in instance_config_dict
+                if item['instance'] == instance_name)
+
+
+def test_instance_config_index_inventory(ec2_config):
+    inventories = []
+
+    def inventory():
+        ec2_config.invalidate('driver')
+        inventories.append(ec2_config.provisioner.inventory)
+
+    with mock.patch.object(ec2.Ec2, '_get_instance_config',
+                           _scan_instance_config):
+        baseline = pytest.helpers.benchmark(inventory, repeat=1)
+    candidate = pytest.helpers.benchmark(inventory)
+
+    assert inventories[0] == inventories[-1]
+
+    pytest.helpers.print_benchmarks(
+        '{} instance inventory'.format(INSTANCES), ('scan', 'index'),
+        [('inventory', baseline, candidate)])
@@ -0,0 +1,84 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+from __future__ import print_function
+
+import logging
+import os
+
+import pytest
+import sh
+
+from molecule import logger
+from molecule import runner
+
+LINES = 1000000
+
+
+@pytest.fixture
+def playbook_output(tmpdir):
+    path = os.path.join(tmpdir.strpath, 'output.log')
+    with open(path, 'w') as f:
+        for i in range(LINES // 4):
+            f.write('TASK [role : task {}] {}\n'.format(i, '*' * 40))
+            f.write('changed: [instance-{}-default]\n'.format(i % 100))
+            f.write('ok: [instance-{}-default]\n'.format(i % 100 + 1))
+            f.write('\n')
+
+    return path
+
+
+@pytest.fixture
+def log(request):
+    # The stacked handlers of Molecule's logger, writing to /dev/null rather
+    # than the terminal, on a logger pytest does not capture.
+    devnull = open(os.devnull, 'w')
+    request.addfinalizer(devnull.close)
+    handlers = logger.get_logger('molecule.benchmark').handlers
+    log = logger.CustomLogger('molecule.benchmark')
+    log.setLevel(logging.DEBUG)
+    for handler in handlers:
+        handler.stream = devnull
+        log.addHandler(handler)
+
+    return log
+
+
+def test_runner_output(playbook_output, log):
+    stdout = {}
+
+    def run_sh():
+        cmd = sh.cat.bake(playbook_output, _out=log.out, _err=log.error)
+        stdout['sh'] = len(cmd().stdout)
+
+    def run_runner():
+        cmd = runner.command('cat').bake(
+            playbook_output, _out=log.out, _err=log.error)
+        stdout['runner'] = len(cmd().stdout)
+
+    baseline = pytest.helpers.benchmark(run_sh, repeat=1)
+    candidate = pytest.helpers.benchmark(run_runner, repeat=1)
+
+    pytest.helpers.print_benchmarks('{} lines of playbook output'.format(
+        LINES), ('sh', 'runner'), [('LOG.out', baseline, candidate)])
+    print('  stdout kept: sh {} bytes, runner {} bytes'.format(
+        stdout['sh'], stdout['runner']))
+
+    assert runner.TEE_SIZE == stdout['runner']
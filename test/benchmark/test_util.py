@@ -0,0 +1,132 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+
+import mock
+import pytest
+import yaml
+
+from molecule import util
+
+INSTANCES = 1000
+
+requires_libyaml = pytest.mark.skipif(
+    not yaml.__with_libyaml__, reason='PyYAML built without libyaml')
+
+
+@pytest.fixture
+def inventory():
+    hosts = {}
+    for i in range(INSTANCES):
+        hosts['instance-{}-default'.format(i)] = {
+            'ansible_user': 'molecule',
+            'ansible_host': '10.0.{}.{}'.format(i // 256, i % 256),
+            'ansible_port': 22,
+            'ansible_private_key_file': '/tmp/molecule/ssh_key',
+            'connection': 'ssh',
+            'ansible_ssh_extra_args': ('-o UserKnownHostsFile=/dev/null '
+                                       '-o ControlMaster=auto '
+                                       '-o ControlPersist=60s '
+                                       '-o IdentitiesOnly=yes '
+                                       '-o StrictHostKeyChecking=no'),
+        }
+    groups = ['web', 'db', 'cache', 'lb']
+
+    d = {
+        'all': {
+            'hosts': hosts
+        },
+        'ungrouped': {
+            'vars': {}
+        },
+    }
+    for i, group in enumerate(groups):
+        d[group] = {
+            'hosts': {
+                name: options
+                for name, options in sorted(hosts.items())[i::len(groups)]
+            },
+            'children': {
+                'child-{}'.format(group): {
+                    'hosts': {}
+                }
+            },
+        }
+
+    return d
+
+
+@pytest.fixture
+def instance_config():
+    return [{
+        'instance': 'instance-{}-default'.format(i),
+        'instance_ids': ['i-{:017x}'.format(i)],
+        'address': '10.0.{}.{}'.format(i // 256, i % 256),
+        'user': 'molecule',
+        'port': 22,
+        'identity_file': '/tmp/molecule/ssh_key',
+    } for i in range(INSTANCES)]
+
+
+def _benchmark_backends(title, data, tmpdir):
+    path = os.path.join(tmpdir.strpath, 'data.yml')
+    util.write_file(path, util.safe_dump(data))
+
+    def dump():
+        util.safe_dump(data)
+
+    def load():
+        util.safe_load_file(path)
+
+    results = []
+    for operation, func in [('safe_dump', dump), ('safe_load_file', load)]:
+        with mock.patch.object(util, 'YAML_DUMPER', yaml.SafeDumper), \
+                mock.patch.object(util, 'YAML_LOADER', yaml.SafeLoader):
+            baseline = pytest.helpers.benchmark(func)
+        results.append((operation, baseline, pytest.helpers.benchmark(func)))
+
+    pytest.helpers.print_benchmarks(title, ('pure python', 'libyaml'),
+                                    results)
+
+
+@requires_libyaml
+def test_yaml_backends_inventory(tmpdir, inventory):
+    _benchmark_backends('{} instance inventory'.format(INSTANCES), inventory,
+                        tmpdir)
+
+
+@requires_libyaml
+def test_yaml_backends_instance_config(tmpdir, instance_config):
+    _benchmark_backends('{} instance instance_config'.format(INSTANCES),
+                        instance_config, tmpdir)
+
+
+@requires_libyaml
+def test_yaml_backends_output_is_identical(inventory, instance_config):
+    for data in [inventory, instance_config]:
+        x = yaml.dump(
+            data,
+            Dumper=yaml.SafeDumper,
+            default_flow_style=False,
+            explicit_start=True)
+        assert x == util.safe_dump(data)
+        assert data == yaml.load(x, Loader=yaml.SafeLoader)
+        assert data == util.safe_load(x)
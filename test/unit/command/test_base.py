@@ -24,6 +24,7 @@ import shutil
 import pytest
 
 from molecule import config
+from molecule import parallel
 from molecule import util
 from molecule.command import base
 
@@ -58,11 +59,13 @@ def test_prune(base_instance):
     bar_file = os.path.join(ephemeral_directory, 'bar')
     baz_directory = os.path.join(ephemeral_directory, 'baz')
     state_file = os.path.join(ephemeral_directory, 'state.yml')
+    lock_file = os.path.join(ephemeral_directory, 'state.yml.lock')
+    timings_file = os.path.join(ephemeral_directory, 'timings.json')
     inventory_file = os.path.join(ephemeral_directory, 'ansible_inventory.yml')
     config_file = os.path.join(ephemeral_directory, 'ansible.cfg')
 
     os.mkdir(baz_directory)
-    for f in [foo_file, bar_file, state_file]:
+    for f in [foo_file, bar_file, state_file, lock_file, timings_file]:
         open(f, 'a').close()
 
     base_instance.prune()
@@ -70,11 +73,24 @@ def test_prune(base_instance):
     assert not os.path.isfile(foo_file)
     assert not os.path.isfile(bar_file)
     assert os.path.isfile(state_file)
+    assert os.path.isfile(lock_file)
+    assert os.path.isfile(timings_file)
     assert os.path.isfile(config_file)
     assert os.path.isfile(inventory_file)
     assert os.path.isdir(baz_directory)
 
 
+def test_prune_keeps_dependency_safe_files(base_instance):
+    base_instance._config.config['dependency']['name'] = 'gilt'
+    fingerprint_file = os.path.join(base_instance._config.ephemeral_directory,
+                                    'gilt.fingerprint')
+    open(fingerprint_file, 'a').close()
+
+    base_instance.prune()
+
+    assert os.path.isfile(fingerprint_file)
+
+
 def test_setup(mocker, patched_provisioner_add_or_update_vars,
                patched_provisioner_write_inventory,
                patched_provisioner_write_config, base_instance):
@@ -98,8 +114,8 @@ def test_setup_creates_ephemeral_directory(base_instance):
     assert os.path.isdir(ephemeral_directory)
 
 
-def test_verify_configs(config_instance):
-    configs = [config_instance]
+def test_verify_configs(molecule_file):
+    configs = [molecule_file]
 
     assert base._verify_configs(configs) is None
 
@@ -115,9 +131,9 @@ def test_verify_configs_raises_with_no_configs(patched_logger_critical):
 
 
 def test_verify_configs_raises_with_duplicate_configs(patched_logger_critical,
-                                                      config_instance):
+                                                      molecule_file):
     with pytest.raises(SystemExit) as e:
-        configs = [config_instance, config_instance]
+        configs = [molecule_file, molecule_file]
         base._verify_configs(configs)
 
     assert 1 == e.value.code
@@ -126,15 +142,15 @@ def test_verify_configs_raises_with_duplicate_configs(patched_logger_critical,
     patched_logger_critical.assert_called_once_with(msg)
 
 
-def test_verify_scenario_name(config_instance):
-    configs = [config_instance]
+def test_verify_scenario_name(molecule_file):
+    configs = [molecule_file]
 
     assert base._verify_scenario_name(configs, 'default') is None
 
 
 def test_verify_scenario_name_raises_when_scenario_not_found(
-        config_instance, patched_logger_critical):
-    configs = [config_instance]
+        molecule_file, patched_logger_critical):
+    configs = [molecule_file]
     with pytest.raises(SystemExit) as e:
         base._verify_scenario_name(configs, 'foo')
 
@@ -155,11 +171,44 @@ def test_get_configs(config_instance):
     assert isinstance(result[0], config.Config)
 
 
+@pytest.fixture
+def molecule_files(molecule_directory, molecule_data):
+    molecule_files = []
+    for scenario_name in ['default', 'foo', 'bar']:
+        molecule_file = config.molecule_file(
+            os.path.join(molecule_directory, scenario_name))
+        if not os.path.isdir(os.path.dirname(molecule_file)):
+            os.makedirs(os.path.dirname(molecule_file))
+        pytest.helpers.write_molecule_file(molecule_file, molecule_data)
+        molecule_files.append(molecule_file)
+
+    return molecule_files
+
+
+def test_get_configs_loads_all_scenarios(molecule_files):
+    result = base.get_configs({}, {})
+
+    x = sorted(molecule_files)
+    assert x == sorted(c.molecule_file for c in result)
+
+
+def test_get_configs_only_parses_targeted_scenario(mocker, molecule_files):
+    patched_config = mocker.patch('molecule.config.Config')
+    result = base.get_configs({}, {'scenario_name': 'foo'})
+
+    assert [patched_config.return_value] == result
+    patched_config.assert_called_once_with(
+        molecule_file=molecule_files[1],
+        args={},
+        command_args={'scenario_name': 'foo'})
+
+
 def test_get_configs_calls_verify_scenario_name(
-        mocker, config_instance, patched_verify_configs,
+        mocker, molecule_file, patched_verify_configs,
         patched_base_filter_configs_for_scenario,
         patched_verify_scenario_name):
-    patched_base_filter_configs_for_scenario.return_value = [config_instance]
+    patched_base_filter_configs_for_scenario.return_value = [molecule_file]
+    mocker.patch('molecule.config.Config')
     base.get_configs({}, {'scenario_name': 'default'})
 
     patched_verify_scenario_name.assert_called_once_with(
@@ -183,11 +232,104 @@ def test_get_configs_filter_configs_for_scenario(
                                                                      [])
 
 
-def test_filter_configs_for_scenario(config_instance):
-    configs = [config_instance, config_instance]
+def test_filter_configs_for_scenario(molecule_file):
+    configs = [molecule_file, molecule_file]
 
     result = base._filter_configs_for_scenario('default', configs)
     assert 2 == len(result)
 
     result = base._filter_configs_for_scenario('invalid', configs)
     assert [] == result
+
+
+def test_load_configs(molecule_files):
+    result = base._load_configs(molecule_files, {'debug': True}, {})
+
+    assert molecule_files == [c.molecule_file for c in result]
+    assert all({'debug': True} == c.args for c in result)
+
+
+def test_get_scenario_name():
+    assert 'foo' == base._get_scenario_name('/bar/molecule/foo/molecule.yml')
+
+
+def test_execute_subcommand(config_instance, mocker):
+    m = mocker.patch('molecule.command.verify.Verify.execute')
+    base.execute_subcommand(config_instance, 'verify')
+
+    m.assert_called_once_with()
+
+
+def test_execute_sequence(config_instance, mocker):
+    m = mocker.patch('molecule.command.base.execute_subcommand')
+    patched_scheduler = mocker.patch('molecule.scheduler.execute')
+    base.execute_sequence(config_instance, ['create', 'converge'])
+
+    x = [
+        mocker.call(config_instance, 'create'),
+        mocker.call(config_instance, 'converge'),
+    ]
+    assert x == m.mock_calls
+    assert not patched_scheduler.called
+
+
+def test_execute_sequence_resets_timings(config_instance, mocker):
+    mocker.patch('molecule.command.base.execute_subcommand')
+    config_instance.timings.record('idempotence', [{
+        'event': 'result',
+        'task': 'foo',
+        'duration': 1.0,
+    }])
+    base.execute_sequence(config_instance, ['converge'])
+
+    assert {} == config_instance.timings.data
+
+
+def test_execute_sequence_with_graph_scheduler(config_instance, mocker):
+    config_instance.config['scenario']['scheduler'] = 'graph'
+    m = mocker.patch('molecule.command.base.execute_subcommand')
+    base.execute_sequence(config_instance, ['dependency', 'create'])
+
+    assert 2 == m.call_count
+    m.assert_any_call(config_instance, 'dependency')
+    m.assert_any_call(config_instance, 'create')
+
+
+def test_execute_scenarios(config_instance, mocker):
+    m = mocker.Mock()
+    patched_parallel = mocker.patch('molecule.parallel.execute')
+    base.execute_scenarios([config_instance, config_instance], m)
+
+    assert [mocker.call(config_instance)] * 2 == m.mock_calls
+    assert not patched_parallel.called
+
+
+def test_execute_scenarios_in_parallel(config_instance, mocker):
+    m = mocker.Mock()
+    results = [parallel.Result('default', parallel.PASSED, 1)]
+    patched_parallel = mocker.patch(
+        'molecule.parallel.execute', return_value=results)
+    patched_summary = mocker.patch('molecule.parallel.print_summary')
+    base.execute_scenarios(
+        [config_instance], m, processes=2, keep_going=True)
+
+    patched_parallel.assert_called_once_with([config_instance], m, 2, True)
+    patched_summary.assert_called_once_with(results)
+
+
+def test_execute_scenarios_in_parallel_raises_on_failure(
+        config_instance, mocker, patched_logger_critical):
+    results = [
+        parallel.Result('foo', parallel.PASSED, 1),
+        parallel.Result('bar', parallel.FAILED, 1),
+        parallel.Result('baz', parallel.CANCELLED, 0),
+    ]
+    mocker.patch('molecule.parallel.execute', return_value=results)
+    mocker.patch('molecule.parallel.print_summary')
+    with pytest.raises(SystemExit) as e:
+        base.execute_scenarios([config_instance], mocker.Mock(), processes=2)
+
+    assert 1 == e.value.code
+
+    msg = "Scenarios failed or cancelled: 'bar', 'baz'."
+    patched_logger_critical.assert_called_once_with(msg)
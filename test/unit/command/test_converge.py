@@ -18,6 +18,11 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import json
+
+import pytest
+
+from molecule import fingerprint
 from molecule.command import converge
 
 
@@ -36,3 +41,134 @@ def test_execute(mocker, patched_logger_info, patched_ansible_converge,
     patched_ansible_converge.assert_called_once_with()
 
     assert config_instance.state.converged
+
+
+def test_execute_records_timings(patched_ansible_converge, config_instance):
+    with open(config_instance.provisioner.events_file('converge'), 'w') as f:
+        f.write(json.dumps({
+            'event': 'result',
+            'host': 'instance-1-default',
+            'task': 'foo',
+            'duration': 1.5,
+        }) + '\n')
+    c = converge.Converge(config_instance)
+    c.execute()
+
+    x = ['foo']
+
+    assert x == [
+        t['task'] for t in config_instance.timings.data['converge']['tasks']
+    ]
+
+
+def test_execute_records_fingerprint_when_incremental(
+        patched_ansible_converge, config_instance):
+    config_instance.command_args = {'incremental': True}
+    config_instance.state.change_state('idempotent_fingerprint', 'foo')
+    c = converge.Converge(config_instance)
+    c.execute()
+
+    x = fingerprint.converge(config_instance)
+
+    assert x == config_instance.state.converged_fingerprint
+    assert config_instance.state.idempotent_fingerprint is None
+
+
+@pytest.fixture
+def converged_instance(config_instance):
+    config_instance.command_args = {'incremental': True}
+    with config_instance.state.transaction():
+        config_instance.state.change_state('converged', True)
+        config_instance.state.change_state(
+            'converged_fingerprint', fingerprint.converge(config_instance))
+        config_instance.state.change_instance_state('instance-1-default',
+                                                    'converged', True)
+
+    return config_instance
+
+
+def test_execute_skips_when_incremental_and_unchanged(
+        patched_logger_warn, patched_ansible_converge, converged_instance):
+    c = converge.Converge(converged_instance)
+    c.execute()
+
+    assert not patched_ansible_converge.called
+
+    msg = 'Skipping, nothing changed since the last converge.'
+    patched_logger_warn.assert_called_once_with(msg)
+
+
+def test_execute_converges_when_incremental_and_changed(
+        patched_ansible_converge, converged_instance):
+    with open('tasks.yml', 'w') as f:
+        f.write('---')
+    c = converge.Converge(converged_instance)
+    c.execute()
+
+    patched_ansible_converge.assert_called_once_with()
+
+
+def test_execute_converges_when_incremental_and_instance_not_converged(
+        patched_ansible_converge, converged_instance):
+    converged_instance.state.change_instance_state('instance-2-default',
+                                                   'created', True)
+    c = converge.Converge(converged_instance)
+    c.execute()
+
+    patched_ansible_converge.assert_called_once_with()
+
+
+def test_execute_clears_fingerprint_when_not_incremental(
+        patched_ansible_converge, converged_instance):
+    converged_instance.command_args = {}
+    c = converge.Converge(converged_instance)
+    c.execute()
+
+    patched_ansible_converge.assert_called_once_with()
+    assert converged_instance.state.converged_fingerprint is None
+
+
+@pytest.fixture
+def snapshot_instance(config_instance):
+    config_instance.config['driver']['options']['snapshot'] = True
+    with config_instance.state.transaction():
+        for instance_name in ['instance-1-default', 'instance-2-default']:
+            config_instance.state.change_instance_state(
+                instance_name, 'created', True)
+        config_instance.state.change_instance_state('instance-1-default',
+                                                    'snapshot', 'sha256:foo')
+
+    return config_instance
+
+
+def test_execute_snapshots_instances(mocker, patched_ansible_converge,
+                                     snapshot_instance):
+    m = mocker.patch(
+        'molecule.driver.dockr.Dockr.snapshot',
+        side_effect=lambda name: 'sha256:{}'.format(name))
+    m_remove = mocker.patch('molecule.driver.dockr.Dockr.remove_snapshot')
+    c = converge.Converge(snapshot_instance)
+    c.execute()
+
+    x = [
+        mocker.call('instance-1-default'),
+        mocker.call('instance-2-default'),
+    ]
+
+    assert x == m.mock_calls
+    m_remove.assert_called_once_with('sha256:foo')
+
+    fingerprints = fingerprint.snapshot(snapshot_instance)
+    for instance_name, d in snapshot_instance.state.instances.items():
+        assert 'sha256:{}'.format(instance_name) == d['snapshot']
+        assert fingerprints[instance_name] == d['snapshot_fingerprint']
+
+
+def test_execute_does_not_snapshot_when_unsupported(
+        mocker, patched_ansible_converge, snapshot_instance):
+    m = mocker.patch('molecule.driver.dockr.Dockr.snapshot')
+    snapshot_instance.config['driver']['options']['snapshot'] = False
+    c = converge.Converge(snapshot_instance)
+    c.execute()
+
+    assert not m.called
@@ -18,12 +18,15 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import pytest
+
 from molecule.command import create
 
 
 def test_execute(mocker, patched_create_setup,
                  patched_provisioner_write_inventory, patched_logger_info,
                  patched_ansible_setup, config_instance):
+    mocker.patch('time.time', return_value=1.5)
     c = create.Create(config_instance)
     c.execute()
     x = [
@@ -39,6 +42,14 @@ def test_execute(mocker, patched_create_setup,
     patched_ansible_setup.assert_called_once_with()
 
     assert config_instance.state.created
+    instance = config_instance.platforms.get_instance('instance-1-default')
+    x = {
+        'created': True,
+        'created_at': 1.5,
+        'definition': config_instance.platforms.definition(instance),
+        'platform': config_instance.platforms.instances[0],
+    }
+    assert x == config_instance.state.instances['instance-1-default']
 
     patched_provisioner_write_inventory.assert_called_once_with()
 
@@ -67,3 +78,121 @@ def test_execute_skips_when_instances_already_created(
     patched_logger_warn.assert_called_once_with(msg)
 
     assert not patched_ansible_setup.called
+
+
+def test_execute_reconcile_creates_missing_platforms(
+        patched_create_setup, patched_provisioner_write_inventory,
+        patched_ansible_setup, config_instance):
+    config_instance.command_args = {'reconcile': True}
+    config_instance.state.change_state('created', True)
+    config_instance.state.change_instance_state(
+        'instance-1-default', 'created', True)
+    missing = config_instance.platforms.instances[1]
+
+    c = create.Create(config_instance)
+    c.execute()
+
+    patched_ansible_setup.assert_called_once_with([missing])
+    assert config_instance.state.instances['instance-2-default']['created']
+    patched_provisioner_write_inventory.assert_called_once_with()
+
+
+def test_execute_reconcile_skips_when_instances_already_created(
+        patched_create_setup, patched_logger_warn, patched_ansible_setup,
+        config_instance):
+    config_instance.command_args = {'reconcile': True}
+    for name in ['instance-1-default', 'instance-2-default']:
+        config_instance.state.change_instance_state(name, 'created', True)
+
+    c = create.Create(config_instance)
+    c.execute()
+
+    msg = 'Skipping, instances already created.'
+    patched_logger_warn.assert_called_once_with(msg)
+
+    assert not patched_ansible_setup.called
+
+
+def test_execute_reconcile_raises_when_unsupported(
+        mocker, patched_create_setup, patched_logger_critical,
+        patched_ansible_setup, config_instance):
+    config_instance.command_args = {'reconcile': True}
+    mocker.patch(
+        'molecule.driver.dockr.Dockr.supports_reconcile',
+        new_callable=mocker.PropertyMock,
+        return_value=False)
+
+    c = create.Create(config_instance)
+    with pytest.raises(SystemExit) as e:
+        c.execute()
+
+    assert 1 == e.value.code
+
+    msg = "The 'docker' driver does not support reconciling instances."
+    patched_logger_critical.assert_called_once_with(msg)
+
+    assert not patched_ansible_setup.called
+
+
+def test_execute_keeps_creation_time_of_recreated_instances(
+        mocker, patched_create_setup, patched_ansible_setup, config_instance):
+    config_instance.state.change_instance_state('instance-1-default',
+                                                'created_at', 1.0)
+    mocker.patch('time.time', return_value=1.5)
+    c = create.Create(config_instance)
+    c.execute()
+
+    instances = config_instance.state.instances
+    assert 1.0 == instances['instance-1-default']['created_at']
+    assert 1.5 == instances['instance-2-default']['created_at']
+
+
+@pytest.fixture
+def reused_instance(mocker, patched_create_setup, config_instance):
+    config_instance.command_args = {'reuse_instances': True}
+    with config_instance.state.transaction():
+        config_instance.state.change_state('created', True)
+        config_instance.state.change_state('converged', True)
+        for name in ['created', 'converged']:
+            config_instance.state.change_instance_state('instance-1-default',
+                                                        name, True)
+
+    return config_instance
+
+
+def test_execute_reuse_recreates_reused_instances(
+        mocker, patched_logger_info, patched_provisioner_write_inventory,
+        patched_ansible_destroy, patched_ansible_setup, reused_instance):
+    c = create.Create(reused_instance)
+    c.execute()
+
+    reused, missing = reused_instance.platforms.instances
+    patched_ansible_destroy.assert_called_once_with([reused])
+    patched_ansible_setup.assert_called_once_with([reused, missing])
+    patched_provisioner_write_inventory.assert_called_once_with()
+
+    patched_logger_info.assert_any_call('Reusing instance(s): [instance-1]')
+
+    state = reused_instance.state
+    assert not state.converged
+    assert not state.instances['instance-1-default']['converged']
+    assert state.instances['instance-2-default']['created']
+
+
+def test_execute_reuse_keeps_reused_instances(
+        mocker, patched_ansible_destroy, patched_ansible_setup,
+        reused_instance):
+    mocker.patch(
+        'molecule.driver.dockr.Dockr.reset_recreates',
+        new_callable=mocker.PropertyMock,
+        return_value=False)
+    c = create.Create(reused_instance)
+    c.execute()
+
+    missing = reused_instance.platforms.instances[1]
+    assert not patched_ansible_destroy.called
+    patched_ansible_setup.assert_called_once_with([missing])
+
+    state = reused_instance.state
+    assert not state.converged
+    assert not state.instances['instance-1-default']['converged']
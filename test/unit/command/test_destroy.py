@@ -52,3 +52,122 @@ def test_execute_skips_when_manual_driver(
     patched_logger_warn.assert_called_once_with(msg)
 
     assert not patched_ansible_destroy.called
+
+
+def test_execute_reconcile_destroys_stale_instances(
+        patched_destroy_prune, patched_ansible_destroy, config_instance):
+    config_instance.command_args = {'reconcile': True}
+    state = config_instance.state
+    state.change_state('created', True)
+    current = config_instance.platforms.instances[0]
+    removed = {'name': 'instance-3'}
+    for name, platform in [('instance-1-default', current),
+                           ('instance-3-default', removed)]:
+        state.change_instance_state(name, 'created', True)
+        state.change_instance_state(name, 'platform', platform)
+
+    d = destroy.Destroy(config_instance)
+    d.execute()
+
+    patched_ansible_destroy.assert_called_once_with([removed])
+    assert not patched_destroy_prune.called
+
+    assert ['instance-1-default'] == list(state.instances.keys())
+    assert state.created
+
+
+def test_execute_reconcile_resets_when_no_instances_remain(
+        patched_destroy_prune, patched_ansible_destroy, config_instance):
+    config_instance.command_args = {'reconcile': True}
+    state = config_instance.state
+    state.change_state('created', True)
+    state.change_instance_state('instance-3-default', 'created', True)
+    state.change_instance_state('instance-3-default', 'platform',
+                                {'name': 'instance-3'})
+
+    d = destroy.Destroy(config_instance)
+    d.execute()
+
+    assert {} == state.instances
+    assert not state.created
+
+
+def test_execute_reconcile_skips_without_stale_instances(
+        patched_destroy_prune, patched_logger_warn, patched_ansible_destroy,
+        config_instance):
+    config_instance.command_args = {'reconcile': True}
+
+    d = destroy.Destroy(config_instance)
+    d.execute()
+
+    msg = 'Skipping, no instances to reconcile.'
+    patched_logger_warn.assert_called_once_with(msg)
+
+    assert not patched_ansible_destroy.called
+
+
+def _record(state, instance_name, platform, created_at):
+    state.change_instance_state(instance_name, 'created', True)
+    state.change_instance_state(instance_name, 'created_at', created_at)
+    state.change_instance_state(instance_name, 'platform', platform)
+
+
+def test_execute_reuse_destroys_stale_and_expired_instances(
+        mocker, patched_destroy_prune, patched_ansible_destroy,
+        config_instance):
+    config_instance.command_args = {
+        'reuse_instances': True,
+        'instance_ttl': 60
+    }
+    mocker.patch('time.time', return_value=100.0)
+    state = config_instance.state
+    state.change_state('created', True)
+    current, expired = config_instance.platforms.instances
+    removed = {'name': 'instance-3'}
+    _record(state, 'instance-1-default', current, 90.0)
+    _record(state, 'instance-2-default', expired, 30.0)
+    _record(state, 'instance-3-default', removed, 90.0)
+
+    d = destroy.Destroy(config_instance)
+    d.execute()
+
+    args, _ = patched_ansible_destroy.call_args
+    assert 2 == len(args[0])
+    assert expired in args[0]
+    assert removed in args[0]
+    assert not patched_destroy_prune.called
+
+    assert ['instance-1-default'] == list(state.instances.keys())
+
+
+def test_execute_reuse_keeps_instances(
+        mocker, patched_destroy_prune, patched_logger_warn,
+        patched_ansible_destroy, config_instance):
+    config_instance.command_args = {'reuse_instances': True}
+    mocker.patch('time.time', return_value=100.0)
+    state = config_instance.state
+    for i, platform in enumerate(config_instance.platforms.instances):
+        _record(state, 'instance-{}-default'.format(i + 1), platform, 90.0)
+
+    d = destroy.Destroy(config_instance)
+    d.execute()
+
+    msg = 'Skipping, instances kept for reuse.'
+    patched_logger_warn.assert_called_once_with(msg)
+
+    assert not patched_ansible_destroy.called
+    assert 2 == len(state.instances)
+
+
+def test_execute_removes_snapshots(mocker, patched_destroy_prune,
+                                   patched_ansible_destroy, config_instance):
+    m = mocker.patch('molecule.driver.dockr.Dockr.remove_snapshot')
+    with config_instance.state.transaction():
+        config_instance.state.change_instance_state('instance-1-default',
+                                                    'snapshot', 'sha256:foo')
+        config_instance.state.change_instance_state('instance-2-default',
+                                                    'created', True)
+    d = destroy.Destroy(config_instance)
+    d.execute()
+
+    m.assert_called_once_with('sha256:foo')
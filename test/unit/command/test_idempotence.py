@@ -18,8 +18,12 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import json
+
 import pytest
 
+from molecule import fingerprint
+from molecule import runner
 from molecule.command import idempotence
 
 
@@ -41,7 +45,8 @@ def test_execute(mocker, patched_logger_info, patched_ansible_converge,
     ]
     assert x == patched_logger_info.mock_calls
 
-    patched_ansible_converge.assert_called_once_with(out=None, err=None)
+    patched_ansible_converge.assert_called_once_with(
+        out=None, err=None, step='idempotence')
 
     patched_command_idempotence_is_idempotent.assert_called_once_with(
         'patched-ansible-converge-stdout')
@@ -50,6 +55,42 @@ def test_execute(mocker, patched_logger_info, patched_ansible_converge,
     patched_logger_success.assert_called_once_with(msg)
 
 
+def test_execute_records_fingerprint_when_incremental(
+        patched_ansible_converge, patched_command_idempotence_is_idempotent,
+        idempotence_instance):
+    c = idempotence_instance._config
+    c.command_args = {'incremental': True}
+    x = fingerprint.converge(c)
+    c.state.change_state('converged_fingerprint', x)
+    idempotence_instance.execute()
+
+    assert x == c.state.idempotent_fingerprint
+
+
+def test_execute_does_not_record_fingerprint_when_changed_since_converge(
+        patched_ansible_converge, patched_command_idempotence_is_idempotent,
+        idempotence_instance):
+    c = idempotence_instance._config
+    c.command_args = {'incremental': True}
+    c.state.change_state('converged_fingerprint', 'foo')
+    idempotence_instance.execute()
+
+    assert c.state.idempotent_fingerprint is None
+
+
+def test_execute_skips_when_incremental_and_unchanged(
+        patched_logger_warn, patched_ansible_converge, idempotence_instance):
+    c = idempotence_instance._config
+    c.command_args = {'incremental': True}
+    c.state.change_state('idempotent_fingerprint', fingerprint.converge(c))
+    idempotence_instance.execute()
+
+    assert not patched_ansible_converge.called
+
+    msg = 'Skipping, nothing changed since idempotence was last verified.'
+    patched_logger_warn.assert_called_once_with(msg)
+
+
 def test_execute_raises_when_not_converged(patched_logger_critical,
                                            patched_ansible_converge,
                                            idempotence_instance):
@@ -76,6 +117,89 @@ def test_execute_raises_when_fails_idempotence(
     patched_logger_critical.assert_called_once_with(msg)
 
 
+def _write_events(config_instance, event_list):
+    with open(config_instance.provisioner.events_file('idempotence'),
+              'w') as f:
+        for event in event_list:
+            f.write(json.dumps(event) + '\n')
+
+
+def test_execute_reads_events(
+        patched_ansible_converge, patched_command_idempotence_is_idempotent,
+        patched_logger_success, idempotence_instance):
+    _write_events(idempotence_instance._config, [{
+        'event': 'result',
+        'host': 'instance-1-default',
+        'task': 'foo',
+        'changed': False,
+    }])
+    idempotence_instance.execute()
+
+    assert not patched_command_idempotence_is_idempotent.called
+    x = idempotence_instance._config.timings.data['idempotence']['tasks']
+    assert 'foo' == x[0]['task']
+
+    msg = 'Idempotence completed successfully.'
+    patched_logger_success.assert_called_once_with(msg)
+
+
+def test_execute_raises_when_events_report_changes(
+        patched_logger_critical, patched_ansible_converge,
+        idempotence_instance):
+    _write_events(idempotence_instance._config, [{
+        'event': 'task_start',
+        'task': 'foo',
+    }, {
+        'event': 'result',
+        'host': 'instance-1-default',
+        'task': 'foo',
+        'changed': True,
+    }, {
+        'event': 'result',
+        'host': 'instance-2-default',
+        'task': 'foo',
+        'changed': False,
+    }])
+    with pytest.raises(SystemExit) as e:
+        idempotence_instance.execute()
+
+    assert 1 == e.value.code
+
+    msg = ('Idempotence test failed because of the following tasks:\n'
+           '* [instance-1-default] => foo')
+    patched_logger_critical.assert_called_once_with(msg)
+
+
+def test_execute_aborts_on_change(
+        mocker, patched_logger_critical, patched_logger_warn,
+        patched_ansible_converge, idempotence_instance):
+    c = idempotence_instance._config
+    c.command_args = {'abort_on_change': True}
+
+    def converge(abort, **kwargs):
+        assert not abort()
+        _write_events(c, [{
+            'event': 'result',
+            'host': 'instance-1-default',
+            'task': 'foo',
+            'changed': True,
+        }])
+        assert abort()
+
+    patched_ansible_converge.side_effect = converge
+    with pytest.raises(SystemExit) as e:
+        idempotence_instance.execute()
+
+    assert 1 == e.value.code
+
+    msg = 'Task reported a change, terminating the playbook.'
+    patched_logger_warn.assert_called_once_with(msg)
+
+    msg = ('Idempotence test failed because of the following tasks:\n'
+           '* [instance-1-default] => foo')
+    patched_logger_critical.assert_called_once_with(msg)
+
+
 def test_is_idempotent(idempotence_instance):
     output = """
 PLAY RECAP ***********************************************************
@@ -95,6 +219,15 @@ check-command-02: ok=2    changed=1    unreachable=0    failed=0
     assert not idempotence_instance._is_idempotent(output)
 
 
+def test_is_idempotent_reads_lines_lazily(idempotence_instance):
+    def output():
+        yield 'PLAY RECAP *****\n'
+        yield 'check-command-01: ok=2    changed=1    unreachable=0\n'
+        raise AssertionError('read past the first change')
+
+    assert not idempotence_instance._is_idempotent(output())
+
+
 def test_non_idempotent_tasks_idempotent(idempotence_instance):
     output = """
 PLAY [all] ***********************************************************
@@ -113,6 +246,22 @@ check-command-01: ok=3    changed=0    unreachable=0    failed=0
     assert result == []
 
 
+def test_non_idempotent_tasks_not_idempotent_spooled(
+        idempotence_instance, temp_dir):
+    path = temp_dir.join('idempotence.log')
+    path.write('\n'.join([
+        'TASK [Idempotence test] *****',
+        '\x1b[0;33mchanged: [check-command-01]\x1b[0m',
+        '',
+        'PLAY RECAP *****',
+        'check-command-01: ok=2    changed=1    unreachable=0    failed=0',
+    ]))
+    result = idempotence_instance._non_idempotent_tasks(
+        runner.Output(path.strpath))
+
+    assert ['* [check-command-01] => Idempotence test'] == result
+
+
 def test_non_idempotent_tasks_not_idempotent(idempotence_instance):
     output = """
 PLAY [all] ***********************************************************
@@ -135,3 +284,28 @@ check-command-02: ok=2    changed=1    unreachable=0    failed=0
         '* [check-command-01] => Idempotence test',
         '* [check-command-02] => Idempotence test'
     ]
+
+
+def test_execute_reads_changes_after_exit_without_aborting(
+        mocker, patched_logger_critical, patched_logger_warn,
+        patched_ansible_converge, idempotence_instance):
+    c = idempotence_instance._config
+    c.command_args = {'abort_on_change': True}
+
+    def converge(abort, **kwargs):
+        _write_events(c, [{
+            'event': 'result',
+            'host': 'instance-1-default',
+            'task': 'foo',
+            'changed': True,
+        }])
+
+    patched_ansible_converge.side_effect = converge
+    with pytest.raises(SystemExit):
+        idempotence_instance.execute()
+
+    assert not patched_logger_warn.called
+
+    msg = ('Idempotence test failed because of the following tasks:\n'
+           '* [instance-1-default] => foo')
+    patched_logger_critical.assert_called_once_with(msg)
@@ -0,0 +1,51 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+
+import pytest
+
+from molecule import runner
+from molecule.command import prune
+
+
+def test_execute(mocker, patched_logger_success):
+    m = mocker.patch(
+        'molecule.driver.image_cache.ImageCache.prune',
+        return_value=['molecule_cache:foo'])
+    prune.execute(max_age=1, max_size=2)
+
+    m.assert_called_once_with(max_age=1, max_size=2)
+
+    msg = 'Removed 1 cached image(s).'
+    patched_logger_success.assert_called_once_with(msg)
+
+
+def test_execute_raises_when_docker_not_found(mocker,
+                                              patched_logger_critical):
+    mocker.patch(
+        'molecule.driver.image_cache.ImageCache.prune',
+        side_effect=runner.CommandNotFound('docker'))
+    with pytest.raises(SystemExit) as e:
+        prune.execute()
+
+    assert 1 == e.value.code
+
+    msg = "Unable to prune the image cache, 'docker' not found."
+    patched_logger_critical.assert_called_once_with(msg)
@@ -0,0 +1,129 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+from molecule import fingerprint
+from molecule import runner
+from molecule.command import restore
+
+
+@pytest.fixture
+def patched_dockr_restore(mocker):
+    return mocker.patch('molecule.driver.dockr.Dockr.restore')
+
+
+@pytest.fixture
+def restore_instance(config_instance):
+    config_instance.config['driver']['options']['snapshot'] = True
+    fingerprints = fingerprint.snapshot(config_instance)
+    with config_instance.state.transaction():
+        for instance_name in ['instance-1-default', 'instance-2-default']:
+            config_instance.state.change_instance_state(
+                instance_name, 'snapshot', 'sha256:{}'.format(instance_name))
+            config_instance.state.change_instance_state(
+                instance_name, 'snapshot_fingerprint',
+                fingerprints[instance_name])
+
+    return restore.Restore(config_instance)
+
+
+def test_execute(mocker, patched_logger_info, patched_dockr_restore,
+                 restore_instance):
+    restore_instance.execute()
+
+    x = [
+        mocker.call('Scenario: [default]'),
+        mocker.call('Driver: [docker]'),
+        mocker.call('Restoring instance(s): '
+                    '[instance-1-default, instance-2-default]'),
+    ]
+
+    assert x == patched_logger_info.mock_calls
+
+    platforms = restore_instance._config.platforms
+    x = [
+        mocker.call(
+            platforms.get_instance('instance-1-default'),
+            'sha256:instance-1-default'),
+        mocker.call(
+            platforms.get_instance('instance-2-default'),
+            'sha256:instance-2-default'),
+    ]
+
+    assert x == patched_dockr_restore.mock_calls
+
+    state = restore_instance._config.state
+
+    assert state.converged
+    assert all(d['converged'] for d in state.instances.values())
+
+
+def test_execute_exits_when_snapshots_unsupported(
+        patched_logger_critical, patched_dockr_restore, restore_instance):
+    restore_instance._config.config['driver']['options']['snapshot'] = False
+    with pytest.raises(SystemExit) as e:
+        restore_instance.execute()
+
+    assert 1 == e.value.code
+
+    msg = "Driver 'docker' does not snapshot instances."
+    patched_logger_critical.assert_called_once_with(msg)
+
+
+def test_execute_skips_without_instances(
+        patched_logger_warn, patched_dockr_restore, restore_instance):
+    restore_instance._config.state.reset()
+    restore_instance.execute()
+
+    msg = 'Skipping, no instances to restore.'
+    patched_logger_warn.assert_called_once_with(msg)
+
+    assert not patched_dockr_restore.called
+
+
+def test_execute_exits_when_snapshots_stale(
+        patched_logger_critical, patched_dockr_restore, restore_instance):
+    state = restore_instance._config.state
+    state.change_instance_state('instance-1-default', 'snapshot_fingerprint',
+                                'foo')
+    with open('tasks.yml', 'w') as f:
+        f.write('---')
+    state.change_instance_state('instance-2-default', 'snapshot', None)
+    with pytest.raises(SystemExit) as e:
+        restore_instance.execute()
+
+    assert 1 == e.value.code
+
+    msg = ('No current snapshot of instance(s): '
+           '[instance-1-default, instance-2-default].  Converge them first.')
+    patched_logger_critical.assert_called_once_with(msg)
+
+    assert not patched_dockr_restore.called
+
+
+def test_execute_exits_when_restore_fails(patched_dockr_restore,
+                                          restore_instance):
+    patched_dockr_restore.side_effect = runner.ErrorReturnCode(
+        'docker run', 125, b'', b'')
+    with pytest.raises(SystemExit) as e:
+        restore_instance.execute()
+
+    assert 125 == e.value.code
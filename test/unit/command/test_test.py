@@ -17,3 +17,27 @@
 #  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
+
+import molecule.command
+from molecule import util
+
+
+def test_test_sequence_reads_files_once(
+        mocker, patched_ansible_playbook, patched_ansible_lint,
+        config_instance):
+    util.write_file(config_instance.state.state_file,
+                    util.safe_dump({'driver': 'docker'}))
+    config_instance.invalidate()
+    patched_safe_load_file = mocker.patch(
+        'molecule.util.safe_load_file', side_effect=util.safe_load_file)
+    patched_os_walk = mocker.patch(
+        'molecule.util.os_walk', side_effect=util.os_walk)
+
+    for task in config_instance.scenario.test_sequence:
+        command_module = getattr(molecule.command, task)
+        command = getattr(command_module, task.capitalize())
+        command(config_instance).execute()
+
+    x = [mocker.call(config_instance.state.state_file)]
+    assert x == patched_safe_load_file.mock_calls
+    assert 1 == patched_os_walk.call_count
@@ -40,6 +40,14 @@ def os_split(s):
     return os_split(rest) + (tail, )
 
 
+@pytest.fixture(autouse=True)
+def molecule_cache_home(tmpdir, monkeypatch):
+    path = tmpdir.join('.cache').strpath
+    monkeypatch.setenv('XDG_CACHE_HOME', path)
+
+    return path
+
+
 @pytest.fixture
 def molecule_dependency_galaxy_section_data():
     return {'dependency': {'name': 'galaxy'}, }
@@ -19,11 +19,13 @@
 #  DEALINGS IN THE SOFTWARE.
 
 import os
+import shutil
+import tarfile
 
 import pytest
-import sh
 
 from molecule import config
+from molecule import runner
 from molecule.dependency import ansible_galaxy
 
 
@@ -122,7 +124,8 @@ def test_env_property(ansible_galaxy_instance):
 def test_bake(ansible_galaxy_instance, role_file, roles_path):
     ansible_galaxy_instance.bake()
     x = [
-        str(sh.ansible_galaxy), 'install', '--role-file={}'.format(role_file),
+        runner.which('ansible-galaxy'), 'install',
+        '--role-file={}'.format(role_file),
         '--roles-path={}'.format(roles_path), '--force', '--foo=bar', '-vvv'
     ]
     result = str(ansible_galaxy_instance._ansible_galaxy_command).split()
@@ -182,8 +185,8 @@ def test_execute_bakes(patched_run_command, ansible_galaxy_instance, role_file,
 def test_executes_catches_and_exits_return_code(
         patched_run_command, patched_ansible_galaxy_has_requirements_file,
         ansible_galaxy_instance):
-    patched_run_command.side_effect = sh.ErrorReturnCode_1(sh.ansible_galaxy,
-                                                           b'', b'')
+    patched_run_command.side_effect = runner.ErrorReturnCode('ansible-galaxy',
+                                                             1)
     with pytest.raises(SystemExit) as e:
         ansible_galaxy_instance.execute()
 
@@ -203,3 +206,101 @@ def test_setup(ansible_galaxy_instance):
 
 def test_has_requirements_file(ansible_galaxy_instance):
     assert not ansible_galaxy_instance._has_requirements_file()
+
+
+@pytest.fixture
+def requirements_file(role_file):
+    with open(role_file, 'w') as f:
+        f.write('- src: foo.bar\n  version: 1.0\n')
+
+    return role_file
+
+
+def test_execute_installs_from_the_role_cache(
+        mocker, patched_run_command, patched_logger_success, requirements_file,
+        roles_path, ansible_galaxy_instance):
+    m = mocker.patch(
+        'molecule.dependency.role_cache.RoleCache.install')
+    ansible_galaxy_instance.execute()
+
+    args, _ = m.call_args
+    assert [{'src': 'foo.bar', 'version': 1.0}] == args[0]
+    assert roles_path == args[1]
+
+    x = [
+        runner.which('ansible-galaxy'), 'install', '--force', '--foo=bar',
+        '-vvv'
+    ]
+    assert sorted(x) == sorted(str(args[2]).split())
+    assert not patched_run_command.called
+
+    msg = 'Dependency completed successfully.'
+    patched_logger_success.assert_called_once_with(msg)
+
+
+def test_execute_skips_when_requirements_installed(
+        mocker, patched_logger_warn, requirements_file,
+        ansible_galaxy_instance):
+    mocker.patch(
+        'molecule.dependency.role_cache.RoleCache.is_installed',
+        return_value=True)
+    m = mocker.patch('molecule.dependency.role_cache.RoleCache.install')
+    ansible_galaxy_instance.execute()
+
+    assert not m.called
+
+    msg = 'Skipping, requirements unchanged since the last install.'
+    patched_logger_warn.assert_called_once_with(msg)
+
+
+def test_execute_without_role_cache_when_unpinned(
+        mocker, patched_run_command, role_file, ansible_galaxy_instance):
+    with open(role_file, 'w') as f:
+        f.write('- src: foo.bar\n')
+    m = mocker.patch('molecule.dependency.role_cache.RoleCache.install')
+    ansible_galaxy_instance.execute()
+
+    assert not m.called
+    assert 1 == patched_run_command.call_count
+
+
+def test_execute_without_role_cache_when_uncacheable(
+        mocker, patched_run_command, role_file, ansible_galaxy_instance):
+    with open(role_file, 'w') as f:
+        f.write('- include: other.yml\n')
+    m = mocker.patch('molecule.dependency.role_cache.RoleCache.install')
+    ansible_galaxy_instance.execute()
+
+    assert not m.called
+    assert 1 == patched_run_command.call_count
+
+
+@pytest.mark.skipif(
+    runner.which('ansible-galaxy') is None,
+    reason='ansible-galaxy is not installed')
+def test_execute_installs_tarball_through_role_cache(
+        tmpdir, monkeypatch, role_file, roles_path, ansible_galaxy_instance):
+    monkeypatch.setenv('XDG_CACHE_HOME', tmpdir.join('cache').strpath)
+    src = tmpdir.mkdir('src')
+    role = src.mkdir('foo')
+    role.mkdir('tasks').join('main.yml').write('---\n')
+    role.mkdir('meta').join('main.yml').write('---\ndependencies: []\n')
+    tarball = tmpdir.join('foo.tar.gz')
+    with tarfile.open(tarball.strpath, 'w:gz') as tar:
+        tar.add(role.strpath, arcname='foo')
+    with open(role_file, 'w') as f:
+        f.write('- src: file://{}\n  name: bar\n  version: 1.0.0\n'.format(
+            tarball.strpath))
+    ansible_galaxy_instance._config.config['dependency']['options'] = {}
+    ansible_galaxy_instance.execute()
+
+    link = os.path.join(roles_path, 'bar')
+    assert os.path.islink(link)
+    assert os.path.isfile(os.path.join(link, 'tasks', 'main.yml'))
+
+    tarball.remove()
+    ansible_galaxy_instance.execute()
+    shutil.rmtree(roles_path)
+    ansible_galaxy_instance.execute()
+
+    assert os.path.isfile(os.path.join(link, 'tasks', 'main.yml'))
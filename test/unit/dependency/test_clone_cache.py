@@ -0,0 +1,245 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+
+import pytest
+
+from molecule import runner
+from molecule.dependency import clone_cache
+
+
+@pytest.fixture
+def git_env(monkeypatch):
+    for name in ['AUTHOR', 'COMMITTER']:
+        monkeypatch.setenv('GIT_{}_NAME'.format(name), 'foo')
+        monkeypatch.setenv('GIT_{}_EMAIL'.format(name), 'foo@example.com')
+
+
+@pytest.fixture
+def repository(tmpdir, git_env):
+    """
+    A bare repository with a `1.0` tag, whose `foo` file is later changed on
+    the default branch.
+    """
+    work = tmpdir.mkdir('work')
+    bare = tmpdir.join('repository.git')
+    git = runner.command('git').bake(
+        _cwd=work.strpath, _out=None, _err=None, _tty_out=False)
+    git.bake('init', '--quiet')()
+    work.join('foo').write('1.0')
+    work.mkdir('library').join('bar.py').write('bar')
+    work.join('library', 'baz.py').write('baz')
+    git.bake('add', '--all')()
+    git.bake('commit', '--quiet', '--message', 'foo')()
+    git.bake('tag', '1.0')()
+    work.join('foo').write('2.0')
+    git.bake('commit', '--quiet', '--all', '--message', 'bar')()
+    git.bake('clone', '--quiet', '--bare', work.strpath, bare.strpath)()
+
+    def tag(name):
+        work.join('foo').write(name)
+        git.bake('commit', '--quiet', '--all', '--message', name)()
+        git.bake('tag', name)()
+        git.bake('push', '--quiet', bare.strpath, name)()
+
+    return bare.strpath, tag
+
+
+@pytest.fixture
+def clone_cache_instance(tmpdir):
+    return clone_cache.CloneCache(directory=tmpdir.join('cache').strpath)
+
+
+def test_directory_property(monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', '/foo')
+
+    assert '/foo/molecule/gilt' == clone_cache.CloneCache().directory
+
+
+def test_key(clone_cache_instance):
+    x = clone_cache_instance.key('foo', '1.0')
+
+    assert x == clone_cache_instance.key('foo', '1.0')
+    assert x != clone_cache_instance.key('foo', '1.1')
+    assert x != clone_cache_instance.key('foo1', '.0')
+
+
+def test_checkout(patched_logger_info, repository, clone_cache_instance):
+    path = clone_cache_instance.checkout(repository[0], '1.0')
+
+    assert '1.0' == open(os.path.join(path, 'foo')).read()
+    assert not os.path.exists(os.path.join(path, '.git'))
+
+    msg = 'Checking out: [{}@1.0]'.format(repository[0])
+    patched_logger_info.assert_called_once_with(msg)
+
+
+def test_checkout_is_cached(mocker, patched_logger_info, repository,
+                            clone_cache_instance):
+    x = clone_cache_instance.checkout(repository[0], '1.0')
+    m = mocker.patch('molecule.dependency.clone_cache.CloneCache._run')
+
+    assert x == clone_cache_instance.checkout(repository[0], '1.0')
+    assert not m.called
+
+    msg = 'Using cached checkout: [{}@1.0]'.format(repository[0])
+    patched_logger_info.assert_called_with(msg)
+
+
+def test_checkout_clones_once_per_repository(mocker, repository,
+                                             clone_cache_instance):
+    spy = mocker.spy(clone_cache.CloneCache, '_run')
+    master = clone_cache_instance.checkout(repository[0], 'HEAD')
+    tag = clone_cache_instance.checkout(repository[0], '1.0')
+
+    assert '2.0' == open(os.path.join(master, 'foo')).read()
+    assert '1.0' == open(os.path.join(tag, 'foo')).read()
+    assert 1 == len([
+        c for c in spy.call_args_list
+        if c[0][1:3] == ('clone', '--quiet') and '--mirror' in c[0]
+    ])
+
+
+def test_checkout_fetches_missing_versions(repository, clone_cache_instance):
+    clone_cache_instance.checkout(repository[0], '1.0')
+    repository[1]('3.0')
+    path = clone_cache_instance.checkout(repository[0], '3.0')
+
+    assert '3.0' == open(os.path.join(path, 'foo')).read()
+
+
+def test_checkout_raises_on_unknown_version(repository, clone_cache_instance):
+    with pytest.raises(runner.ErrorReturnCode):
+        clone_cache_instance.checkout(repository[0], 'missing')
+
+    checkouts = os.path.join(clone_cache_instance.directory, 'checkouts')
+    assert [] == os.listdir(checkouts)
+
+
+def test_overlay(tmpdir, repository, clone_cache_instance):
+    tmpdir.mkdir('roles').mkdir('foo').join('stale').write('')
+    with tmpdir.as_cwd():
+        clone_cache_instance.overlay({
+            'git': repository[0],
+            'version': '1.0',
+            'dst': 'roles/foo/',
+            'files': [{
+                'src': 'library/*.py',
+                'dst': 'library'
+            }, {
+                'src': 'library',
+                'dst': 'plugins/library/'
+            }]
+        })
+
+    x = sorted(['foo', 'library/bar.py', 'library/baz.py'])
+    assert x == sorted(
+        os.path.relpath(
+            os.path.join(r, n), tmpdir.join('roles', 'foo').strpath)
+        for r, _, files in os.walk(tmpdir.join('roles', 'foo').strpath)
+        for n in files)
+    assert ['bar.py', 'baz.py'] == sorted(
+        os.listdir(tmpdir.join('library').strpath))
+    assert 'bar' == tmpdir.join('plugins', 'library', 'bar.py').read()
+
+    checkout = clone_cache_instance.checkout(repository[0], '1.0')
+    assert os.path.samefile(
+        os.path.join(checkout, 'foo'),
+        tmpdir.join('roles', 'foo', 'foo').strpath)
+
+
+def test_overlay_copies_file_to_or_into_destination(tmpdir, repository,
+                                                    clone_cache_instance):
+    tmpdir.mkdir('existing')
+    with tmpdir.as_cwd():
+        clone_cache_instance.overlay({
+            'git': repository[0],
+            'version': '1.0',
+            'files': [{
+                'src': 'foo',
+                'dst': 'library/foo.py'
+            }, {
+                'src': 'foo',
+                'dst': 'files/'
+            }, {
+                'src': 'foo',
+                'dst': 'existing'
+            }]
+        })
+
+    assert '1.0' == tmpdir.join('library', 'foo.py').read()
+    assert '1.0' == tmpdir.join('files', 'foo').read()
+    assert '1.0' == tmpdir.join('existing', 'foo').read()
+
+
+@pytest.mark.parametrize('overlays, x', [
+    ([{
+        'git': 'foo',
+        'version': '1.0',
+        'dst': 'bar'
+    }], True),
+    ([{
+        'git': 'foo',
+        'version': '1.0',
+        'files': [{
+            'src': 'bar',
+            'dst': 'baz'
+        }]
+    }], True),
+    ([{
+        'git': 'foo',
+        'dst': 'bar'
+    }], False),
+    ([{
+        'git': 'foo',
+        'version': '1.0',
+        'dst': 'bar',
+        'post_commands': ['make']
+    }], False),
+    ([{
+        'git': 'foo',
+        'version': '1.0',
+        'files': [{
+            'src': 'bar',
+            'dst': 'baz',
+            'post_commands': ['make']
+        }]
+    }], False),
+    ({
+        'git': 'foo'
+    }, False),
+])
+def test_cacheable(overlays, x):
+    assert x == bool(clone_cache.cacheable(overlays))
+
+
+def test_destinations(tmpdir):
+    with tmpdir.as_cwd():
+        x = clone_cache.destinations([{
+            'dst': 'foo'
+        }, {
+            'files': [{
+                'src': 'bar',
+                'dst': 'baz'
+            }]
+        }])
+
+    assert [tmpdir.join('foo').strpath, tmpdir.join('baz').strpath] == x
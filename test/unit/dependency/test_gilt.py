@@ -21,9 +21,9 @@
 import os
 
 import pytest
-import sh
 
 from molecule import config
+from molecule import runner
 from molecule.dependency import gilt
 
 
@@ -100,7 +100,8 @@ def test_env_property(gilt_instance):
 def test_bake(gilt_config, gilt_instance):
     gilt_instance.bake()
     x = [
-        str(sh.gilt), '--foo=bar', '--config={}'.format(gilt_config), 'overlay'
+        runner.which('gilt'), '--foo=bar', '--config={}'.format(gilt_config),
+        'overlay'
     ]
     result = str(gilt_instance._gilt_command).split()
 
@@ -152,8 +153,8 @@ def test_execute_bakes(patched_run_command, gilt_config,
 def test_executes_catches_and_exits_return_code(
         patched_run_command, patched_gilt_has_requirements_file,
         gilt_instance):
-    patched_run_command.side_effect = sh.ErrorReturnCode_1(sh.ansible_galaxy,
-                                                           b'', b'')
+    patched_run_command.side_effect = runner.ErrorReturnCode('ansible-galaxy',
+                                                             1)
     with pytest.raises(SystemExit) as e:
         gilt_instance.execute()
 
@@ -162,3 +163,110 @@ def test_executes_catches_and_exits_return_code(
 
 def test_has_requirements_file(gilt_instance):
     assert not gilt_instance._has_requirements_file()
+
+
+def test_mode_property(gilt_instance):
+    assert 'overlay' == gilt_instance.mode
+
+    gilt_instance._config.config['dependency']['mode'] = 'cache'
+
+    assert 'cache' == gilt_instance.mode
+
+
+def test_mode_property_exits_when_invalid(patched_logger_critical,
+                                          gilt_instance):
+    gilt_instance._config.config['dependency']['mode'] = 'foo'
+    with pytest.raises(SystemExit) as e:
+        gilt_instance.mode
+
+    assert 1 == e.value.code
+
+    msg = "Invalid gilt mode 'foo'.  Valid modes are: 'overlay', 'cache'."
+    patched_logger_critical.assert_called_once_with(msg)
+
+
+def test_safe_files_property(gilt_instance):
+    x = [
+        os.path.join(gilt_instance._config.ephemeral_directory,
+                     'gilt.fingerprint')
+    ]
+
+    assert x == gilt_instance.safe_files
+
+
+@pytest.fixture
+def cache_gilt_instance(tmpdir, monkeypatch, gilt_config, gilt_instance):
+    monkeypatch.setenv('XDG_CACHE_HOME', tmpdir.join('cache').strpath)
+    gilt_instance._config.config['dependency']['mode'] = 'cache'
+    with open(gilt_config, 'w') as f:
+        f.write('- git: https://example.com/foo.git\n'
+                '  version: 1.0\n'
+                '  dst: roles/foo/\n')
+
+    return gilt_instance
+
+
+def test_execute_overlays_from_cache(mocker, patched_run_command,
+                                     patched_logger_success,
+                                     cache_gilt_instance):
+    m = mocker.patch('molecule.dependency.clone_cache.CloneCache.overlay')
+    cache_gilt_instance.execute()
+
+    x = {
+        'git': 'https://example.com/foo.git',
+        'version': 1.0,
+        'dst': 'roles/foo/'
+    }
+    m.assert_called_once_with(x)
+    assert not patched_run_command.called
+    assert os.path.isfile(cache_gilt_instance.safe_files[0])
+
+    msg = 'Dependency completed successfully.'
+    patched_logger_success.assert_called_once_with(msg)
+
+
+def test_execute_skips_when_overlays_unchanged(
+        mocker, tmpdir, patched_logger_warn, gilt_config, cache_gilt_instance):
+    m = mocker.patch('molecule.dependency.clone_cache.CloneCache.overlay')
+    with tmpdir.as_cwd():
+        cache_gilt_instance.execute()
+        cache_gilt_instance.execute()
+
+        assert 2 == m.call_count
+
+        tmpdir.mkdir('roles').mkdir('foo')
+        cache_gilt_instance.execute()
+
+        assert 2 == m.call_count
+
+        msg = 'Skipping, overlays unchanged since the last dependency.'
+        patched_logger_warn.assert_called_once_with(msg)
+
+        with open(gilt_config, 'a') as f:
+            f.write('  files: []\n')
+        cache_gilt_instance.execute()
+
+    assert 3 == m.call_count
+
+
+def test_execute_overlays_with_gilt_when_uncacheable(
+        mocker, patched_run_command, gilt_config, cache_gilt_instance):
+    with open(gilt_config, 'a') as f:
+        f.write('  post_commands:\n' '    - make\n')
+    m = mocker.patch('molecule.dependency.clone_cache.CloneCache.overlay')
+    cache_gilt_instance.execute()
+
+    assert not m.called
+    assert 1 == patched_run_command.call_count
+
+
+def test_execute_overlays_from_cache_exits_on_git_failure(mocker,
+                                                          cache_gilt_instance):
+    mocker.patch(
+        'molecule.dependency.clone_cache.CloneCache.overlay',
+        side_effect=runner.ErrorReturnCode('git', 128))
+    with pytest.raises(SystemExit) as e:
+        cache_gilt_instance.execute()
+
+    assert 128 == e.value.code
+    assert not os.path.isfile(cache_gilt_instance.safe_files[0])
@@ -0,0 +1,239 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import json
+import os
+import sys
+
+import pytest
+
+from molecule import runner
+from molecule.dependency import role_cache
+
+FAKE_GALAXY = """
+import json
+import os
+import sys
+
+import yaml
+
+options = dict(a[2:].split('=', 1) for a in sys.argv[2:] if '=' in a)
+with open(options['role-file']) as f:
+    requirements = yaml.safe_load(f)
+
+with open(os.path.join(os.environ['FAKE_GALAXY_DIRECTORY'], 'calls'),
+          'a') as f:
+    f.write(json.dumps(requirements) + '\\n')
+
+for r in requirements:
+    src = r['src'] if isinstance(r, dict) else r
+    if src == 'fail':
+        sys.exit(2)
+    name = r.get('name', src) if isinstance(r, dict) else src
+    for role in [name] + (r.get('dependencies', [])
+                          if isinstance(r, dict) else []):
+        path = os.path.join(options['roles-path'], role, 'tasks')
+        os.makedirs(path)
+        with open(os.path.join(path, 'main.yml'), 'w') as f:
+            f.write(src)
+"""
+
+
+@pytest.fixture
+def fake_galaxy(tmpdir, monkeypatch):
+    directory = tmpdir.mkdir('galaxy')
+    monkeypatch.setenv('FAKE_GALAXY_DIRECTORY', directory.strpath)
+    path = directory.join('ansible-galaxy.py')
+    path.write(FAKE_GALAXY)
+
+    def calls():
+        calls = directory.join('calls')
+        if not calls.check():
+            return []
+
+        return [json.loads(line) for line in calls.readlines()]
+
+    cmd = runner.Command(sys.executable).bake(
+        path.strpath, 'install', _out=lambda _: None, _err=lambda _: None)
+
+    return cmd, calls
+
+
+@pytest.fixture
+def role_cache_instance(tmpdir):
+    return role_cache.RoleCache(directory=tmpdir.join('cache').strpath)
+
+
+@pytest.fixture
+def requirements():
+    return [
+        'foo.bar', {
+            'src': 'https://example.com/baz.git',
+            'version': '1.0',
+            'name': 'baz',
+            'dependencies': ['qux']
+        }
+    ]
+
+
+def test_directory_property(monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', '/foo')
+
+    assert '/foo/molecule/roles' == role_cache.RoleCache().directory
+
+
+def test_key(role_cache_instance):
+    x = role_cache_instance.key({'src': 'foo', 'version': '1.0'})
+
+    assert x == role_cache_instance.key({'version': '1.0', 'src': 'foo'})
+    assert x != role_cache_instance.key({'src': 'foo', 'version': '1.1'})
+    assert x != role_cache_instance.key('foo,1.0')
+
+
+def test_install(tmpdir, fake_galaxy, requirements, role_cache_instance):
+    roles_path = tmpdir.join('roles').strpath
+    role_cache_instance.install(requirements, roles_path, fake_galaxy[0])
+
+    assert ['baz', 'foo.bar', 'qux'] == sorted(
+        n for n in os.listdir(roles_path) if not n.startswith('.'))
+    for name in ['baz', 'foo.bar', 'qux']:
+        link = os.path.join(roles_path, name)
+        assert os.path.islink(link)
+        assert os.path.realpath(link).startswith(
+            os.path.realpath(role_cache_instance.directory))
+
+    x = [[requirements[0]], [requirements[1]]]
+
+    assert x == sorted(fake_galaxy[1](), key=json.dumps)
+    assert role_cache_instance.is_installed(requirements, roles_path)
+
+
+def test_install_shares_the_cache(tmpdir, fake_galaxy, requirements,
+                                  role_cache_instance):
+    for scenario in ['foo', 'bar']:
+        roles_path = tmpdir.join(scenario, 'roles').strpath
+        role_cache_instance.install(requirements, roles_path, fake_galaxy[0])
+
+        assert os.path.isfile(
+            os.path.join(roles_path, 'foo.bar', 'tasks', 'main.yml'))
+
+    assert 2 == len(fake_galaxy[1]())
+
+
+def test_install_replaces_roles(tmpdir, fake_galaxy, requirements,
+                                role_cache_instance):
+    roles_path = tmpdir.mkdir('roles')
+    roles_path.mkdir('foo.bar').join('main.yml').write('')
+    role_cache_instance.install(requirements, roles_path.strpath,
+                                fake_galaxy[0])
+    role_cache_instance.install(requirements[:1], roles_path.strpath,
+                                fake_galaxy[0])
+
+    assert ['foo.bar'] == sorted(
+        n for n in os.listdir(roles_path.strpath) if not n.startswith('.'))
+    assert roles_path.join('foo.bar').islink()
+
+
+def test_install_exits_when_install_fails(tmpdir, fake_galaxy,
+                                          role_cache_instance):
+    roles_path = tmpdir.join('roles').strpath
+    with pytest.raises(SystemExit) as e:
+        role_cache_instance.install(['foo', 'fail'], roles_path,
+                                    fake_galaxy[0])
+
+    assert 2 == e.value.code
+    assert [role_cache_instance.key('foo')] == [
+        n for n in os.listdir(role_cache_instance.directory)
+        if not n.endswith('.lock')
+    ]
+    assert not role_cache_instance.is_installed(['foo', 'fail'], roles_path)
+
+
+def test_is_installed(tmpdir, fake_galaxy, requirements, role_cache_instance):
+    roles_path = tmpdir.join('roles').strpath
+
+    assert not role_cache_instance.is_installed(requirements, roles_path)
+
+    role_cache_instance.install(requirements, roles_path, fake_galaxy[0])
+
+    assert role_cache_instance.is_installed(requirements, roles_path)
+    assert not role_cache_instance.is_installed(requirements[:1], roles_path)
+
+    os.remove(os.path.join(roles_path, 'qux'))
+
+    assert not role_cache_instance.is_installed(requirements, roles_path)
+
+
+@pytest.mark.parametrize('requirements, x', [
+    (['foo.bar,1.0', {
+        'src': 'baz',
+        'version': '1.0'
+    }], True),
+    (['foo.bar', {
+        'src': 'baz',
+        'version': '1.0'
+    }], False),
+    ([{
+        'include': 'foo.yml'
+    }], False),
+    ([{
+        'name': 'foo'
+    }], False),
+    ({
+        'roles': [],
+        'collections': []
+    }, False),
+])
+def test_cacheable(requirements, x):
+    assert x == role_cache.cacheable(requirements)
+
+
+@pytest.mark.parametrize('requirement, x', [
+    ('foo.bar', False),
+    ('foo.bar,1.0', True),
+    ({
+        'src': 'foo.bar'
+    }, False),
+    ({
+        'src': 'foo.bar',
+        'version': 1.0
+    }, True),
+    ({
+        'src': 'foo.bar',
+        'version': 'master'
+    }, True),
+    ({
+        'src': 'https://example.com/foo.git',
+        'scm': 'git',
+        'version': 'master'
+    }, False),
+    ({
+        'src': 'https://example.com/foo.git',
+        'scm': 'git',
+        'version': 'v1.2.0'
+    }, True),
+    ({
+        'src': 'git+https://example.com/foo.git',
+        'version': '0a1b2c3d'
+    }, True),
+    ('git+https://example.com/foo.git,devel', False),
+])
+def test_pinned(requirement, x):
+    assert x == role_cache.pinned(requirement)
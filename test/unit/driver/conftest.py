@@ -0,0 +1,173 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import io
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
+
+import pytest
+
+try:
+    import socketserver
+    from http import server
+    from urllib.parse import parse_qs
+    from urllib.parse import unquote
+    from urllib.parse import urlparse
+except ImportError:  # pragma: no cover
+    import BaseHTTPServer as server
+    import SocketServer as socketserver
+    from urllib import unquote
+    from urlparse import parse_qs
+    from urlparse import urlparse
+
+
+class FakeDockerDaemon(socketserver.ThreadingMixIn,
+                       socketserver.UnixStreamServer):
+    """
+    A fake Docker daemon serving the few requests of the instances' lifecycle
+    on a Unix socket, from in-memory images and containers.  Builds record
+    the files of their context.
+    """
+    daemon_threads = True
+    request_queue_size = 64
+
+    def __init__(self, path, delay=0.0):
+        socketserver.UnixStreamServer.__init__(self, path, FakeDockerHandler)
+        self.delay = delay
+        self.images = set()
+        self.builds = []
+        self.containers = {}
+        self.requests = []
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+
+class FakeDockerHandler(server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        self._handle()
+
+    def do_POST(self):
+        self._handle()
+
+    def do_DELETE(self):
+        self._handle()
+
+    def log_message(self, *args):
+        pass
+
+    def _handle(self):
+        daemon = self.server
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else None
+        if body and self.headers.get('Content-Type') == 'application/json':
+            body = json.loads(body.decode())
+        parts = [unquote(p) for p in url.path.strip('/').split('/')]
+        with daemon.lock:
+            daemon.requests.append((self.command, url.path, params, body))
+            daemon.running += 1
+            daemon.max_running = max(daemon.max_running, daemon.running)
+        try:
+            time.sleep(daemon.delay)
+            with daemon.lock:
+                status, data = self._route(daemon, parts, params, body)
+        finally:
+            with daemon.lock:
+                daemon.running -= 1
+
+        content = b''
+        if data is not None:
+            content = (data if isinstance(data, bytes) else
+                       json.dumps(data).encode())
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _route(self, daemon, parts, params, body):
+        method = self.command
+        if parts[0] == 'images' and method == 'GET':
+            name = '/'.join(parts[1:-1])
+            if name not in daemon.images:
+                return 404, {'message': 'No such image: {}'.format(name)}
+            return 200, {'Id': name}
+        if parts == ['images', 'create']:
+            if params['fromImage'] == 'missing':
+                return 200, b'{"status": "Pulling"}\n{"error": "not found"}\n'
+            daemon.images.add('{}:{}'.format(params['fromImage'],
+                                             params['tag']))
+            return 200, b'{"status": "Pulling"}\n'
+        if parts == ['build']:
+            with tarfile.open(fileobj=io.BytesIO(body)) as tar:
+                dockerfile = tar.extractfile(params['dockerfile']).read()
+                daemon.builds.append(sorted(tar.getnames()))
+            if b'FAIL' in dockerfile:
+                return 200, b'{"stream": "Step 1/1"}\n{"error": "failed"}\n'
+            daemon.images.add(params['t'])
+            return 200, b'{"stream": "Step 1/1"}\n'
+        if parts == ['containers', 'create']:
+            name = params['name']
+            if name in daemon.containers:
+                return 409, {'message': 'Conflict: {}'.format(name)}
+            if body['Image'] not in daemon.images:
+                return 404, {'message': 'No such image'}
+            daemon.containers[name] = {'Config': body, 'Running': False}
+            return 201, {'Id': name}
+        container = daemon.containers.get(parts[1])
+        if container is None:
+            return 404, {'message': 'No such container: {}'.format(parts[1])}
+        if method == 'GET':
+            return 200, container
+        if method == 'DELETE':
+            del daemon.containers[parts[1]]
+            return 204, None
+        if container['Running']:
+            return 304, None
+        container['Running'] = True
+        return 204, None
+
+
+@pytest.fixture
+def docker_daemon(request, monkeypatch):
+    # Unix socket paths are short, so the socket is not in the test's
+    # temporary directory.
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, 'docker.sock')
+    daemon = FakeDockerDaemon(path, delay=0.05)
+    thread = threading.Thread(target=daemon.serve_forever)
+    thread.daemon = True
+    thread.start()
+    monkeypatch.setenv('DOCKER_HOST', 'unix://{}'.format(path))
+
+    def cleanup():
+        daemon.shutdown()
+        daemon.server_close()
+        shutil.rmtree(directory)
+
+    request.addfinalizer(cleanup)
+
+    return daemon
@@ -0,0 +1,139 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import io
+import tarfile
+
+import pytest
+
+from molecule.driver import docker_api
+
+
+@pytest.fixture
+def client(docker_daemon):
+    return docker_api.Client()
+
+
+def test_host_property(monkeypatch):
+    monkeypatch.delenv('DOCKER_HOST', raising=False)
+
+    assert docker_api.DEFAULT_HOST == docker_api.Client().host
+    assert 'tcp://foo:2375' == docker_api.Client('tcp://foo:2375').host
+
+
+def test_host_property_from_environment(monkeypatch):
+    monkeypatch.setenv('DOCKER_HOST', 'unix:///foo.sock')
+
+    assert 'unix:///foo.sock' == docker_api.Client().host
+
+
+def test_inspect_image(docker_daemon, client):
+    docker_daemon.images.add('foo/bar:1.0')
+
+    assert {'Id': 'foo/bar:1.0'} == client.inspect_image('foo/bar:1.0')
+    assert client.inspect_image('baz:latest') is None
+
+
+def test_pull_image(docker_daemon, client):
+    client.pull_image('foo/bar')
+    client.pull_image('localhost:5000/baz:1.0')
+
+    assert {'foo/bar:latest', 'localhost:5000/baz:1.0'} == docker_daemon.images
+
+
+def test_pull_image_raises_on_error_in_progress(client):
+    with pytest.raises(docker_api.DockerAPIError) as e:
+        client.pull_image('missing')
+
+    assert 'not found' == e.value.message
+
+
+def _context(dockerfile):
+    f = io.BytesIO()
+    with tarfile.open(fileobj=f, mode='w') as tar:
+        info = tarfile.TarInfo('Dockerfile')
+        info.size = len(dockerfile)
+        tar.addfile(info, io.BytesIO(dockerfile))
+
+    return f.getvalue()
+
+
+def test_build_image(docker_daemon, client):
+    client.build_image('foo/bar:1.0', _context(b'FROM scratch\n'))
+
+    assert {'foo/bar:1.0'} == docker_daemon.images
+    assert [['Dockerfile']] == docker_daemon.builds
+
+
+def test_build_image_raises_on_error_in_progress(docker_daemon, client):
+    with pytest.raises(docker_api.DockerAPIError) as e:
+        client.build_image('foo/bar:1.0', _context(b'FAIL\n'))
+
+    assert 'failed' == e.value.message
+    assert set() == docker_daemon.images
+
+
+def test_container_lifecycle(docker_daemon, client):
+    docker_daemon.images.add('foo:latest')
+    x = client.create_container('bar', {'Image': 'foo:latest'})
+
+    assert 'bar' == x
+    assert not client.inspect_container('bar')['Running']
+
+    client.start_container('bar')
+    client.start_container('bar')
+
+    assert client.inspect_container('bar')['Running']
+
+    client.remove_container('bar')
+
+    assert ('DELETE', '/containers/bar', {
+        'force': '1',
+        'v': '1'
+    }, None) == docker_daemon.requests[-1]
+
+    client.remove_container('bar')
+
+    assert client.inspect_container('bar') is None
+
+
+def test_create_container_raises_with_message(docker_daemon, client):
+    with pytest.raises(docker_api.DockerAPIError) as e:
+        client.create_container('bar', {'Image': 'foo:latest'})
+
+    assert 404 == e.value.status
+    assert 'No such image' == e.value.message
+
+
+def test_request_raises_when_daemon_unreachable(tmpdir):
+    client = docker_api.Client('unix://{}'.format(
+        tmpdir.join('missing.sock').strpath))
+    with pytest.raises(docker_api.DockerAPIError) as e:
+        client.inspect_image('foo')
+
+    assert e.value.status is None
+    assert 'Unable to reach the Docker daemon' in e.value.message
+
+
+def test_request_raises_on_unsupported_host():
+    with pytest.raises(docker_api.DockerAPIError) as e:
+        docker_api.Client('ssh://foo').inspect_image('foo')
+
+    assert 'Unsupported Docker host: ssh://foo' == e.value.message
@@ -23,6 +23,7 @@ import os
 import pytest
 
 from molecule import config
+from molecule import runner
 from molecule.driver import dockr
 
 
@@ -50,6 +51,61 @@ def test_testinfra_options_property(docker_instance):
     } == docker_instance.testinfra_options
 
 
+def test_ssh_connection_property(docker_instance):
+    assert not docker_instance.ssh_connection
+
+
+def test_supports_reconcile_property(docker_instance):
+    assert docker_instance.supports_reconcile
+
+
+def test_reset_recreates_property(docker_instance):
+    assert docker_instance.reset_recreates
+
+
+def test_supports_snapshot_property(docker_instance):
+    assert not docker_instance.supports_snapshot
+
+    docker_instance._config.config['driver']['options']['snapshot'] = True
+
+    assert docker_instance.supports_snapshot
+
+
+def test_native_lifecycle_property(docker_instance):
+    assert not docker_instance.native_lifecycle
+
+    docker_instance._config.config['driver']['options']['lifecycle'] = 'native'
+
+    assert docker_instance.native_lifecycle
+
+
+def test_native_lifecycle_property_exits_when_invalid(patched_logger_critical,
+                                                      docker_instance):
+    docker_instance._config.config['driver']['options']['lifecycle'] = 'foo'
+    with pytest.raises(SystemExit) as e:
+        docker_instance.native_lifecycle
+
+    assert 1 == e.value.code
+
+    msg = ("Invalid docker lifecycle 'foo'.  Valid lifecycles are: "
+           "'ansible', 'native'.")
+    patched_logger_critical.assert_called_once_with(msg)
+
+
+def test_definition_files(docker_instance):
+    directory = docker_instance._config.scenario.directory
+    x = [os.path.join(directory, 'Dockerfile')]
+
+    assert x == docker_instance.definition_files({'name': 'instance-1'})
+
+    x = [os.path.join(directory, 'Dockerfile.foo')]
+
+    assert x == docker_instance.definition_files({
+        'name': 'instance-1',
+        'dockerfile': 'Dockerfile.foo'
+    })
+
+
 def test_name_property(docker_instance):
     assert 'docker' == docker_instance.name
 
@@ -68,6 +124,217 @@ def test_safe_files(docker_instance):
     assert [] == docker_instance.safe_files
 
 
+@pytest.fixture
+def docker_platforms(docker_instance):
+    directory = docker_instance._config.scenario.directory
+    with open(os.path.join(directory, 'Dockerfile'), 'w') as f:
+        f.write('FROM centos:7')
+
+    return [{
+        'name': 'instance-1',
+        'image': 'foo'
+    }, {
+        'name': 'instance-2',
+        'image': 'bar',
+        'dockerfile': 'Dockerfile.missing'
+    }]
+
+
+def test_prepare_platforms(mocker, docker_platforms, docker_instance):
+    m = mocker.patch('molecule.driver.image_cache.ImageCache.build')
+    docker_instance.prepare_platforms(docker_platforms)
+
+    directory = docker_instance._config.scenario.directory
+    m.assert_called_once_with(
+        os.path.join(directory, 'Dockerfile'), directory, 'foo')
+
+
+def test_prepare_platforms_when_image_cache_disabled(
+        mocker, docker_platforms, docker_instance):
+    m = mocker.patch('molecule.driver.image_cache.ImageCache.build')
+    docker_instance._config.config['driver']['options']['image_cache'] = False
+    docker_instance.prepare_platforms(docker_platforms)
+
+    assert not m.called
+
+
+def test_prepare_platforms_when_docker_not_found(
+        mocker, patched_logger_warn, docker_platforms, docker_instance):
+    mocker.patch(
+        'molecule.driver.image_cache.ImageCache.build',
+        side_effect=runner.CommandNotFound('docker'))
+    docker_instance.prepare_platforms(docker_platforms)
+
+    msg = 'Skipping image cache, docker not found.'
+    patched_logger_warn.assert_called_once_with(msg)
+
+
+@pytest.fixture
+def lifecycle_platforms():
+    return [{
+        'name': 'instance-{}'.format(i),
+        'image': 'foo:latest',
+        'command': 'sleep infinity'
+    } for i in range(20)]
+
+
+def test_create_instances(docker_daemon, lifecycle_platforms,
+                          docker_instance):
+    docker_daemon.containers['instance-0-default'] = {
+        'Config': {},
+        'Running': False
+    }
+    docker_instance.create_instances(lifecycle_platforms)
+
+    assert 20 == len(docker_daemon.containers)
+    assert all(c['Running'] for c in docker_daemon.containers.values())
+    assert {'foo:latest'} == docker_daemon.images
+    assert 1 < docker_daemon.max_running <= dockr.LIFECYCLE_WORKERS
+
+    x = {
+        'Image': 'foo:latest',
+        'Hostname': 'instance-1',
+        'Cmd': ['sleep', 'infinity'],
+        'HostConfig': {
+            'LogConfig': {
+                'Type': 'syslog',
+                'Config': {}
+            }
+        },
+    }
+
+    assert x == docker_daemon.containers['instance-1-default']['Config']
+
+
+def test_create_instances_builds_dockerfile(docker_daemon, docker_instance):
+    c = docker_instance._config
+    c.config['driver']['options'].update({
+        'lifecycle': 'native',
+        'image_cache': False
+    })
+    directory = c.scenario.directory
+    os.makedirs(os.path.join(directory, 'files'))
+    for name in ['files/foo', 'bar']:
+        open(os.path.join(directory, name), 'w').close()
+    with open(os.path.join(directory, 'Dockerfile'), 'w') as f:
+        f.write('FROM centos:7\nCOPY files/foo /foo\n')
+    docker_instance.create_instances([{
+        'name': 'instance-1',
+        'image': 'molecule_local/centos:7'
+    }])
+
+    assert {'molecule_local/centos:7'} == docker_daemon.images
+    assert [['Dockerfile', 'files/foo']] == docker_daemon.builds
+    assert docker_daemon.containers['instance-1-default']['Running']
+
+
+def test_create_instances_limits_workers(docker_daemon, lifecycle_platforms,
+                                         docker_instance):
+    docker_daemon.images.add('foo:latest')
+    docker_instance._config.config['driver']['options'][
+        'lifecycle_workers'] = 1
+    docker_instance.create_instances(lifecycle_platforms[:3])
+
+    assert 1 == docker_daemon.max_running
+    assert 3 == len(docker_daemon.containers)
+
+
+def test_create_instances_exits_with_failures(
+        docker_daemon, patched_logger_critical, lifecycle_platforms,
+        docker_instance):
+    lifecycle_platforms[1]['image'] = 'missing'
+    with pytest.raises(SystemExit) as e:
+        docker_instance.create_instances(lifecycle_platforms[:3])
+
+    assert 1 == e.value.code
+    assert ['instance-0-default', 'instance-2-default'] == sorted(
+        docker_daemon.containers.keys())
+
+    msg = 'Failed to create instance(s):\n* [instance-1-default] => not found'
+    patched_logger_critical.assert_called_once_with(msg)
+
+
+def test_destroy_instances(docker_daemon, lifecycle_platforms,
+                           docker_instance):
+    docker_daemon.containers['instance-0-default'] = {
+        'Config': {},
+        'Running': True
+    }
+    docker_daemon.containers['foo'] = {'Config': {}, 'Running': True}
+    docker_instance.destroy_instances(lifecycle_platforms)
+
+    assert ['foo'] == list(docker_daemon.containers.keys())
+
+
+def test_destroy_instances_without_platforms(mocker, docker_instance):
+    m = mocker.patch('molecule.driver.docker_api.Client')
+    docker_instance.destroy_instances([])
+
+    assert not m.called
+
+
+@pytest.fixture
+def patched_run_docker(mocker):
+    return mocker.patch('molecule.driver.dockr.Dockr._run_docker')
+
+
+def test_snapshot(patched_run_docker, docker_instance):
+    patched_run_docker.return_value.stdout = b'sha256:foo\n'
+
+    assert 'sha256:foo' == docker_instance.snapshot('instance-1-default')
+
+    tag = docker_instance._get_snapshot_tag('instance-1-default')
+    patched_run_docker.assert_called_once_with('commit', 'instance-1-default',
+                                               tag)
+
+
+def test_snapshot_tag_is_local_to_the_scenario(tmpdir, docker_instance):
+    x = docker_instance._get_snapshot_tag('instance-1-default')
+
+    assert x.startswith('molecule_snapshot:')
+    assert x != docker_instance._get_snapshot_tag('instance-2-default')
+
+    docker_instance._config.molecule_file = os.path.join(
+        tmpdir.strpath, 'molecule', 'foo', 'molecule.yml')
+
+    assert x != docker_instance._get_snapshot_tag('instance-1-default')
+
+
+def test_restore(mocker, patched_run_docker, docker_instance):
+    docker_instance._config.config['platforms'][0]['command'] = 'foo "bar baz"'
+    instance = docker_instance._config.platforms.get_instance(
+        'instance-1-default')
+    docker_instance.restore(instance, 'sha256:foo')
+
+    x = [
+        mocker.call('rm', '--force', 'instance-1-default'),
+        mocker.call('run', '--detach', '--name', 'instance-1-default',
+                    '--hostname', 'instance-1', '--log-driver', 'syslog',
+                    'sha256:foo', 'foo', 'bar baz'),
+    ]
+
+    assert x == patched_run_docker.mock_calls
+
+
+def test_restore_when_container_removed(patched_run_docker, docker_instance):
+    patched_run_docker.side_effect = [
+        runner.ErrorReturnCode('docker rm', 1, b'', b''), None
+    ]
+    instance = docker_instance._config.platforms.get_instance(
+        'instance-1-default')
+    docker_instance.restore(instance, 'sha256:foo')
+
+    assert 2 == patched_run_docker.call_count
+
+
+def test_remove_snapshot(patched_run_docker, docker_instance):
+    patched_run_docker.side_effect = runner.ErrorReturnCode(
+        'docker rmi', 1, b'', b'')
+    docker_instance.remove_snapshot('sha256:foo')
+
+    patched_run_docker.assert_called_once_with('rmi', 'sha256:foo')
+
+
 def test_login_options(docker_instance):
     assert {'instance': 'foo'} == docker_instance.login_options('foo')
 
@@ -23,6 +23,7 @@ import os
 import pytest
 
 from molecule import config
+from molecule import util
 from molecule.driver import ec2
 
 
@@ -50,6 +51,14 @@ def test_testinfra_options_property(ec2_instance):
     } == ec2_instance.testinfra_options
 
 
+def test_ssh_connection_property(ec2_instance):
+    assert ec2_instance.ssh_connection
+
+
+def test_supports_reconcile_property(ec2_instance):
+    assert not ec2_instance.supports_reconcile
+
+
 def test_name_property(ec2_instance):
     assert 'ec2' == ec2_instance.name
 
@@ -146,11 +155,54 @@ def test_ansible_connection_options_handles_missing_instance_config(
 def test_ansible_connection_options_handles_missing_results_key(mocker,
                                                                 ec2_instance):
     m = mocker.patch('molecule.util.safe_load_file')
-    m.side_effect = StopIteration
+    m.side_effect = KeyError
+
+    assert {} == ec2_instance.ansible_connection_options('foo')
+
+
+def test_ansible_connection_options_handles_unknown_instance(ec2_instance):
+    util.write_file(ec2_instance.instance_config,
+                    util.safe_dump([{
+                        'instance': 'bar'
+                    }]))
 
     assert {} == ec2_instance.ansible_connection_options('foo')
 
 
+def test_get_instance_config_loads_instance_config_once(mocker, ec2_instance):
+    util.write_file(ec2_instance.instance_config,
+                    util.safe_dump([{
+                        'instance': 'foo',
+                        'address': '172.16.0.2',
+                    }, {
+                        'instance': 'bar',
+                        'address': '172.16.0.3',
+                    }]))
+    spy = mocker.spy(util, 'safe_load_file')
+
+    for instance_name in ['foo', 'bar', 'foo']:
+        ec2_instance._get_instance_config(instance_name)
+
+    assert 1 == spy.call_count
+    assert '172.16.0.3' == ec2_instance._get_instance_config('bar')['address']
+
+
+def test_get_instance_config_reloads_changed_instance_config(ec2_instance):
+    util.write_file(ec2_instance.instance_config,
+                    util.safe_dump([{
+                        'instance': 'foo',
+                        'address': '172.16.0.2',
+                    }]))
+    ec2_instance._get_instance_config('foo')
+    util.write_file(ec2_instance.instance_config,
+                    util.safe_dump([{
+                        'instance': 'foo',
+                        'address': '172.16.0.4',
+                    }]))
+
+    assert '172.16.0.4' == ec2_instance._get_instance_config('foo')['address']
+
+
 def test_instance_config_property(ec2_instance):
     x = os.path.join(ec2_instance._config.ephemeral_directory,
                      'instance_config.yml')
@@ -0,0 +1,301 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+
+import json
+import os
+import sys
+import time
+
+import pytest
+
+from molecule import runner
+from molecule.driver import image_cache
+
+FAKE_DOCKER = """
+import json
+import os
+import sys
+
+directory = os.environ['FAKE_DOCKER_DIRECTORY']
+args = sys.argv[1:]
+
+
+def image(tag):
+    return os.path.join(directory,
+                        'image_' + tag.replace('/', '_').replace(':', '_'))
+
+
+def find(ref):
+    if os.path.exists(image(ref)):
+        return json.load(open(image(ref)))
+    for name in os.listdir(directory):
+        if name.startswith('image_'):
+            data = json.load(open(os.path.join(directory, name)))
+            if data['Id'] == ref:
+                return data
+
+
+def containers(image_id):
+    path = os.path.join(directory, 'containers')
+    if not os.path.exists(path):
+        return []
+
+    return [c for c, i in json.load(open(path)).items() if i == image_id]
+
+
+if args[0] == 'build':
+    tag, context = args[2], args[3]
+    files = sorted(
+        os.path.relpath(os.path.join(root, name), context)
+        for root, _, names in os.walk(context) for name in names)
+    args.append(files)
+    data = {'Id': 'sha256:' + tag.split(':')[-1], 'Size': 100}
+    json.dump(data, open(image(tag), 'w'))
+elif args[0] == 'image':
+    data = find(args[-1])
+    if data is None:
+        sys.exit(1)
+    print(data[args[-2].strip('{}.')])
+elif args[0] == 'tag':
+    json.dump(find(args[1]), open(image(args[2]), 'w'))
+elif args[0] == 'ps':
+    for c in containers(args[-1].split('=', 1)[1]):
+        print(c)
+elif args[0] == 'rmi':
+    for ref in args[1:]:
+        if containers(find(ref)['Id']):
+            sys.exit(1)
+    for ref in args[1:]:
+        os.remove(image(ref))
+
+with open(os.path.join(directory, 'calls'), 'a') as f:
+    f.write(json.dumps(args) + '\\n')
+"""
+
+
+@pytest.fixture
+def fake_docker(tmpdir, monkeypatch):
+    directory = tmpdir.mkdir('docker')
+    monkeypatch.setenv('FAKE_DOCKER_DIRECTORY', directory.strpath)
+    path = directory.join('docker.py')
+    path.write(FAKE_DOCKER)
+
+    def calls():
+        calls = directory.join('calls')
+        if not calls.check():
+            return []
+
+        return [json.loads(line) for line in calls.readlines()]
+
+    cmd = runner.Command(sys.executable).bake(path.strpath)
+
+    return cmd, calls
+
+
+@pytest.fixture
+def context(temp_dir):
+    temp_dir.join('Dockerfile').write('FROM centos:7\n'
+                                      'COPY files/foo /foo\n')
+    temp_dir.mkdir('files').join('foo').write('foo')
+    temp_dir.join('bar').write('bar')
+
+    return temp_dir
+
+
+@pytest.fixture
+def image_cache_instance(tmpdir, fake_docker):
+    cache = image_cache.ImageCache(directory=tmpdir.join('cache').strpath)
+    cache._docker = fake_docker[0]
+
+    return cache
+
+
+def _key(cache, context, image='molecule_local/centos:7'):
+    return cache.key(
+        context.join('Dockerfile').strpath, context.strpath, image)
+
+
+def test_referenced_files(temp_dir):
+    temp_dir.join('Dockerfile').write(
+        'FROM centos:7 AS builder\n'
+        'COPY --chown=root files/foo \\\n'
+        '     files/bar* /\n'
+        'ADD ["dir", "/dir"]\n'
+        'copy --from=builder /baz /baz\n'
+        'ADD https://example.com/qux.tgz /\n'
+        'RUN cp foo bar\n')
+    files = temp_dir.mkdir('files')
+    for name in ['foo', 'bar1', 'bar2', 'baz']:
+        files.join(name).write(name)
+    temp_dir.mkdir('dir').mkdir('sub').join('qux').write('qux')
+
+    x = sorted([
+        files.join('foo').strpath,
+        files.join('bar1').strpath,
+        files.join('bar2').strpath,
+        temp_dir.join('dir', 'sub', 'qux').strpath,
+    ]) + ['https://example.com/qux.tgz']
+
+    assert x == image_cache.referenced_files(
+        temp_dir.join('Dockerfile').strpath, temp_dir.strpath)
+
+
+def test_key(image_cache_instance, context):
+    x = _key(image_cache_instance, context)
+
+    assert x == _key(image_cache_instance, context)
+    assert x != _key(image_cache_instance, context, 'foo')
+
+    context.join('bar').write('baz')
+
+    assert x == _key(image_cache_instance, context)
+
+    context.join('files', 'foo').write('baz')
+
+    assert x != _key(image_cache_instance, context)
+
+
+def test_key_changes_with_dockerfile(image_cache_instance, context):
+    x = _key(image_cache_instance, context)
+    context.join('Dockerfile').write('FROM centos:6\n')
+
+    assert x != _key(image_cache_instance, context)
+
+
+def test_build(patched_logger_info, image_cache_instance, context,
+               fake_docker):
+    _, calls = fake_docker
+    key = image_cache_instance.build(
+        context.join('Dockerfile').strpath, context.strpath,
+        'molecule_local/centos:7')
+    tag = 'molecule_cache:{}'.format(key)
+
+    build = [c for c in calls() if c[0] == 'build']
+    assert 1 == len(build)
+    assert tag == build[0][2]
+    assert ['Dockerfile', os.path.join('files', 'foo')] == build[0][-1]
+    assert not os.path.exists(build[0][3])
+
+    assert ['tag', tag, 'molecule_local/centos:7'] == calls()[-1]
+
+    msg = 'Building image: [molecule_local/centos:7]'
+    patched_logger_info.assert_called_once_with(msg)
+
+    entry = os.path.join(image_cache_instance.directory, key + '.json')
+    with open(entry) as f:
+        x = {'image': 'molecule_local/centos:7', 'size': 100}
+        assert x == json.load(f)
+
+
+def test_build_uses_cached_image(patched_logger_info, image_cache_instance,
+                                 context, fake_docker, tmpdir):
+    _, calls = fake_docker
+    dockerfile = context.join('Dockerfile').strpath
+    image_cache_instance.build(dockerfile, context.strpath, 'foo')
+
+    # An identical platform of another scenario.
+    other = tmpdir.mkdir('other')
+    context.join('Dockerfile').copy(other.join('Dockerfile'))
+    context.join('files').copy(other.join('files'))
+    image_cache_instance.build(
+        other.join('Dockerfile').strpath, other.strpath, 'foo')
+
+    assert 1 == len([c for c in calls() if c[0] == 'build'])
+    assert 2 == len([c for c in calls() if c[0] == 'tag'])
+
+    msg = 'Using cached image: [foo]'
+    patched_logger_info.assert_called_with(msg)
+
+
+def _build_aged(cache, context, images_and_ages):
+    dockerfile = context.join('Dockerfile').strpath
+    keys = []
+    now = time.time()
+    for image, age in images_and_ages:
+        key = cache.build(dockerfile, context.strpath, image)
+        path = os.path.join(cache.directory, key + '.json')
+        os.utime(path, (now - age, now - age))
+        keys.append(key)
+
+    return keys
+
+
+def _images():
+    directory = os.environ['FAKE_DOCKER_DIRECTORY']
+
+    return sorted(n for n in os.listdir(directory) if n.startswith('image_'))
+
+
+def test_prune(image_cache_instance, context, fake_docker):
+    _, calls = fake_docker
+    keys = _build_aged(image_cache_instance, context,
+                       [('foo', 10), ('bar', 20), ('baz', 1000)])
+
+    removed = image_cache_instance.prune(max_age=100, max_size=100)
+
+    x = ['molecule_cache:{}'.format(keys[i]) for i in [1, 2]]
+    assert x == removed
+    rmi = [c for c in calls() if c[0] == 'rmi']
+    assert [['rmi', x[0], 'bar'], ['rmi', x[1], 'baz']] == rmi
+    x = ['image_foo', 'image_molecule_cache_{}'.format(keys[0])]
+    assert x == _images()
+    x = ['{}.json'.format(keys[0]), '{}.lock'.format(keys[0])]
+    assert x == sorted(os.listdir(image_cache_instance.directory))
+
+    assert [] == image_cache_instance.prune(max_age=100, max_size=100)
+
+
+def test_prune_keeps_retagged_platform_image(image_cache_instance, context,
+                                             fake_docker):
+    _, calls = fake_docker
+    key = _build_aged(image_cache_instance, context, [('foo', 1000)])[0]
+    # The platform's image was rebuilt since.
+    image_cache_instance._run('build', '-t', 'molecule_cache:other',
+                              context.strpath)
+    image_cache_instance._run('tag', 'molecule_cache:other', 'foo')
+    tag = 'molecule_cache:{}'.format(key)
+
+    assert [tag] == image_cache_instance.prune(max_age=100)
+    assert ['rmi', tag] == calls()[-1]
+    assert ['image_foo', 'image_molecule_cache_other'] == _images()
+
+
+def test_prune_keeps_images_used_by_containers(image_cache_instance, context,
+                                               fake_docker):
+    key = _build_aged(image_cache_instance, context, [('foo', 1000)])[0]
+    containers = os.path.join(os.environ['FAKE_DOCKER_DIRECTORY'],
+                              'containers')
+    with open(containers, 'w') as f:
+        json.dump({'instance': 'sha256:{}'.format(key)}, f)
+
+    assert [] == image_cache_instance.prune(max_age=100)
+    assert 2 == len(_images())
+    assert os.path.exists(
+        os.path.join(image_cache_instance.directory, key + '.json'))
+
+
+def test_prune_keeps_images_being_built(image_cache_instance, context,
+                                        fake_docker):
+    key = _build_aged(image_cache_instance, context, [('foo', 1000)])[0]
+    with image_cache_instance._lock(key):
+        assert [] == image_cache_instance.prune(max_age=100)
+
+    assert 2 == len(_images())
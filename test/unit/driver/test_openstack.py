@@ -23,6 +23,7 @@ import os
 import pytest
 
 from molecule import config
+from molecule import util
 from molecule.driver import openstack
 
 
@@ -147,7 +148,17 @@ def test_ansible_connection_options_handles_missing_instance_config(
 def test_ansible_connection_options_handles_missing_results_key(
         mocker, openstack_instance):
     m = mocker.patch('molecule.util.safe_load_file')
-    m.side_effect = StopIteration
+    m.side_effect = KeyError
+
+    assert {} == openstack_instance.ansible_connection_options('foo')
+
+
+def test_ansible_connection_options_handles_unknown_instance(
+        openstack_instance):
+    util.write_file(openstack_instance.instance_config,
+                    util.safe_dump([{
+                        'instance': 'bar'
+                    }]))
 
     assert {} == openstack_instance.ansible_connection_options('foo')
 
@@ -120,3 +120,32 @@ def test_status(mocker, static_instance):
     assert result[1].scenario_name == 'default'
     assert result[1].created == 'False'
     assert result[1].converged == 'False'
+
+
+def test_native_lifecycle_property(static_instance):
+    assert not static_instance.native_lifecycle
+
+
+@pytest.mark.parametrize('method, args, action', [
+    ('create_instances', [[]], 'create instances natively'),
+    ('destroy_instances', [[]], 'destroy instances natively'),
+    ('snapshot', ['instance-1'], 'snapshot instances'),
+    ('restore', [None, 'foo'], 'restore instances'),
+])
+def test_unsupported_capabilities_exit(patched_logger_critical,
+                                       static_instance, method, args, action):
+    with pytest.raises(SystemExit) as e:
+        getattr(static_instance, method)(*args)
+
+    assert 1 == e.value.code
+
+    msg = "The 'static' driver does not {}.".format(action)
+    patched_logger_critical.assert_called_once_with(msg)
+
+
+def test_supports_snapshot_property(static_instance):
+    assert not static_instance.supports_snapshot
+
+
+def test_remove_snapshot(static_instance):
+    assert static_instance.remove_snapshot('foo') is None
@@ -23,6 +23,7 @@ import os
 import pytest
 
 from molecule import config
+from molecule import util
 from molecule.driver import vagrant
 
 
@@ -61,6 +62,14 @@ def test_options_property(vagrant_instance):
     assert {} == vagrant_instance.options
 
 
+def test_reset_recreates_property(vagrant_instance):
+    assert not vagrant_instance.reset_recreates
+
+
+def test_definition_files(vagrant_instance):
+    assert [] == vagrant_instance.definition_files({'name': 'instance-1'})
+
+
 def test_login_cmd_template_property(vagrant_instance):
     x = ('ssh {address} -l {user} -p {port} -i {identity_file} '
          '-o UserKnownHostsFile=/dev/null '
@@ -153,7 +162,7 @@ def test_ansible_connection_options_handles_missing_instance_config(
 def test_ansible_connection_options_handles_missing_results_key(
         mocker, vagrant_instance):
     m = mocker.patch('molecule.util.safe_load_file')
-    m.side_effect = StopIteration
+    m.side_effect = KeyError
 
     assert {} == vagrant_instance.ansible_connection_options('foo')
 
@@ -172,6 +181,16 @@ def test_vagrantfile_config_property(vagrant_instance):
     assert x == vagrant_instance.vagrantfile_config
 
 
+def test_ansible_connection_options_handles_unknown_instance(
+        vagrant_instance):
+    util.write_file(vagrant_instance.instance_config,
+                    util.safe_dump([{
+                        'instance': 'bar'
+                    }]))
+
+    assert {} == vagrant_instance.ansible_connection_options('foo')
+
+
 def test_instance_config_property(vagrant_instance):
     x = os.path.join(vagrant_instance._config.ephemeral_directory,
                      'instance_config.yml')
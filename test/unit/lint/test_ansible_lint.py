@@ -19,9 +19,9 @@
 #  DEALINGS IN THE SOFTWARE.
 
 import pytest
-import sh
 
 from molecule import config
+from molecule import runner
 from molecule.lint import ansible_lint
 
 
@@ -102,7 +102,7 @@ def test_env_property(ansible_lint_instance):
 def test_bake(ansible_lint_instance):
     ansible_lint_instance.bake()
     x = [
-        str(sh.ansible_lint), '--foo=bar', '-v', '--exclude={}'.format(
+        runner.which('ansible-lint'), '--foo=bar', '-v', '--exclude={}'.format(
             ansible_lint_instance._config.ephemeral_directory),
         ansible_lint_instance._config.provisioner.playbooks.converge
     ]
@@ -143,8 +143,7 @@ def test_execute_bakes(patched_run_command, ansible_lint_instance):
 
 def test_executes_catches_and_exits_return_code(patched_run_command,
                                                 ansible_lint_instance):
-    patched_run_command.side_effect = sh.ErrorReturnCode_1(sh.ansible_lint,
-                                                           b'', b'')
+    patched_run_command.side_effect = runner.ErrorReturnCode('ansible-lint', 1)
     with pytest.raises(SystemExit) as e:
         ansible_lint_instance.execute()
 
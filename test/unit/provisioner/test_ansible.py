@@ -19,6 +19,7 @@
 #  DEALINGS IN THE SOFTWARE.
 
 import collections
+import json
 import os
 
 import pytest
@@ -86,6 +87,8 @@ def test_ns_private_member(ansible_instance):
 def test_default_config_options_property(ansible_instance):
     libraries_directory = ansible_instance._get_libraries_directory()
     filter_plugins_directory = ansible_instance._get_filter_plugin_directory()
+    callback_plugins_directory = (
+        ansible_instance._get_callback_plugin_directory())
     x = {
         'defaults': {
             'ansible_managed':
@@ -97,6 +100,8 @@ def test_default_config_options_property(ansible_instance):
             'library': '{}:$ANSIBLE_LIBRARY'.format(libraries_directory),
             'filter_plugins':
             '{}:$ANSIBLE_FILTER_PLUGINS'.format(filter_plugins_directory),
+            'callback_plugins':
+            '{}:$ANSIBLE_CALLBACK_PLUGINS'.format(callback_plugins_directory),
         },
         'ssh_connection': {
             'ssh_args': '-o UserKnownHostsFile=/dev/null',
@@ -107,6 +112,120 @@ def test_default_config_options_property(ansible_instance):
     assert x == ansible_instance.default_config_options
 
 
+def test_log_directory_property(ansible_instance):
+    x = os.path.join(ansible_instance._config.ephemeral_directory, 'logs')
+
+    assert x == ansible_instance.log_directory
+
+
+def test_capture_window_property(ansible_instance):
+    assert 1048576 == ansible_instance.capture_window
+
+
+def test_engine_property(ansible_instance):
+    assert 'subprocess' == ansible_instance.engine
+
+
+def test_engine_property_raises_when_invalid(patched_logger_critical,
+                                             ansible_instance):
+    ansible_instance._config.config['provisioner']['engine'] = 'foo'
+    with pytest.raises(SystemExit) as e:
+        ansible_instance.engine
+
+    assert 1 == e.value.code
+
+    msg = ("Invalid provisioner engine 'foo'.  Valid engines are: "
+           "'subprocess', 'worker'.")
+    patched_logger_critical.assert_called_once_with(msg)
+
+
+def test_performance_property(ansible_instance):
+    assert ansible_instance.performance is None
+
+
+def test_performance_config_options_property(ansible_instance):
+    assert {} == ansible_instance.performance_config_options
+
+
+def test_performance_config_options_property_fast(mocker, ansible_instance):
+    mocker.patch('multiprocessing.cpu_count', return_value=8)
+    ansible_instance._config.config['provisioner']['performance'] = 'fast'
+    ephemeral_directory = ansible_instance._config.ephemeral_directory
+
+    x = {
+        'defaults': {
+            'forks': 2,
+            'gathering': 'smart',
+            'fact_caching': 'jsonfile',
+            'fact_caching_connection': os.path.join(ephemeral_directory,
+                                                    'facts'),
+        },
+    }
+
+    assert x == ansible_instance.performance_config_options
+
+
+def test_performance_config_options_property_caps_forks(
+        mocker, ansible_instance):
+    mocker.patch('multiprocessing.cpu_count', return_value=2)
+    c = ansible_instance._config.config
+    c['provisioner']['performance'] = 'fast'
+    c['platforms'] = [{'name': 'instance-{}'.format(i)} for i in range(20)]
+
+    x = ansible_instance.performance_config_options['defaults']['forks']
+
+    assert 8 == x
+
+
+def test_performance_config_options_property_fast_over_ssh(
+        mocker, ansible_instance):
+    mocker.patch(
+        'molecule.driver.dockr.Dockr.ssh_connection',
+        new_callable=mocker.PropertyMock,
+        return_value=True)
+    ansible_instance._config.config['provisioner']['performance'] = 'fast'
+
+    x = {
+        'pipelining': True,
+        'ssh_args': ('-o UserKnownHostsFile=/dev/null -o ControlMaster=auto '
+                     '-o ControlPersist=60s'),
+        'control_path': os.path.join(
+            ansible_instance._get_control_path_directory(), '%%C'),
+    }
+
+    assert x == ansible_instance.performance_config_options['ssh_connection']
+
+
+def test_get_control_path_directory(ansible_instance):
+    x = ansible_instance._get_control_path_directory()
+
+    assert util.cache_directory('ssh') == os.path.dirname(x)
+    assert 12 == len(os.path.basename(x))
+
+
+def test_performance_config_options_property_raises_when_invalid(
+        patched_logger_critical, ansible_instance):
+    ansible_instance._config.config['provisioner']['performance'] = 'foo'
+    with pytest.raises(SystemExit) as e:
+        ansible_instance.performance_config_options
+
+    assert 1 == e.value.code
+
+    msg = ("Invalid provisioner performance profile 'foo'.  Valid profiles "
+           "are: 'fast'.")
+    patched_logger_critical.assert_called_once_with(msg)
+
+
+def test_config_options_property_overrides_performance_profile(
+        ansible_instance):
+    c = ansible_instance._config.config['provisioner']
+    c['performance'] = 'fast'
+    c['config_options']['defaults']['gathering'] = 'implicit'
+
+    assert 'implicit' == ansible_instance.config_options['defaults'][
+        'gathering']
+
+
 def test_default_options_property(ansible_instance):
     assert {} == ansible_instance.default_options
 
@@ -119,6 +238,7 @@ def test_default_env_property(ansible_instance):
     assert 'MOLECULE_INVENTORY_FILE' in ansible_instance.default_env
     assert 'MOLECULE_SCENARIO_DIRECTORY' in ansible_instance.default_env
     assert 'MOLECULE_INSTANCE_CONFIG' in ansible_instance.default_env
+    assert 'MOLECULE_EVENTS_FILE' not in ansible_instance.default_env
 
 
 def test_name_property(ansible_instance):
@@ -128,6 +248,8 @@ def test_name_property(ansible_instance):
 def test_config_options_property(ansible_instance):
     libraries_directory = ansible_instance._get_libraries_directory()
     filter_plugins_directory = ansible_instance._get_filter_plugin_directory()
+    callback_plugins_directory = (
+        ansible_instance._get_callback_plugin_directory())
     x = {
         'defaults': {
             'ansible_managed':
@@ -139,6 +261,8 @@ def test_config_options_property(ansible_instance):
             'library': '{}:$ANSIBLE_LIBRARY'.format(libraries_directory),
             'filter_plugins':
             '{}:$ANSIBLE_FILTER_PLUGINS'.format(filter_plugins_directory),
+            'callback_plugins':
+            '{}:$ANSIBLE_CALLBACK_PLUGINS'.format(callback_plugins_directory),
             'foo': 'bar'
         },
         'ssh_connection': {
@@ -318,6 +442,14 @@ def test_inventory_file_property(ansible_instance):
     assert x == ansible_instance.inventory_file
 
 
+def test_events_file(ansible_instance):
+    x = os.path.join(ansible_instance._config.ephemeral_directory,
+                     'events-converge.ndjson')
+
+    assert x == ansible_instance.events_file('converge')
+    assert x != ansible_instance.events_file('syntax')
+
+
 def test_config_file_property(ansible_instance):
     x = os.path.join(ansible_instance._config.ephemeral_directory,
                      'ansible.cfg')
@@ -448,7 +580,8 @@ def test_check(ansible_instance, mocker, patched_ansible_playbook):
     patched_ansible_playbook.assert_called_once_with(
         inventory_file,
         ansible_instance._config.provisioner.playbooks.converge,
-        ansible_instance._config, )
+        ansible_instance._config,
+        step='check')
     patched_ansible_playbook.return_value.add_cli_arg.assert_called_once_with(
         'check', True)
     patched_ansible_playbook.return_value.execute.assert_called_once_with()
@@ -461,12 +594,22 @@ def test_converge(ansible_instance, mocker, patched_ansible_playbook):
     patched_ansible_playbook.assert_called_once_with(
         inventory_file,
         ansible_instance._config.provisioner.playbooks.converge,
-        ansible_instance._config, )
+        ansible_instance._config,
+        step='converge')
     assert result == 'patched-ansible-playbook-stdout'
 
     patched_ansible_playbook.return_value.execute.assert_called_once_with()
 
 
+def test_converge_with_abort(ansible_instance, patched_ansible_playbook):
+    abort = object()
+    ansible_instance.converge(abort=abort)
+
+    pb = patched_ansible_playbook.return_value
+    pb.execute_until.assert_called_once_with(abort)
+    assert not pb.execute.called
+
+
 def test_converge_with_playbook(ansible_instance, mocker,
                                 patched_ansible_playbook):
     result = ansible_instance.converge('playbook')
@@ -488,7 +631,8 @@ def test_destroy(ansible_instance, mocker, patched_ansible_playbook):
     patched_ansible_playbook.assert_called_once_with(
         inventory_file,
         ansible_instance._config.provisioner.playbooks.teardown,
-        ansible_instance._config, )
+        ansible_instance._config,
+        step='destroy')
     patched_ansible_playbook.return_value.execute.assert_called_once_with()
 
 
@@ -499,10 +643,84 @@ def test_setup(ansible_instance, mocker, patched_ansible_playbook):
     patched_ansible_playbook.assert_called_once_with(
         inventory_file,
         ansible_instance._config.provisioner.playbooks.setup,
-        ansible_instance._config, )
+        ansible_instance._config,
+        step='create')
     patched_ansible_playbook.return_value.execute.assert_called_once_with()
 
 
+def test_setup_prepares_platforms(mocker, ansible_instance,
+                                  patched_ansible_playbook):
+    m = mocker.patch('molecule.driver.dockr.Dockr.prepare_platforms')
+    ansible_instance.setup()
+    ansible_instance.setup([{'name': 'instance-2'}])
+
+    x = [
+        mocker.call(ansible_instance._config.platforms.instances),
+        mocker.call([{
+            'name': 'instance-2'
+        }]),
+    ]
+    assert x == m.mock_calls
+
+
+def test_setup_with_native_lifecycle(mocker, ansible_instance,
+                                     patched_ansible_playbook):
+    m = mocker.patch('molecule.driver.dockr.Dockr.create_instances')
+    ansible_instance._config.config['driver']['options'] = {
+        'lifecycle': 'native'
+    }
+    ansible_instance.setup()
+
+    m.assert_called_once_with(ansible_instance._config.platforms.instances)
+    assert not patched_ansible_playbook.called
+
+
+def test_destroy_with_native_lifecycle(mocker, ansible_instance,
+                                       patched_ansible_playbook):
+    m = mocker.patch('molecule.driver.dockr.Dockr.destroy_instances')
+    ansible_instance._config.config['driver']['options'] = {
+        'lifecycle': 'native'
+    }
+    platforms = [{'name': 'instance-1'}]
+    ansible_instance.destroy(platforms)
+
+    m.assert_called_once_with(platforms)
+    assert not patched_ansible_playbook.called
+
+
+def test_setup_limits_platforms(ansible_instance, patched_ansible_playbook):
+    platforms = [{'name': 'instance-2'}]
+    ansible_instance.setup(platforms)
+
+    pb = patched_ansible_playbook.return_value
+    args, _ = pb.add_cli_arg.call_args
+    assert 'extra-vars' == args[0]
+    molecule_yml = json.loads(args[1])['molecule_yml']
+
+    assert platforms == molecule_yml['platforms']
+    assert ansible_instance._config.config['driver'] == molecule_yml['driver']
+    assert 2 == len(ansible_instance._config.config['platforms'])
+    pb.execute.assert_called_once_with()
+
+
+def test_destroy_limits_platforms(ansible_instance, patched_ansible_playbook):
+    platforms = [{'name': 'instance-1'}]
+    ansible_instance.destroy(platforms)
+
+    pb = patched_ansible_playbook.return_value
+    args, _ = pb.add_cli_arg.call_args
+    molecule_yml = json.loads(args[1])['molecule_yml']
+
+    assert platforms == molecule_yml['platforms']
+
+
+def test_limit_platforms_skips_without_platforms(ansible_instance,
+                                                 patched_ansible_playbook):
+    ansible_instance.destroy()
+
+    assert not patched_ansible_playbook.return_value.add_cli_arg.called
+
+
 def test_syntax(ansible_instance, mocker, patched_ansible_playbook):
     ansible_instance.syntax()
 
@@ -510,7 +728,8 @@ def test_syntax(ansible_instance, mocker, patched_ansible_playbook):
     patched_ansible_playbook.assert_called_once_with(
         inventory_file,
         ansible_instance._config.provisioner.playbooks.converge,
-        ansible_instance._config, )
+        ansible_instance._config,
+        step='syntax')
     patched_ansible_playbook.return_value.add_cli_arg.assert_called_once_with(
         'syntax-check', True)
     patched_ansible_playbook.return_value.execute.assert_called_once_with()
@@ -616,6 +835,31 @@ def test_write_config(temp_dir, ansible_instance):
     assert os.path.isfile(ansible_instance.config_file)
 
 
+def test_write_config_creates_control_path_directory(mocker, temp_dir,
+                                                     ansible_instance):
+    mocker.patch(
+        'molecule.driver.dockr.Dockr.ssh_connection',
+        new_callable=mocker.PropertyMock,
+        return_value=True)
+    ansible_instance._config.config['provisioner']['performance'] = 'fast'
+    ansible_instance.write_config()
+
+    assert os.path.isdir(ansible_instance._get_control_path_directory())
+
+
+def test_write_config_documents_performance_profile(temp_dir,
+                                                    ansible_instance):
+    ansible_instance._config.config['provisioner']['performance'] = 'fast'
+    ansible_instance.write_config()
+
+    with open(ansible_instance.config_file) as f:
+        content = f.read()
+
+    assert '# Performance profile: fast\n' in content
+    assert '#   [defaults] gathering = smart\n' in content
+    assert '\ngathering = smart\n' in content
+
+
 def test_verify_inventory(ansible_instance):
     ansible_instance._verify_inventory()
 
@@ -668,3 +912,12 @@ def test_get_filter_plugin_directory(ansible_instance):
     x = ('molecule', 'provisioner', 'ansible', 'plugins', 'filters')
 
     assert x == parts[-5:]
+
+
+def test_get_callback_plugin_directory(ansible_instance):
+    result = ansible_instance._get_callback_plugin_directory()
+    parts = pytest.helpers.os_split(result)
+    x = ('molecule', 'provisioner', 'ansible', 'plugins', 'callback')
+
+    assert x == parts[-5:]
+    assert os.path.isfile(os.path.join(result, 'molecule_events.py'))
@@ -0,0 +1,123 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import json
+import os
+import runpy
+
+import pytest
+
+import molecule
+
+pytest.importorskip('ansible.plugins.callback')
+
+
+@pytest.fixture
+def callback_module():
+    plugin = runpy.run_path(
+        os.path.join(
+            os.path.dirname(molecule.__file__), 'provisioner', 'ansible',
+            'plugins', 'callback', 'molecule_events.py'))
+
+    return plugin['CallbackModule']
+
+
+@pytest.fixture
+def events_file(temp_dir, monkeypatch):
+    filename = os.path.join(temp_dir.strpath, 'events.ndjson')
+    monkeypatch.setenv('MOLECULE_EVENTS_FILE', filename)
+
+    return filename
+
+
+def _task(mocker, name='foo', role=None):
+    task = mocker.Mock(_uuid='uuid-1', _role=role)
+    task.get_name.return_value = name
+    task.get_path.return_value = 'playbook.yml:1'
+
+    return task
+
+
+def _result(mocker, task, result):
+    host = mocker.Mock()
+    host.get_name.return_value = 'instance-1-default'
+
+    return mocker.Mock(_task=task, _host=host, _result=result)
+
+
+def _read(filename):
+    with open(filename) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_emits_task_and_result_events(mocker, events_file, callback_module):
+    role = mocker.Mock()
+    role.get_name.return_value = 'bar'
+    task = _task(mocker, role=role)
+    cb = callback_module()
+    cb.v2_playbook_on_task_start(task, False)
+    cb.v2_runner_on_ok(_result(mocker, task, {'changed': True}))
+
+    task_start, result = _read(events_file)
+
+    assert 'task_start' == task_start['event']
+    assert 'foo' == task_start['task']
+    assert 'bar' == task_start['role']
+    assert not task_start['handler']
+
+    assert 'result' == result['event']
+    assert 'instance-1-default' == result['host']
+    assert 'changed' == result['status']
+    assert result['changed']
+    assert 0 <= result['duration']
+
+
+def test_emits_failed_result(mocker, events_file, callback_module):
+    task = _task(mocker)
+    cb = callback_module()
+    cb.v2_playbook_on_task_start(task, False)
+    cb.v2_runner_on_failed(
+        _result(mocker, task, {'changed': True}), ignore_errors=True)
+
+    result = _read(events_file)[-1]
+
+    assert 'failed' == result['status']
+    assert result['changed']
+    assert result['ignore_errors']
+
+
+def test_emits_stats(mocker, events_file, callback_module):
+    stats = mocker.Mock(processed={'instance-1-default': 1})
+    stats.summarize.return_value = {'changed': 0}
+    cb = callback_module()
+    cb.v2_playbook_on_stats(stats)
+
+    x = {'instance-1-default': {'changed': 0}}
+
+    assert x == _read(events_file)[0]['hosts']
+
+
+def test_does_nothing_without_events_file(mocker, monkeypatch, temp_dir,
+                                          callback_module):
+    monkeypatch.delenv('MOLECULE_EVENTS_FILE', raising=False)
+    cb = callback_module()
+    cb.v2_playbook_on_task_start(_task(mocker), False)
+
+    assert [] == os.listdir(temp_dir.strpath)
@@ -18,11 +18,21 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import os
+import time
+
 import pytest
-import sh
 
 from molecule import ansible_playbook
 from molecule import config
+from molecule import runner
+from molecule import util
+
+
+@pytest.fixture
+def captured_ansible_playbook_instance(config_instance):
+    return ansible_playbook.AnsiblePlaybook(
+        'inventory', 'playbook', config_instance, out=None, err=None)
 
 
 @pytest.fixture
@@ -49,11 +59,38 @@ def test_config_private_member(ansible_playbook_instance):
 
 def test_bake(ansible_playbook_instance):
     ansible_playbook_instance.bake()
-    x = '{} --inventory=inventory playbook'.format(str(sh.ansible_playbook))
+    x = '{} --inventory=inventory playbook'.format(
+        runner.which('ansible-playbook'))
 
     assert x == ansible_playbook_instance._ansible_playbook_command
 
 
+def test_bake_spools_captured_output(captured_ansible_playbook_instance):
+    pb = captured_ansible_playbook_instance
+    pb.bake()
+    call_args = pb._ansible_playbook_command.call_args
+
+    assert pb.log_file == call_args['spool']
+    assert 1048576 == call_args['tee']
+
+
+def test_log_file_property(ansible_playbook_instance):
+    c = ansible_playbook_instance._config
+    x = os.path.join(c.ephemeral_directory, 'logs', 'playbook.log')
+
+    assert x == ansible_playbook_instance.log_file
+
+
+def test_log_file_property_named_after_step(config_instance):
+    config_instance.command_args = {'subcommand': 'test'}
+    pb = ansible_playbook.AnsiblePlaybook(
+        'inventory', 'playbook', config_instance, step='idempotence')
+    x = os.path.join(config_instance.ephemeral_directory, 'logs',
+                     'idempotence.log')
+
+    assert x == pb.log_file
+
+
 def test_execute(patched_run_command, ansible_playbook_instance):
     ansible_playbook_instance._ansible_playbook_command = 'patched-command'
     result = ansible_playbook_instance.execute()
@@ -67,20 +104,185 @@ def test_execute_bakes(patched_run_command, ansible_playbook_instance):
 
     assert ansible_playbook_instance._ansible_playbook_command is not None
 
-    cmd = '{} --inventory=inventory playbook'.format(str(sh.ansible_playbook))
+    cmd = '{} --inventory=inventory playbook'.format(
+        runner.which('ansible-playbook'))
     patched_run_command.assert_called_once_with(cmd, debug=None)
 
 
+def test_step_property(config_instance):
+    pb = ansible_playbook.AnsiblePlaybook(
+        'inventory', '/foo/converge.yml', config_instance, step='idempotence')
+
+    assert 'idempotence' == pb.step
+
+
+def test_step_property_defaults_to_playbook(config_instance):
+    pb = ansible_playbook.AnsiblePlaybook('inventory', '/foo/converge.yml',
+                                          config_instance)
+
+    assert 'converge' == pb.step
+
+
+def test_events_file_is_per_step(config_instance):
+    pb = ansible_playbook.AnsiblePlaybook(
+        'inventory', 'playbook', config_instance, step='syntax')
+
+    x = config_instance.provisioner.events_file('syntax')
+    assert x == pb._env['MOLECULE_EVENTS_FILE']
+
+
+def test_execute_removes_events_of_previous_run(patched_run_command,
+                                                ansible_playbook_instance):
+    events_file = ansible_playbook_instance._env['MOLECULE_EVENTS_FILE']
+    util.write_file(events_file, '{}')
+    ansible_playbook_instance._ansible_playbook_command = 'patched-command'
+    ansible_playbook_instance.execute()
+
+    assert not os.path.exists(events_file)
+
+
 def test_executes_catches_and_exits_return_code(patched_run_command,
                                                 ansible_playbook_instance):
-    patched_run_command.side_effect = sh.ErrorReturnCode_1(sh.ansible_playbook,
-                                                           b'', b'')
+    patched_run_command.side_effect = runner.ErrorReturnCode(
+        'ansible-playbook', 1)
     with pytest.raises(SystemExit) as e:
         ansible_playbook_instance.execute()
 
     assert 1 == e.value.code
 
 
+def test_execute_until_terminates_when_aborted(mocker,
+                                               ansible_playbook_instance):
+    ansible_playbook_instance._ansible_playbook_command = runner.command(
+        'sleep').bake(30)
+    abort = mocker.Mock(return_value=True)
+    start = time.time()
+    ansible_playbook_instance.execute_until(abort, interval=0.01)
+
+    assert 10 > time.time() - start
+    abort.assert_called_once_with()
+
+
+def test_execute_until_terminates_when_interrupted(mocker,
+                                                   ansible_playbook_instance):
+    ansible_playbook_instance._ansible_playbook_command = runner.command(
+        'sleep').bake(30)
+    run_command = mocker.spy(util, 'run_command')
+    abort = mocker.Mock(side_effect=KeyboardInterrupt)
+    start = time.time()
+    with pytest.raises(KeyboardInterrupt):
+        ansible_playbook_instance.execute_until(abort, interval=0.01)
+
+    assert not run_command.spy_return.is_alive()
+    assert 10 > time.time() - start
+
+
+def test_execute_until_does_not_poll_after_exit(mocker,
+                                                ansible_playbook_instance):
+    ansible_playbook_instance._ansible_playbook_command = runner.command(
+        'echo').bake(
+            'foo', _out=None, _err=None)
+    abort = mocker.Mock(return_value=True)
+    mocker.patch.object(runner.RunningCommand, 'is_alive', return_value=False)
+    result = ansible_playbook_instance.execute_until(abort, interval=0.01)
+
+    assert 'foo' == result.decode().strip()
+    assert not abort.called
+
+
+def test_execute_returns_spooled_output(captured_ansible_playbook_instance):
+    pb = captured_ansible_playbook_instance
+    pb._ansible_playbook_command = runner.command('echo').bake(
+        'foo', _out=None, _err=None, _spool=pb.log_file, _tee=1)
+    result = pb.execute()
+
+    assert isinstance(result, runner.Output)
+    assert ['foo\n'] == list(result)
+
+
+def test_execute_until_catches_and_exits_return_code(
+        mocker, ansible_playbook_instance):
+    ansible_playbook_instance._ansible_playbook_command = runner.command(
+        'false')
+    abort = mocker.Mock(return_value=False)
+    with pytest.raises(SystemExit) as e:
+        ansible_playbook_instance.execute_until(abort, interval=0.01)
+
+    assert 1 == e.value.code
+
+
+@pytest.fixture
+def patched_get_worker(mocker):
+    m = mocker.patch('molecule.ansible_worker.get_worker')
+    m.return_value.run.return_value = 0
+
+    return m
+
+
+def test_execute_in_worker(patched_run_command, patched_get_worker,
+                           ansible_playbook_instance):
+    c = ansible_playbook_instance._config.config
+    c['provisioner']['engine'] = 'worker'
+    result = ansible_playbook_instance.execute()
+
+    assert not patched_run_command.called
+    env = dict(ansible_playbook_instance._env)
+    events_file = env.pop('MOLECULE_EVENTS_FILE')
+    patched_get_worker.assert_called_once_with(env)
+    patched_get_worker.return_value.run.assert_called_once_with(
+        ['--inventory=inventory', 'playbook'],
+        ansible_playbook_instance._config.scenario.directory,
+        spool=None,
+        env={'MOLECULE_EVENTS_FILE': events_file},
+        abort=None,
+        interval=ansible_playbook.POLL_INTERVAL)
+    assert '' == result
+
+
+def test_execute_in_worker_spools_captured_output(
+        patched_get_worker, captured_ansible_playbook_instance):
+    pb = captured_ansible_playbook_instance
+    c = pb._config.config
+    c['provisioner']['engine'] = 'worker'
+    result = pb.execute()
+
+    _, kwargs = patched_get_worker.return_value.run.call_args
+    assert pb.log_file == kwargs['spool']
+    assert pb.log_file == result.filename
+
+
+def test_execute_in_worker_catches_and_exits_return_code(
+        patched_get_worker, ansible_playbook_instance):
+    c = ansible_playbook_instance._config.config
+    c['provisioner']['engine'] = 'worker'
+    patched_get_worker.return_value.run.return_value = 2
+    with pytest.raises(SystemExit) as e:
+        ansible_playbook_instance.execute()
+
+    assert 2 == e.value.code
+
+
+def test_execute_until_in_worker_returns_when_aborted(
+        mocker, patched_get_worker, ansible_playbook_instance):
+    c = ansible_playbook_instance._config.config
+    c['provisioner']['engine'] = 'worker'
+    patched_get_worker.return_value.run.return_value = None
+    abort = mocker.Mock(return_value=True)
+
+    assert '' == ansible_playbook_instance.execute_until(abort)
+
+
+def test_execute_until_in_worker_does_not_poll_after_exit(
+        mocker, patched_get_worker, ansible_playbook_instance):
+    c = ansible_playbook_instance._config.config
+    c['provisioner']['engine'] = 'worker'
+    patched_get_worker.return_value.run.return_value = 0
+    abort = mocker.Mock(return_value=True)
+    ansible_playbook_instance.execute_until(abort)
+
+    assert not abort.called
+
+
 def test_add_cli_arg(ansible_playbook_instance):
     assert {} == ansible_playbook_instance._cli
 
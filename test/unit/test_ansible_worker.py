@@ -0,0 +1,169 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+import time
+
+import pytest
+
+from molecule import ansible_worker
+
+
+def _env(**kwargs):
+    env = dict(os.environ)
+    env.update(kwargs)
+
+    return env
+
+
+@pytest.fixture
+def patched_run_playbook(mocker):
+    def run_playbook(args):
+        os.write(1, '{}\n'.format(' '.join(args)).encode())
+        return int(os.environ.get('EXIT_CODE', 0))
+
+    return mocker.patch(
+        'molecule.ansible_worker._run_playbook', side_effect=run_playbook)
+
+
+@pytest.fixture
+def worker_instance(request):
+    w = ansible_worker.Worker(_env(EXIT_CODE='0'))
+    request.addfinalizer(w.stop)
+
+    return w
+
+
+@pytest.fixture(autouse=True)
+def _workers(request):
+    request.addfinalizer(ansible_worker.stop_workers)
+
+
+def test_env_property():
+    w = ansible_worker.Worker({'foo': 'bar'})
+
+    assert {'foo': 'bar'} == w.env
+
+
+def test_run_starts_worker(patched_run_playbook, worker_instance, temp_dir):
+    assert not worker_instance.is_alive()
+
+    spool = temp_dir.join('out.log').strpath
+    assert 0 == worker_instance.run(['foo', 'bar'], temp_dir, spool=spool)
+    assert worker_instance.is_alive()
+    assert 'foo bar\n' == open(spool).read()
+
+
+def test_run_reuses_worker(patched_run_playbook, worker_instance, temp_dir):
+    spool = temp_dir.join('out.log').strpath
+    worker_instance.run(['foo'], temp_dir, spool=spool)
+    pid = worker_instance.pid
+    worker_instance.run(['foo'], temp_dir, spool=spool)
+
+    assert pid == worker_instance.pid
+
+
+def test_run_adds_env(mocker, worker_instance, temp_dir):
+    def run_playbook(args):
+        os.write(1, os.environ['FOO'].encode())
+        return 0
+
+    mocker.patch(
+        'molecule.ansible_worker._run_playbook', side_effect=run_playbook)
+    spool = temp_dir.join('out.log').strpath
+    worker_instance.run(['foo'], temp_dir, spool=spool, env={'FOO': 'bar'})
+
+    assert 'bar' == open(spool).read()
+    assert 'FOO' not in worker_instance.env
+
+
+def test_run_returns_exit_code(patched_run_playbook, temp_dir):
+    w = ansible_worker.Worker(_env(EXIT_CODE='2'))
+    try:
+        spool = temp_dir.join('out.log').strpath
+        assert 2 == w.run(['foo'], temp_dir, spool=spool)
+    finally:
+        w.stop()
+
+
+def test_run_terminates_when_aborted(mocker, worker_instance, temp_dir):
+    mocker.patch(
+        'molecule.ansible_worker._run_playbook',
+        side_effect=lambda args: time.sleep(30))
+    abort = mocker.Mock(return_value=True)
+    start = time.time()
+
+    assert worker_instance.run(
+        ['foo'], temp_dir, abort=abort, interval=0.01) is None
+    assert 10 > time.time() - start
+    assert not worker_instance.is_alive()
+
+
+def test_run_terminates_when_interrupted(mocker, worker_instance, temp_dir):
+    mocker.patch(
+        'molecule.ansible_worker._run_playbook',
+        side_effect=lambda args: time.sleep(30))
+    abort = mocker.Mock(side_effect=KeyboardInterrupt)
+    start = time.time()
+    with pytest.raises(KeyboardInterrupt):
+        worker_instance.run(['foo'], temp_dir, abort=abort, interval=0.01)
+
+    assert 10 > time.time() - start
+    assert not worker_instance.is_alive()
+
+
+def test_run_returns_when_worker_exits(mocker, worker_instance, temp_dir):
+    mocker.patch(
+        'molecule.ansible_worker._serve', side_effect=lambda conn, env: None)
+
+    assert 1 == worker_instance.run(['foo'], temp_dir, interval=0.01)
+    assert not worker_instance.is_alive()
+
+
+def test_stop(patched_run_playbook, worker_instance, temp_dir):
+    worker_instance.run(['foo'], temp_dir, spool=os.devnull)
+    worker_instance.stop()
+
+    assert not worker_instance.is_alive()
+    assert worker_instance.pid is None
+
+
+def test_terminate_workers(patched_run_playbook, temp_dir):
+    w = ansible_worker.get_worker(_env())
+    w.run(['foo'], temp_dir, spool=os.devnull)
+    ansible_worker.terminate_workers()
+
+    assert not w.is_alive()
+
+
+def test_get_worker():
+    w = ansible_worker.get_worker({'foo': 'bar'})
+
+    assert w is ansible_worker.get_worker({'foo': 'bar'})
+    assert w is not ansible_worker.get_worker({'foo': 'baz'})
+
+
+def test_stop_workers(patched_run_playbook, temp_dir):
+    w = ansible_worker.get_worker(_env())
+    w.run(['foo'], temp_dir, spool=os.devnull)
+    ansible_worker.stop_workers()
+
+    assert not w.is_alive()
+    assert [] == ansible_worker._workers
@@ -23,9 +23,11 @@ import os
 import pytest
 
 from molecule import config
+from molecule import config_cache
 from molecule import platforms
 from molecule import scenario
 from molecule import state
+from molecule import timings
 from molecule.dependency import ansible_galaxy
 from molecule.dependency import gilt
 from molecule.driver import dockr
@@ -279,6 +281,10 @@ def test_state_property(config_instance):
     assert isinstance(config_instance.state, state.State)
 
 
+def test_timings_property(config_instance):
+    assert isinstance(config_instance.timings, timings.Timings)
+
+
 def test_verifier_property(config_instance):
     assert isinstance(config_instance.verifier, testinfra.Testinfra)
 
@@ -320,6 +326,85 @@ def test_verifiers_property(config_instance):
     assert x == config_instance.verifiers
 
 
+def test_combine_stores_result_in_cache(molecule_file, config_instance):
+    c = config.Config(molecule_file)
+
+    assert config_instance.config == c.config
+    assert 1 == len(os.listdir(config_cache.ConfigCache().directory))
+
+
+def test_combine_skips_parsing_on_cache_hit(mocker, molecule_file,
+                                            config_instance):
+    patched_safe_load = mocker.patch('molecule.util.safe_load')
+    c = config.Config(molecule_file)
+
+    assert config_instance.config == c.config
+    assert not patched_safe_load.called
+
+
+def test_combine_misses_cache_when_referenced_variable_changes(
+        monkeypatch, molecule_file, molecule_data):
+    molecule_data['driver']['name'] = '${DRIVER_NAME}'
+    pytest.helpers.write_molecule_file(molecule_file, molecule_data)
+    monkeypatch.setenv('DRIVER_NAME', 'docker')
+    assert 'docker' == config.Config(molecule_file).config['driver']['name']
+
+    monkeypatch.setenv('DRIVER_NAME', 'static')
+    assert 'static' == config.Config(molecule_file).config['driver']['name']
+
+
+def test_combine_hits_cache_when_unreferenced_variable_changes(
+        mocker, monkeypatch, molecule_file, config_instance):
+    monkeypatch.setenv('UNREFERENCED', 'foo')
+    patched_safe_load = mocker.patch('molecule.util.safe_load')
+    config.Config(molecule_file)
+
+    assert not patched_safe_load.called
+
+
+def test_properties_are_memoized(config_instance):
+    for name in [
+            'dependency', 'driver', 'lint', 'platforms', 'provisioner',
+            'scenario', 'state', 'verifier'
+    ]:
+        assert getattr(config_instance, name) is getattr(config_instance, name)
+
+
+def test_invalidate(config_instance):
+    driver = config_instance.driver
+    provisioner = config_instance.provisioner
+    config_instance.invalidate('driver')
+
+    assert driver is not config_instance.driver
+    assert provisioner is config_instance.provisioner
+
+
+def test_invalidate_all(config_instance):
+    driver = config_instance.driver
+    provisioner = config_instance.provisioner
+    config_instance.invalidate()
+
+    assert driver is not config_instance.driver
+    assert provisioner is not config_instance.provisioner
+
+
+def test_state_change_invalidates_driver(config_instance):
+    assert 'docker' == config_instance.driver.name
+
+    config_instance.state.change_state('driver', 'static')
+
+    assert isinstance(config_instance.driver, static.Static)
+
+
+def test_state_reset_invalidates_driver(config_instance):
+    config_instance.state.change_state('driver', 'static')
+    assert isinstance(config_instance.driver, static.Static)
+
+    config_instance.state.reset()
+
+    assert isinstance(config_instance.driver, dockr.Dockr)
+
+
 def test_merge_dicts_instance_proxies(config_instance):
     a = {'a': 1}
     b = {'b': 2}
@@ -0,0 +1,119 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+
+import pytest
+
+from molecule import config_cache
+from molecule import util
+
+
+@pytest.fixture
+def config_cache_instance(temp_dir):
+    directory = os.path.join(temp_dir.strpath, 'cache')
+
+    return config_cache.ConfigCache(directory=directory, max_entries=2)
+
+
+def test_directory_property(temp_dir, config_cache_instance):
+    x = os.path.join(temp_dir.strpath, 'cache')
+
+    assert x == config_cache_instance.directory
+
+
+def test_directory_property_defaults_to_user_cache(molecule_cache_home):
+    c = config_cache.ConfigCache()
+    x = os.path.join(molecule_cache_home, 'molecule', 'config')
+
+    assert x == c.directory
+    assert x == util.cache_directory('config')
+
+
+def test_key(config_cache_instance):
+    x = config_cache_instance.key('foo', {'a': 1}, {'FOO': 'bar'})
+
+    assert x == config_cache_instance.key('foo', {'a': 1}, {'FOO': 'bar'})
+
+
+def test_key_changes_with_content(config_cache_instance):
+    x = config_cache_instance.key('foo', {}, {})
+
+    assert x != config_cache_instance.key('bar', {}, {})
+
+
+def test_key_changes_with_defaults(config_cache_instance):
+    x = config_cache_instance.key('foo', {'a': 1}, {})
+
+    assert x != config_cache_instance.key('foo', {'a': 2}, {})
+
+
+def test_key_changes_with_variables(config_cache_instance):
+    x = config_cache_instance.key('foo', {}, {'FOO': ''})
+
+    assert x != config_cache_instance.key('foo', {}, {'FOO': None})
+    assert x != config_cache_instance.key('foo', {}, {'FOO': 'bar'})
+
+
+def test_get_returns_none_on_miss(config_cache_instance):
+    assert config_cache_instance.get('missing') is None
+
+
+def test_set_and_get(config_cache_instance):
+    config_cache_instance.set('foo', {'foo': [{'bar': True}]})
+
+    assert {'foo': [{'bar': True}]} == config_cache_instance.get('foo')
+
+
+def test_set_restricts_permissions(config_cache_instance):
+    os.makedirs(config_cache_instance.directory, 0o755)
+    config_cache_instance.set('foo', {'foo': 'bar'})
+
+    directory = config_cache_instance.directory
+    assert 0o700 == os.stat(directory).st_mode & 0o777
+    path = config_cache_instance._get_path('foo')
+    assert 0o600 == os.stat(path).st_mode & 0o777
+
+
+def test_get_returns_none_on_corrupt_entry(config_cache_instance):
+    config_cache_instance.set('foo', {'foo': 'bar'})
+    with open(config_cache_instance._get_path('foo'), 'w') as f:
+        f.write('{')
+
+    assert config_cache_instance.get('foo') is None
+
+
+def test_set_skips_data_not_surviving_json(config_cache_instance):
+    config_cache_instance.set('foo', {1: 'bar'})
+
+    assert config_cache_instance.get('foo') is None
+
+
+def test_set_evicts_least_recently_used(config_cache_instance):
+    config_cache_instance.set('foo', {})
+    config_cache_instance.set('bar', {})
+    os.utime(config_cache_instance._get_path('foo'), (1, 1))
+    os.utime(config_cache_instance._get_path('bar'), (2, 2))
+    config_cache_instance.get('foo')
+    config_cache_instance.set('baz', {})
+
+    assert {} == config_cache_instance.get('foo')
+    assert config_cache_instance.get('bar') is None
+    assert {} == config_cache_instance.get('baz')
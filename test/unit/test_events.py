@@ -0,0 +1,134 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import json
+import os
+
+import pytest
+
+from molecule import events
+
+
+@pytest.fixture
+def events_file(temp_dir):
+    return os.path.join(temp_dir.strpath, 'events.ndjson')
+
+
+@pytest.fixture
+def reader_instance(events_file):
+    return events.EventReader(events_file)
+
+
+def _append(filename, content):
+    with open(filename, 'a') as f:
+        f.write(content)
+
+
+def _event(**kwargs):
+    return json.dumps(kwargs) + '\n'
+
+
+def test_read(events_file, reader_instance):
+    _append(events_file, _event(event='task_start') + _event(event='result'))
+
+    x = [{'event': 'task_start'}, {'event': 'result'}]
+
+    assert x == reader_instance.read()
+
+
+def test_read_returns_new_events_only(events_file, reader_instance):
+    _append(events_file, _event(event='task_start'))
+    reader_instance.read()
+    _append(events_file, _event(event='result'))
+
+    assert [{'event': 'result'}] == reader_instance.read()
+    assert [] == reader_instance.read()
+
+
+def test_read_keeps_partial_line(events_file, reader_instance):
+    line = _event(event='result')
+    _append(events_file, line[:5])
+
+    assert [] == reader_instance.read()
+
+    _append(events_file, line[5:])
+
+    assert [{'event': 'result'}] == reader_instance.read()
+
+
+def test_read_returns_empty_list_when_missing(reader_instance):
+    assert [] == reader_instance.read()
+
+
+def test_read_skips_malformed_events(events_file, patched_logger_warn,
+                                     reader_instance):
+    _append(events_file, '{foo\n' + _event(event='result'))
+
+    assert [{'event': 'result'}] == reader_instance.read()
+
+    msg = 'Skipping malformed event: {foo'
+    patched_logger_warn.assert_called_once_with(msg)
+
+
+def test_iter(events_file, reader_instance):
+    _append(events_file, _event(event='result'))
+
+    assert [{'event': 'result'}] == list(reader_instance)
+
+
+def test_results():
+    event_list = [
+        {
+            'event': 'task_start'
+        },
+        {
+            'event': 'result',
+            'status': 'ok'
+        },
+        {
+            'event': 'result',
+            'status': 'failed'
+        },
+    ]
+
+    assert event_list[1:] == events.results(event_list)
+    assert [event_list[2]] == events.results(event_list, status='failed')
+
+
+def test_changed():
+    event_list = [
+        {
+            'event': 'result',
+            'status': 'ok',
+            'changed': False
+        },
+        {
+            'event': 'result',
+            'status': 'changed',
+            'changed': True
+        },
+        {
+            'event': 'result',
+            'status': 'failed',
+            'changed': True
+        },
+    ]
+
+    assert event_list[1:] == events.changed(event_list)
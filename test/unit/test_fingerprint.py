@@ -0,0 +1,157 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+
+import os
+
+from molecule import fingerprint
+
+
+def _fingerprint(*directories, **kwargs):
+    f = fingerprint.Fingerprint()
+    for directory in directories:
+        f.add_directory(directory, **kwargs)
+
+    return f.hexdigest()
+
+
+def test_update():
+    a = fingerprint.Fingerprint()
+    a.update('foo')
+    a.update('bar')
+    b = fingerprint.Fingerprint()
+    b.update('foob')
+    b.update('ar')
+
+    assert a.hexdigest() != b.hexdigest()
+
+
+def test_add_file(temp_dir):
+    path = temp_dir.join('foo')
+    path.write('foo')
+    a = fingerprint.Fingerprint()
+    a.add_file(path.strpath)
+    path.write('bar')
+    b = fingerprint.Fingerprint()
+    b.add_file(path.strpath)
+
+    assert a.hexdigest() != b.hexdigest()
+
+
+def test_add_file_when_missing(temp_dir):
+    f = fingerprint.Fingerprint()
+    f.add_file(temp_dir.join('foo').strpath)
+
+    assert 64 == len(f.hexdigest())
+
+
+def test_add_directory(temp_dir):
+    temp_dir.join('foo').write('foo')
+    temp_dir.mkdir('bar').join('baz').write('baz')
+    x = _fingerprint(temp_dir.strpath)
+
+    assert x == _fingerprint(temp_dir.strpath)
+
+    temp_dir.join('bar', 'baz').rename(temp_dir.join('bar', 'qux'))
+
+    assert x != _fingerprint(temp_dir.strpath)
+
+
+def test_add_directory_is_relative_to_the_directory(tmpdir):
+    for name in ['foo', 'bar']:
+        tmpdir.mkdir(name).join('baz').write('baz')
+
+    x = _fingerprint(tmpdir.join('foo').strpath)
+
+    assert x == _fingerprint(tmpdir.join('bar').strpath)
+
+
+def test_add_directory_ignores_files(temp_dir):
+    temp_dir.join('foo').write('foo')
+    x = _fingerprint(temp_dir.strpath)
+    temp_dir.join('foo.pyc').write('foo')
+    temp_dir.mkdir('.git').join('HEAD').write('foo')
+    temp_dir.mkdir('bar').join('baz').write('baz')
+
+    assert x == _fingerprint(
+        temp_dir.strpath, exclude=[temp_dir.join('bar').strpath])
+
+
+def test_converge(config_instance):
+    x = fingerprint.converge(config_instance)
+
+    assert x == fingerprint.converge(config_instance)
+
+
+def test_converge_changes_with_the_role(config_instance):
+    x = fingerprint.converge(config_instance)
+    with open('tasks.yml', 'w') as f:
+        f.write('---')
+
+    assert x != fingerprint.converge(config_instance)
+
+
+def test_converge_changes_with_the_scenario(config_instance):
+    x = fingerprint.converge(config_instance)
+    path = os.path.join(config_instance.scenario.directory, 'playbook.yml')
+    with open(path, 'w') as f:
+        f.write('---')
+
+    assert x != fingerprint.converge(config_instance)
+
+
+def test_converge_changes_with_the_config(config_instance):
+    x = fingerprint.converge(config_instance)
+    config_instance.config['provisioner']['host_vars'] = {'foo': {'bar': 1}}
+
+    assert x != fingerprint.converge(config_instance)
+
+
+def test_converge_ignores_the_verifier_and_ephemeral_directories(
+        config_instance):
+    x = fingerprint.converge(config_instance)
+    for directory in [
+            config_instance.verifier.directory,
+            config_instance.ephemeral_directory
+    ]:
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        with open(os.path.join(directory, 'test_default.py'), 'w') as f:
+            f.write('')
+
+    assert x == fingerprint.converge(config_instance)
+
+
+def test_snapshot(config_instance):
+    x = fingerprint.snapshot(config_instance)
+
+    assert ['instance-1-default', 'instance-2-default'] == sorted(x.keys())
+    assert x == fingerprint.snapshot(config_instance,
+                                     fingerprint.converge(config_instance))
+    assert x != fingerprint.snapshot(config_instance, 'foo')
+
+
+def test_snapshot_changes_with_the_platform(config_instance):
+    x = fingerprint.snapshot(config_instance)
+    config_instance.config['platforms'][0]['image'] = 'foo'
+    y = fingerprint.snapshot(config_instance)
+
+    assert x['instance-1-default'] != x['instance-2-default']
+    assert x['instance-1-default'] != y['instance-1-default']
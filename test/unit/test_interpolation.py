@@ -118,3 +118,24 @@ verifier:
 """.strip()
 
     assert x == interpolator_instance(data)
+
+
+def test_referenced_variables(mock_env):
+    i = interpolation.Interpolator(interpolation.TemplateWithDefaults,
+                                   mock_env)
+    data = '$FOO ${BAR:-bar} ${missing-baz} $$escaped ${VERIFIER_NAME}'
+    x = {
+        'FOO': 'foo',
+        'BAR': '',
+        'missing': None,
+        'VERIFIER_NAME': 'testinfra',
+    }
+
+    assert x == i.referenced_variables(data)
+
+
+def test_referenced_variables_without_variables(mock_env):
+    i = interpolation.Interpolator(interpolation.TemplateWithDefaults,
+                                   mock_env)
+
+    assert {} == i.referenced_variables('foo: bar')
@@ -44,6 +44,15 @@ def test_out(capsys):
     assert '    foo\n' == stdout
 
 
+def test_out_indents_every_line(capsys):
+    log = logger.get_logger(__name__)
+    log.out('foo\nbar\n')
+
+    stdout, _ = capsys.readouterr()
+
+    assert '    foo\n    bar\n' == stdout
+
+
 def test_warn(capsys):
     log = logger.get_logger(__name__)
     log.warn('foo')
@@ -0,0 +1,154 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+import sys
+import time
+
+import pytest
+
+from molecule import parallel
+from molecule import runner
+
+
+class FakeConfig(object):
+    def __init__(self, name):
+        self.scenario = type('Scenario', (object, ), {'name': name})()
+
+
+def _write(msg):
+    # The scenario's stdout is the pipe, rather than pytest's capture.
+    os.write(1, msg.encode('utf-8'))
+
+
+def _scenario(c):
+    name = c.scenario.name
+    if name.startswith('slow'):
+        time.sleep(30)
+    _write('{} started\n'.format(name))
+    if name.startswith('fail'):
+        _write('{} failed\n'.format(name))
+        sys.exit(2)
+    _write('{} done\n'.format(name))
+
+
+@pytest.fixture
+def configs():
+    return [FakeConfig('foo'), FakeConfig('fail'), FakeConfig('barbaz')]
+
+
+def test_execute(capsys):
+    configs = [FakeConfig('foo'), FakeConfig('barbaz')]
+    results = parallel.execute(configs, _scenario, 2)
+
+    assert ['foo', 'barbaz'] == [r.scenario for r in results]
+    assert [parallel.PASSED] * 2 == [r.status for r in results]
+
+    stdout, _ = capsys.readouterr()
+    lines = stdout.splitlines()
+    assert 'foo    | foo started' in lines
+    assert 'foo    | foo done' in lines
+    assert 'barbaz | barbaz done' in lines
+
+
+def test_execute_fails_fast(capsys):
+    configs = [FakeConfig('fail'), FakeConfig('slow'), FakeConfig('foo')]
+    start = time.time()
+    results = parallel.execute(configs, _scenario, 2)
+
+    assert 10 > time.time() - start
+    x = [parallel.FAILED, parallel.CANCELLED, parallel.CANCELLED]
+    assert x == [r.status for r in results]
+    assert 0 == results[2].duration
+
+    stdout, _ = capsys.readouterr()
+    assert 'fail | fail failed' in stdout.splitlines()
+    assert 'foo started' not in stdout
+
+
+def _is_running(pid):
+    # Orphans may be left unreaped, so zombies are not counted.
+    try:
+        with open('/proc/{}/stat'.format(pid)) as f:
+            return f.read().rsplit(')', 1)[1].split()[0] not in 'ZX'
+    except IOError:
+        return False
+
+
+def test_execute_fails_fast_terminates_commands(temp_dir):
+    pid_file = temp_dir.join('pid').strpath
+
+    def scenario(c):
+        if c.scenario.name == 'fail':
+            while not os.path.exists(pid_file):
+                time.sleep(0.01)
+            sys.exit(2)
+        cmd = runner.command('sleep')(30, _bg=True)
+        with open(pid_file + '.tmp', 'w') as f:
+            f.write(str(cmd.pid))
+        os.rename(pid_file + '.tmp', pid_file)
+        cmd.wait()
+
+    configs = [FakeConfig('fail'), FakeConfig('command')]
+    start = time.time()
+    results = parallel.execute(configs, scenario, 2)
+
+    assert 10 > time.time() - start
+    assert parallel.CANCELLED == results[1].status
+
+    pid = int(open(pid_file).read())
+    while _is_running(pid) and 10 > time.time() - start:
+        time.sleep(0.01)
+    assert not _is_running(pid)
+
+
+def test_execute_keeps_going(capsys, configs):
+    results = parallel.execute(configs, _scenario, 1, keep_going=True)
+
+    x = [parallel.PASSED, parallel.FAILED, parallel.PASSED]
+    assert x == [r.status for r in results]
+
+    stdout, _ = capsys.readouterr()
+    assert 'barbaz | barbaz done' in stdout.splitlines()
+
+
+def test_execute_fails_on_exception():
+    def raises(c):
+        raise ValueError('foo')
+
+    results = parallel.execute([FakeConfig('foo')], raises, 1)
+
+    assert parallel.FAILED == results[0].status
+
+
+def test_print_summary(capsys, patched_logger_info):
+    results = [
+        parallel.Result('foo', parallel.PASSED, 1.234),
+        parallel.Result('bar', parallel.CANCELLED, 0),
+    ]
+    parallel.print_summary(results)
+
+    patched_logger_info.assert_called_once_with('Scenario results:')
+
+    stdout, _ = capsys.readouterr()
+    lines = stdout.splitlines()
+    assert ['Scenario', 'Result', 'Duration (s)'] == lines[0].split(None, 2)
+    assert ['foo', 'passed', '1.23'] == lines[2].split()
+    assert ['bar', 'cancelled', '0.00'] == lines[3].split()
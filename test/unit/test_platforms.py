@@ -18,6 +18,8 @@
 #  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 #  DEALINGS IN THE SOFTWARE.
 
+import os
+
 import pytest
 
 from molecule import platforms
@@ -54,3 +56,169 @@ def test_platforms_with_scenario_name(platform_instance):
     }]
 
     assert x == platform_instance.instances_with_scenario_name
+
+
+def test_platforms_with_scenario_name_does_not_modify_platforms(
+        platform_instance):
+    platform_instance.instances_with_scenario_name[0]['name'] = 'foo'
+
+    assert 'instance-1' == platform_instance.instances[0]['name']
+
+
+def test_instance_models_property(platform_instance):
+    instances = platform_instance.instance_models
+
+    assert ['instance-1-default',
+            'instance-2-default'] == [i.name for i in instances]
+    assert 'instance-1' == instances[0].platform_name
+    assert ('foo', 'bar') == instances[0].groups
+    assert ('child1', ) == instances[0].children
+    assert platform_instance.instances[0] is instances[0].platform
+
+
+def test_instance_models_are_built_once(platform_instance):
+    assert (platform_instance.instance_models is
+            platform_instance.instance_models)
+
+
+def test_instance_models_rebuilt_when_platforms_replaced(platform_instance):
+    platform_instance.instance_models
+    platform_instance._config.config['platforms'] = [{'name': 'instance-3'}]
+
+    x = ['instance-3-default']
+
+    assert x == [i.name for i in platform_instance.instance_models]
+
+
+def test_instance_has_slots(platform_instance):
+    instance = platform_instance.instance_models[0]
+
+    assert not hasattr(instance, '__dict__')
+    with pytest.raises(AttributeError):
+        instance.foo = 'bar'
+
+
+def test_groups_property(platform_instance):
+    groups = platform_instance.groups
+
+    assert ['foo', 'bar', 'baz'] == list(groups.keys())
+    assert ['instance-1-default',
+            'instance-2-default'] == [i.name for i in groups['foo']]
+    assert ['instance-2-default'] == [i.name for i in groups['baz']]
+
+
+def test_groups_property_handles_missing_groups(platform_instance):
+    platform_instance._config.config['platforms'] = [{'name': 'instance-1'}]
+
+    x = ['instance-1-default']
+
+    assert x == [i.name for i in platform_instance.groups['ungrouped']]
+
+
+def test_get_instance(platform_instance):
+    instance = platform_instance.get_instance('instance-2-default')
+
+    assert 'instance-2' == instance.platform_name
+
+
+def test_get_instance_returns_none_when_missing(platform_instance):
+    assert platform_instance.get_instance('instance-2') is None
+
+
+def _record(config_instance, instance_name, platform):
+    config_instance.state.change_instance_state(instance_name, 'created', True)
+    config_instance.state.change_instance_state(instance_name, 'platform',
+                                                platform)
+
+
+def test_uncreated_property(platform_instance):
+    c = platform_instance._config
+    _record(c, 'instance-1-default', platform_instance.instances[0])
+
+    assert [platform_instance.instances[1]] == platform_instance.uncreated
+
+
+def test_uncreated_property_all_when_nothing_recorded(platform_instance):
+    assert platform_instance.instances == platform_instance.uncreated
+
+
+def test_stale_property(platform_instance):
+    c = platform_instance._config
+    _record(c, 'instance-1-default', platform_instance.instances[0])
+    _record(c, 'instance-2-default', {'name': 'instance-2', 'groups': ['foo']})
+    _record(c, 'instance-3-default', {'name': 'instance-3'})
+
+    x = {
+        'instance-2-default': {
+            'name': 'instance-2',
+            'groups': ['foo'],
+        },
+        'instance-3-default': {
+            'name': 'instance-3',
+        },
+    }
+
+    assert x == platform_instance.stale
+
+
+def test_stale_property_empty_when_unchanged(platform_instance):
+    c = platform_instance._config
+    for platform in platform_instance.instances:
+        _record(c, '{}-default'.format(platform['name']), platform)
+
+    assert {} == platform_instance.stale
+
+
+def test_stale_property_when_definition_changed(platform_instance):
+    c = platform_instance._config
+    for platform in platform_instance.instances:
+        _record(c, '{}-default'.format(platform['name']), platform)
+    c.state.change_instance_state('instance-1-default', 'definition', 'foo')
+    instance = platform_instance.get_instance('instance-2-default')
+    c.state.change_instance_state('instance-2-default', 'definition',
+                                  platform_instance.definition(instance))
+
+    x = {'instance-1-default': platform_instance.instances[0]}
+
+    assert x == platform_instance.stale
+
+
+def test_expired(mocker, platform_instance):
+    c = platform_instance._config
+    mocker.patch('time.time', return_value=100.0)
+    for platform in platform_instance.instances:
+        _record(c, '{}-default'.format(platform['name']), platform)
+    c.state.change_instance_state('instance-1-default', 'created_at', 30.0)
+    c.state.change_instance_state('instance-2-default', 'created_at', 90.0)
+
+    x = {'instance-1-default': platform_instance.instances[0]}
+
+    assert x == platform_instance.expired(60)
+
+
+def test_expired_when_creation_time_not_recorded(platform_instance):
+    c = platform_instance._config
+    _record(c, 'instance-1-default', platform_instance.instances[0])
+
+    assert ['instance-1-default'] == list(platform_instance.expired(60))
+
+
+def test_definition(platform_instance):
+    instance = platform_instance.get_instance('instance-1-default')
+    x = platform_instance.definition(instance)
+
+    assert 64 == len(x)
+    assert x == platform_instance.definition(instance)
+    assert x != platform_instance.definition(
+        platform_instance.get_instance('instance-2-default'))
+
+
+def test_definition_changes_with_dockerfile(platform_instance):
+    instance = platform_instance.get_instance('instance-1-default')
+    x = platform_instance.definition(instance)
+    path = os.path.join(platform_instance._config.scenario.directory,
+                        'Dockerfile')
+    with open(path, 'w') as f:
+        f.write('FROM foo')
+
+    assert x != platform_instance.definition(instance)
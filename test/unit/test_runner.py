@@ -0,0 +1,286 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+import signal
+import sys
+import time
+
+import pytest
+
+from molecule import runner
+
+
+@pytest.fixture
+def python_command():
+    return runner.Command(sys.executable).bake('-c')
+
+
+def test_which():
+    x = runner.which('sh')
+
+    assert os.path.isabs(x)
+    assert x == runner.which('sh')
+
+
+def test_which_caches_lookups(mocker):
+    runner._executables.pop(('foo', '/bar'), None)
+    m = mocker.patch('molecule.runner._is_executable', return_value=True)
+    runner.which('foo', path='/bar')
+    runner.which('foo', path='/bar')
+
+    assert '/bar/foo' == runner.which('foo', path='/bar')
+    m.assert_called_once_with('/bar/foo')
+
+
+def test_which_returns_none_when_not_found():
+    assert runner.which('foo', path='/nonexistent') is None
+
+
+def test_command():
+    cmd = runner.command('ls')
+
+    assert runner.which('ls') == cmd.path
+    assert [] == cmd.args
+
+
+def test_command_raises_when_not_found(monkeypatch):
+    monkeypatch.setenv('PATH', '/nonexistent')
+    with pytest.raises(runner.CommandNotFound):
+        runner.command('ls')
+
+
+def test_bake():
+    cmd = runner.Command('/bin/foo').bake(
+        'bar', ['baz', 1], {'foo_bar': 'baz',
+                            'qux': True,
+                            'quux': False,
+                            'v': True},
+        foo_baz='qux',
+        _cwd='/tmp')
+    x = [
+        'bar', 'baz', '1', '--foo_bar=baz', '--qux', '-v', '--foo-baz=qux'
+    ]
+
+    assert x == cmd.args
+    assert {'cwd': '/tmp'} == cmd.call_args
+
+
+def test_bake_returns_a_new_command():
+    cmd = runner.Command('/bin/foo', ['bar'], {'env': {}})
+    baked = cmd.bake('baz', _cwd='/tmp')
+
+    assert ['bar'] == cmd.args
+    assert ['bar', 'baz'] == baked.args
+    assert {'env': {}, 'cwd': '/tmp'} == baked.call_args
+
+
+def test_str():
+    cmd = runner.Command('/bin/foo').bake('bar', inventory='baz')
+
+    assert '/bin/foo bar --inventory=baz' == str(cmd)
+    assert '/bin/foo bar --inventory=baz' == cmd
+
+
+def test_env_property():
+    assert runner.Command('/bin/foo').env is None
+    assert {
+        'FOO': 'bar'
+    } == runner.Command('/bin/foo').bake(_env={'FOO': 'bar'}).env
+
+
+def test_call_captures_output(python_command):
+    cmd = python_command.bake('print("foo"); print("bar")', _out=None)
+    result = cmd()
+
+    assert 0 == result.exit_code
+    assert b'foo\nbar\n' == result.stdout
+
+
+def test_call_streams_batches_of_lines(python_command):
+    out = []
+    cmd = python_command.bake(
+        'import sys; sys.stdout.write("foo\\nbar\\nbaz")', _out=out.append)
+    cmd()
+
+    assert 'foo\nbar\nbaz' == ''.join(out)
+    assert 3 > len(out)
+    assert all(o.endswith('\n') for o in out[:-1])
+
+
+def test_call_streams_stderr(python_command):
+    err = []
+    cmd = python_command.bake(
+        'import sys; sys.stderr.write("foo\\n")', _err=err.append)
+    cmd()
+
+    assert ['foo\n'] == err
+
+
+def test_call_keeps_tail_of_streamed_output(python_command):
+    out = []
+    cmd = python_command.bake(
+        'for i in range(10000): print(i)', _out=out.append, _tee=10)
+    result = cmd()
+
+    assert 10000 == ''.join(out).count('\n')
+    assert b'9998\n9999\n' == result.stdout[-10:]
+    assert 10 == len(result.stdout)
+
+
+def test_call_spools_captured_output(python_command, temp_dir):
+    spool = temp_dir.join('out.log').strpath
+    cmd = python_command.bake(
+        'for i in range(10000): print(i)', _out=None, _spool=spool, _tee=10)
+    result = cmd()
+
+    assert b'9998\n9999\n' == result.stdout
+    assert 10000 == len(list(runner.Output(spool)))
+
+
+def test_output(temp_dir):
+    path = temp_dir.join('out.log')
+    path.write('foo\nbar\n')
+    output = runner.Output(path.strpath)
+
+    assert path.strpath == output.filename
+    assert ['foo\n', 'bar\n'] == list(output)
+
+
+def test_call_uses_cwd_and_env(python_command, temp_dir):
+    cmd = python_command.bake(
+        'import os; print(os.getcwd()); print(os.environ["FOO"])',
+        _cwd=temp_dir.strpath,
+        _env={'FOO': 'bar'},
+        _out=None)
+    result = cmd()
+
+    x = '{}\nbar\n'.format(os.path.realpath(temp_dir.strpath))
+    assert x == result.stdout.decode()
+
+
+def test_call_attaches_stdout_to_a_tty(python_command):
+    cmd = python_command.bake(
+        'import sys; print(sys.stdout.isatty())', _out=None)
+
+    assert b'True\n' == cmd().stdout
+    assert b'False\n' == cmd(_tty_out=False).stdout
+
+
+def test_call_raises_on_non_zero_exit_code(python_command):
+    cmd = python_command.bake(
+        'import sys; print("foo"); sys.exit(2)', _out=lambda _: None)
+    with pytest.raises(runner.ErrorReturnCode) as e:
+        cmd()
+
+    assert 2 == e.value.exit_code
+    assert b'foo\n' == e.value.stdout
+    assert str(cmd) == e.value.full_cmd
+
+
+def test_call_in_background(python_command):
+    cmd = python_command.bake('import time; time.sleep(30)', _bg=True)
+    start = time.time()
+    result = cmd()
+
+    assert result.is_alive()
+
+    result.signal_group(signal.SIGTERM)
+    with pytest.raises(runner.ErrorReturnCode) as e:
+        result.wait()
+
+    assert -signal.SIGTERM == e.value.exit_code
+    assert not result.is_alive()
+    assert 10 > time.time() - start
+
+
+def test_error_return_code():
+    e = runner.ErrorReturnCode('/bin/foo', 1, b'bar', b'baz')
+
+    assert 1 == e.exit_code
+    assert 'RAN: /bin/foo' in str(e)
+    assert 'bar' in str(e)
+    assert 'baz' in str(e)
+
+
+def test_call_terminates_command_when_callable_raises(python_command):
+    def out(_):
+        raise KeyboardInterrupt
+
+    cmd = python_command.bake(
+        'import time; print("foo"); time.sleep(30)', _out=out)
+    start = time.time()
+    with pytest.raises(KeyboardInterrupt):
+        cmd()
+
+    assert 10 > time.time() - start
+
+
+def test_call_terminates_command_when_interrupted(python_command):
+    def interrupt(signum, frame):
+        raise KeyboardInterrupt
+
+    handler = signal.signal(signal.SIGALRM, interrupt)
+    cmd = python_command.bake('import time; time.sleep(30)', _out=None)
+    start = time.time()
+    try:
+        signal.alarm(1)
+        with pytest.raises(KeyboardInterrupt):
+            cmd()
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, handler)
+
+    assert 10 > time.time() - start
+
+
+def test_context_manager_terminates_background_command_when_raising(
+        python_command):
+    cmd = python_command.bake('import time; time.sleep(30)', _bg=True)
+    start = time.time()
+    with pytest.raises(KeyboardInterrupt):
+        with cmd() as result:
+            raise KeyboardInterrupt
+
+    assert not result.is_alive()
+    assert -signal.SIGTERM == result.exit_code
+    assert 10 > time.time() - start
+
+
+def test_context_manager_leaves_background_command_running(python_command):
+    cmd = python_command.bake('import time; time.sleep(30)', _bg=True)
+    with cmd() as result:
+        pass
+
+    assert result.is_alive()
+
+    result.signal_group(signal.SIGTERM)
+    with pytest.raises(runner.ErrorReturnCode):
+        result.wait()
+
+
+def test_signal_running(python_command):
+    cmd = python_command.bake('import time; time.sleep(30)', _bg=True)
+    result = cmd()
+    runner.signal_running(signal.SIGTERM)
+
+    with pytest.raises(runner.ErrorReturnCode):
+        result.wait()
+    assert result not in runner._running
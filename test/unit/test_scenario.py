@@ -36,6 +36,23 @@ def test_directory_property(molecule_scenario_directory, scenario_instance):
     assert molecule_scenario_directory == scenario_instance.directory
 
 
+def test_scheduler_property(scenario_instance):
+    assert 'linear' == scenario_instance.scheduler
+
+
+def test_scheduler_property_raises_when_invalid(patched_logger_critical,
+                                                scenario_instance):
+    scenario_instance._config.config['scenario']['scheduler'] = 'foo'
+    with pytest.raises(SystemExit) as e:
+        scenario_instance.scheduler
+
+    assert 1 == e.value.code
+
+    msg = ("Invalid scenario scheduler 'foo'.  Valid schedulers are: "
+           "'linear', 'graph'.")
+    patched_logger_critical.assert_called_once_with(msg)
+
+
 def test_check_sequence_property(scenario_instance):
     x = ['destroy', 'create', 'converge', 'check', 'destroy']
 
@@ -0,0 +1,139 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import threading
+
+import pytest
+
+from molecule import scheduler
+
+
+def _requires(sequence):
+    return [(s.name, s.requires) for s in scheduler.graph(sequence)]
+
+
+def test_graph():
+    sequence = [
+        'destroy', 'dependency', 'syntax', 'create', 'converge', 'idempotence',
+        'lint', 'verify', 'destroy'
+    ]
+    x = [
+        ('destroy', []),
+        ('dependency', [0]),
+        ('syntax', [0, 1]),
+        ('create', [0]),
+        ('converge', [0, 1, 3]),
+        ('idempotence', [0, 4]),
+        ('lint', [0, 1]),
+        ('verify', [0, 5]),
+        ('destroy', [0, 1, 2, 3, 4, 5, 6, 7]),
+    ]
+
+    assert x == _requires(sequence)
+
+
+def test_graph_waits_for_latest_occurrence():
+    sequence = ['create', 'destroy', 'create', 'converge']
+    x = [
+        ('create', []),
+        ('destroy', [0]),
+        ('create', [1]),
+        ('converge', [1, 2]),
+    ]
+
+    assert x == _requires(sequence)
+
+
+def test_graph_ignores_missing_prerequisites():
+    x = [('lint', []), ('converge', [])]
+
+    assert x == _requires(['lint', 'converge'])
+
+
+def test_graph_of_test_sequence(config_instance):
+    sequence = config_instance.scenario.test_sequence
+    steps = scheduler.graph(sequence)
+    destroys = [s.index for s in steps if s.name == 'destroy']
+
+    assert [0, len(sequence) - 1] == destroys
+    assert all(0 in s.requires for s in steps[1:])
+    assert list(range(len(sequence) - 1)) == steps[-1].requires
+
+
+def test_graph_orders_unknown_steps():
+    x = [('foo', []), ('lint', []), ('bar', [0])]
+
+    assert x == _requires(['foo', 'lint', 'bar'])
+
+
+def test_execute_overlaps_independent_steps():
+    sequence = ['dependency', 'create', 'converge']
+    started = []
+    create_started = threading.Event()
+    dependency_done = threading.Event()
+
+    def func(step):
+        started.append(step)
+        if step == 'dependency':
+            # Completes only once create is running alongside.
+            assert create_started.wait(10)
+            dependency_done.set()
+        elif step == 'create':
+            create_started.set()
+        elif step == 'converge':
+            assert dependency_done.is_set()
+
+    scheduler.execute(sequence, func)
+
+    assert {'dependency', 'create'} == set(started[:2])
+    assert 'converge' == started[2]
+
+
+def test_execute_raises_first_failure_and_stops():
+    started = []
+
+    def func(step):
+        started.append(step)
+        if step == 'create':
+            raise SystemExit(2)
+
+    with pytest.raises(SystemExit) as e:
+        scheduler.execute(['destroy', 'create', 'converge', 'verify'], func)
+
+    assert 2 == e.value.code
+    assert ['destroy', 'create'] == started
+
+
+def test_execute_waits_for_running_steps_on_failure():
+    finished = []
+    lint_started = threading.Event()
+
+    def func(step):
+        if step == 'lint':
+            lint_started.set()
+            finished.append(step)
+        elif step == 'create':
+            assert lint_started.wait(10)
+            raise SystemExit(1)
+
+    with pytest.raises(SystemExit):
+        scheduler.execute(['create', 'lint', 'converge'], func)
+
+    assert ['lint'] == finished
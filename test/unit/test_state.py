@@ -19,6 +19,7 @@
 #  DEALINGS IN THE SOFTWARE.
 
 import os
+import threading
 
 import pytest
 
@@ -38,10 +39,32 @@ def test_state_file_property(state_instance):
     assert x == state_instance.state_file
 
 
+def test_lock_file_property(state_instance):
+    x = os.path.join(state_instance._config.ephemeral_directory,
+                     'state.yml.lock')
+
+    assert x == state_instance.lock_file
+
+
+def test_init_writes_missing_state_file(state_instance):
+    assert os.path.isfile(state_instance.state_file)
+
+
+def test_init_does_not_write_existing_state_file(mocker, state_instance):
+    patched_write_file = mocker.patch('molecule.util.write_file')
+    state.State(state_instance._config)
+
+    assert not patched_write_file.called
+
+
 def test_converged(state_instance):
     assert not state_instance.converged
 
 
+def test_converged_fingerprint(state_instance):
+    assert state_instance.converged_fingerprint is None
+
+
 def test_created(state_instance):
     assert not state_instance.created
 
@@ -50,6 +73,10 @@ def test_driver(state_instance):
     assert not state_instance.driver
 
 
+def test_idempotent_fingerprint(state_instance):
+    assert state_instance.idempotent_fingerprint is None
+
+
 def test_reset(state_instance):
     assert not state_instance.converged
 
@@ -85,6 +112,12 @@ def test_change_state_created(state_instance):
     assert state_instance.created
 
 
+def test_change_state_converged_fingerprint(state_instance):
+    state_instance.change_state('converged_fingerprint', 'foo')
+
+    assert 'foo' == state_instance.converged_fingerprint
+
+
 def test_change_state_driver(state_instance):
     state_instance.change_state('driver', 'foo')
 
@@ -96,6 +129,173 @@ def test_change_state_raises(state_instance):
         state_instance.change_state('invalid-state', True)
 
 
+def test_instances(state_instance):
+    assert {} == state_instance.instances
+
+
+def test_change_instance_state(state_instance):
+    state_instance.change_instance_state('instance-1', 'created', True)
+    state_instance.change_instance_state('instance-1', 'platform',
+                                         {'name': 'instance-1'})
+
+    x = {
+        'instance-1': {
+            'created': True,
+            'platform': {
+                'name': 'instance-1'
+            },
+        },
+    }
+
+    assert x == state_instance.instances
+    assert x == util.safe_load_file(state_instance.state_file)['instances']
+
+
+def test_change_instance_state_raises(state_instance):
+    with pytest.raises(state.InvalidState):
+        state_instance.change_instance_state('instance-1', 'invalid', True)
+
+
+def test_remove_instance(state_instance):
+    state_instance.change_instance_state('instance-1', 'created', True)
+    state_instance.change_instance_state('instance-2', 'created', True)
+    state_instance.remove_instance('instance-1')
+
+    assert ['instance-2'] == list(state_instance.instances.keys())
+
+
+def test_remove_missing_instance(state_instance):
+    state_instance.remove_instance('instance-1')
+
+    assert {} == state_instance.instances
+
+
+def test_transaction_writes_once(mocker, state_instance):
+    patched_write_file = mocker.patch('molecule.util.write_file')
+    with state_instance.transaction():
+        state_instance.change_state('created', True)
+        state_instance.change_state('driver', 'foo')
+
+        assert state_instance.created
+        assert not patched_write_file.called
+
+    assert 1 == patched_write_file.call_count
+
+
+def test_transaction_persists(state_instance):
+    with state_instance.transaction():
+        state_instance.change_state('created', True)
+        state_instance.change_state('driver', 'foo')
+
+    d = util.safe_load_file(state_instance.state_file)
+    assert d.get('created')
+    assert 'foo' == d.get('driver')
+
+
+def test_transaction_rolls_back_on_error(state_instance):
+    with pytest.raises(state.InvalidState):
+        with state_instance.transaction():
+            state_instance.change_state('created', True)
+            state_instance.change_state('invalid-state', True)
+
+    assert not state_instance.created
+    d = util.safe_load_file(state_instance.state_file)
+    assert not d.get('created')
+
+
+def test_transaction_invalidates_driver(mocker, state_instance):
+    patched_invalidate = mocker.patch('molecule.config.Config.invalidate')
+    with state_instance.transaction():
+        state_instance.change_state('driver', 'foo')
+
+    patched_invalidate.assert_called_once_with('driver')
+
+
+def test_reads_are_served_from_memory(mocker, state_instance):
+    patched_safe_load_file = mocker.patch('molecule.util.safe_load_file')
+    state_instance.change_state('converged', True)
+
+    assert state_instance.converged
+    assert state_instance.created is False
+    assert not patched_safe_load_file.called
+
+
+def test_reads_reload_state_file_replaced_by_another_process(
+        state_instance):
+    other = state.State(state_instance._config)
+    other.change_state('converged', True)
+
+    assert state_instance.converged
+
+
+def test_changes_serialize_on_lock(state_instance):
+    other = state.State(state_instance._config)
+    t = threading.Thread(target=other.change_state, args=('created', True))
+    with state_instance._lock():
+        t.start()
+        t.join(0.2)
+
+        assert t.is_alive()
+        assert not state_instance.created
+
+    t.join()
+    assert state_instance.created
+
+
+def test_transactions_serialize_between_threads(state_instance):
+    started = threading.Event()
+    release = threading.Event()
+
+    def transaction():
+        with state_instance.transaction():
+            started.set()
+            release.wait()
+
+    t = threading.Thread(target=transaction)
+    t.start()
+    started.wait()
+    other = threading.Thread(
+        target=state_instance.change_state, args=('created', True))
+    try:
+        other.start()
+        other.join(0.2)
+
+        assert other.is_alive()
+    finally:
+        release.set()
+        t.join()
+    other.join()
+    assert util.safe_load_file(state_instance.state_file)['created']
+
+
+def test_load_file_stamps_before_reading(mocker, state_instance):
+    safe_load_file = util.safe_load_file
+
+    def replaced_after_reading(filename):
+        data = safe_load_file(filename)
+        util.atomic_write(filename,
+                          util.safe_dump(dict(data, created=True)))
+
+        return data
+
+    patched_safe_load_file = mocker.patch(
+        'molecule.util.safe_load_file', side_effect=replaced_after_reading)
+    state_instance._load_file()
+    patched_safe_load_file.side_effect = safe_load_file
+
+    assert state_instance.created
+
+
+def test_change_merges_changes_of_another_process(state_instance):
+    other = state.State(state_instance._config)
+    other.change_state('created', True)
+    state_instance.change_state('driver', 'foo')
+
+    d = util.safe_load_file(state_instance.state_file)
+    assert d.get('created')
+    assert 'foo' == d.get('driver')
+
+
 def test_get_data_loads_existing_state_file(temp_dir, molecule_data):
     molecule_directory = config.molecule_directory(temp_dir.strpath)
     scenario_directory = os.path.join(molecule_directory, 'default')
@@ -0,0 +1,159 @@
+#  Copyright (c) 2015-2017 Cisco Systems, Inc.
+#
+#  Permission is hereby granted, free of charge, to any person obtaining a copy
+#  of this software and associated documentation files (the "Software"), to
+#  deal in the Software without restriction, including without limitation the
+#  rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+#  sell copies of the Software, and to permit persons to whom the Software is
+#  furnished to do so, subject to the following conditions:
+#
+#  The above copyright notice and this permission notice shall be included in
+#  all copies or substantial portions of the Software.
+#
+#  THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#  IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#  FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#  AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#  LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#  FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#  DEALINGS IN THE SOFTWARE.
+
+import os
+
+import pytest
+
+from molecule import timings
+
+
+@pytest.fixture
+def timings_instance(config_instance):
+    return timings.Timings(config_instance)
+
+
+@pytest.fixture
+def event_list():
+    return [{
+        'event': 'task_start',
+        'task': 'apt',
+        'time': 100.0,
+    }, {
+        'event': 'result',
+        'host': 'instance-1-default',
+        'role': 'foo',
+        'task': 'foo : apt',
+        'handler': False,
+        'path': 'tasks/main.yml:1',
+        'duration': 3.0,
+        'time': 103.0,
+    }, {
+        'event': 'result',
+        'host': 'instance-2-default',
+        'role': None,
+        'task': 'debug',
+        'handler': False,
+        'path': 'playbook.yml:4',
+        'duration': 0.5,
+        'time': 104.5,
+    }]
+
+
+def test_timings_file_property(timings_instance):
+    x = os.path.join(timings_instance._config.ephemeral_directory,
+                     'timings.json')
+
+    assert x == timings_instance.timings_file
+
+
+def test_data_property_when_missing(timings_instance):
+    assert {} == timings_instance.data
+
+
+def test_record(timings_instance, event_list):
+    timings_instance.record('converge', event_list)
+
+    x = {
+        'converge': {
+            'duration': 4.5,
+            'hosts': {
+                'instance-1-default': 3.0,
+                'instance-2-default': 0.5,
+            },
+            'roles': {
+                'foo': 3.0
+            },
+            'tasks': [{
+                'task': 'foo : apt',
+                'role': 'foo',
+                'host': 'instance-1-default',
+                'handler': False,
+                'path': 'tasks/main.yml:1',
+                'duration': 3.0,
+            }, {
+                'task': 'debug',
+                'role': None,
+                'host': 'instance-2-default',
+                'handler': False,
+                'path': 'playbook.yml:4',
+                'duration': 0.5,
+            }],
+        },
+    }
+
+    assert x == timings_instance.data
+
+
+def test_record_replaces_step_only(timings_instance, event_list):
+    timings_instance.record('converge', event_list)
+    timings_instance.record('idempotence', event_list)
+    timings_instance.record('converge', event_list[:2])
+
+    data = timings_instance.data
+
+    assert 1 == len(data['converge']['tasks'])
+    assert 2 == len(data['idempotence']['tasks'])
+
+
+def test_reset(timings_instance, event_list):
+    timings_instance.record('converge', event_list)
+    timings_instance.reset()
+
+    assert {} == timings_instance.data
+    assert not os.path.exists(timings_instance.timings_file)
+
+
+def test_reset_when_missing(timings_instance):
+    timings_instance.reset()
+
+    assert {} == timings_instance.data
+
+
+def test_slowest(timings_instance, event_list):
+    timings_instance.record('converge', event_list)
+    timings_instance.record('idempotence', event_list[:2])
+
+    result = timings_instance.slowest(2)
+
+    assert [('converge', 'foo : apt'), ('idempotence', 'foo : apt')] == [
+        (t['step'], t['task']) for t in result
+    ]
+
+
+def test_print_summary(capsys, patched_logger_info, timings_instance,
+                       event_list):
+    timings_instance.record('converge', event_list)
+    timings_instance.print_summary()
+
+    msg = 'Slowest tasks of scenario: [default]'
+    patched_logger_info.assert_called_once_with(msg)
+
+    out, _ = capsys.readouterr()
+    assert 'foo : apt' in out
+    assert '3.00s' in out
+
+
+def test_print_summary_skips_without_timings(capsys, patched_logger_info,
+                                             timings_instance):
+    timings_instance.print_summary()
+
+    assert not patched_logger_info.called
+    assert '' == capsys.readouterr()[0]
@@ -25,9 +25,10 @@ import os
 
 import colorama
 import pytest
-import sh
+import yaml
 
 from molecule import config
+from molecule import runner
 from molecule import util
 
 colorama.init(autoreset=True)
@@ -132,31 +133,33 @@ def test_sysexit_with_message_and_custom_code(patched_logger_critical):
 
 
 def test_run_command():
-    cmd = sh.ls.bake()
+    cmd = runner.command('ls').bake()
     x = util.run_command(cmd)
 
     assert 0 == x.exit_code
 
 
 def test_run_command_with_debug(mocker, patched_print_debug):
-    cmd = sh.ls.bake(_env={'ANSIBLE_FOO': 'foo', 'MOLECULE_BAR': 'bar'})
+    cmd = runner.command('ls').bake(
+        _env={'ANSIBLE_FOO': 'foo',
+              'MOLECULE_BAR': 'bar'})
     util.run_command(cmd, debug=True)
     x = [
         mocker.call('ANSIBLE ENVIRONMENT', '---\nANSIBLE_FOO: foo\n'),
         mocker.call('MOLECULE ENVIRONMENT', '---\nMOLECULE_BAR: bar\n'),
-        mocker.call('COMMAND', sh.which('ls'))
+        mocker.call('COMMAND', runner.which('ls'))
     ]
 
     assert x == patched_print_debug.mock_calls
 
 
 def test_run_command_with_debug_handles_no_env(mocker, patched_print_debug):
-    cmd = sh.ls.bake()
+    cmd = runner.command('ls').bake()
     util.run_command(cmd, debug=True)
     x = [
         mocker.call('ANSIBLE ENVIRONMENT', '--- {}\n'),
         mocker.call('MOLECULE ENVIRONMENT', '--- {}\n'),
-        mocker.call('COMMAND', sh.which('ls'))
+        mocker.call('COMMAND', runner.which('ls'))
     ]
 
     assert x == patched_print_debug.mock_calls
@@ -175,6 +178,19 @@ def test_os_walk(temp_dir):
     assert 3 == len(result)
 
 
+def test_cache_directory(monkeypatch):
+    monkeypatch.setenv('XDG_CACHE_HOME', '/foo')
+
+    assert '/foo/molecule/bar' == util.cache_directory('bar')
+
+
+def test_cache_directory_defaults_to_home(monkeypatch):
+    monkeypatch.delenv('XDG_CACHE_HOME', raising=False)
+    x = os.path.join(os.path.expanduser('~'), '.cache', 'molecule')
+
+    assert x == util.cache_directory()
+
+
 def test_render_template():
     template = "{{ foo }} = {{ bar}}"
 
@@ -192,12 +208,104 @@ def test_write_file(temp_dir):
     assert x == data
 
 
+def test_write_file_returns_true_when_written(temp_dir):
+    dest_file = os.path.join(temp_dir.strpath, 'foo')
+
+    assert util.write_file(dest_file, 'foo')
+
+
+def test_write_file_skips_unchanged_content(temp_dir):
+    dest_file = os.path.join(temp_dir.strpath, 'foo')
+    util.write_file(dest_file, 'foo')
+    os.utime(dest_file, (1, 1))
+
+    assert not util.write_file(dest_file, 'foo')
+    assert 1 == os.path.getmtime(dest_file)
+
+
+def test_write_file_rewrites_changed_content(temp_dir):
+    dest_file = os.path.join(temp_dir.strpath, 'foo')
+    util.write_file(dest_file, 'foo')
+
+    assert util.write_file(dest_file, 'bar')
+    with open(dest_file, 'r') as stream:
+        assert '# Molecule managed\n\nbar' == stream.read()
+
+
+def test_atomic_write(temp_dir):
+    dest_file = os.path.join(temp_dir.strpath, 'foo')
+    util.atomic_write(dest_file, 'foo')
+
+    with open(dest_file, 'r') as stream:
+        assert 'foo' == stream.read()
+    assert ['foo'] == os.listdir(temp_dir.strpath)
+    assert 0o666 & ~util.UMASK == os.stat(dest_file).st_mode & 0o777
+
+
+def test_atomic_write_with_mode(temp_dir):
+    dest_file = os.path.join(temp_dir.strpath, 'foo')
+    util.atomic_write(dest_file, 'foo', mode=0o600)
+
+    assert 0o600 == os.stat(dest_file).st_mode & 0o777
+
+
+def test_atomic_write_removes_temporary_file_on_error(mocker, temp_dir):
+    dest_file = os.path.join(temp_dir.strpath, 'foo')
+    mocker.patch('os.rename', side_effect=OSError)
+    with pytest.raises(OSError):
+        util.atomic_write(dest_file, 'foo')
+
+    assert [] == os.listdir(temp_dir.strpath)
+
+
+def test_makedirs(temp_dir):
+    path = os.path.join(temp_dir.strpath, 'foo', 'bar')
+    util.makedirs(path)
+    util.makedirs(path)
+
+    assert os.path.isdir(path)
+
+
+def test_makedirs_raises_when_a_file_exists(temp_dir):
+    path = temp_dir.join('foo')
+    path.write('')
+    with pytest.raises(OSError):
+        util.makedirs(path.strpath)
+
+
 def test_safe_dump():
     x = '---\nfoo: bar\n'
 
     assert x == util.safe_dump({'foo': 'bar'})
 
 
+def test_safe_dump_matches_pure_python_dumper():
+    data = {
+        'foo': [{
+            'bar': None,
+            'baz': True,
+            'qux': 'multi\nline\n',
+        }],
+        'zzyzx': 'x' * 100,
+    }
+    x = yaml.dump(
+        data,
+        Dumper=yaml.SafeDumper,
+        default_flow_style=False,
+        explicit_start=True)
+
+    assert x == util.safe_dump(data)
+
+
+def test_yaml_backend_prefers_libyaml():
+    if yaml.__with_libyaml__:
+        assert yaml.CSafeLoader == util.YAML_LOADER
+        assert yaml.CSafeDumper == util.YAML_DUMPER
+    else:
+        assert yaml.SafeLoader == util.YAML_LOADER
+        assert yaml.SafeDumper == util.YAML_DUMPER
+
+
 def test_safe_load():
     assert {'foo': 'bar'} == util.safe_load('foo: bar')
 
@@ -253,3 +361,19 @@ def test_verbose_flag_preserves_verbose_option():
 def test_title():
     assert 'Foo' == util.title('foo')
     assert 'Foo Bar' == util.title('foo_bar')
+
+
+def test_file_stamp(temp_dir):
+    f = os.path.join(temp_dir.strpath, 'foo')
+    util.write_file(f, 'foo')
+    stamp = util.file_stamp(f)
+
+    assert stamp == util.file_stamp(f)
+
+    util.write_file(f, 'foobar')
+
+    assert stamp != util.file_stamp(f)
+
+
+def test_file_stamp_returns_none_when_missing(temp_dir):
+    assert util.file_stamp(os.path.join(temp_dir.strpath, 'foo')) is None
@@ -21,9 +21,9 @@
 import os
 
 import pytest
-import sh
 
 from molecule import config
+from molecule import runner
 from molecule.verifier import flake8
 
 
@@ -90,7 +90,7 @@ def test_options_property_handles_cli_args(flake8_instance):
 def test_bake(flake8_instance):
     flake8_instance._tests = ['test1', 'test2', 'test3']
     flake8_instance.bake()
-    x = '{} test1 test2 test3'.format(str(sh.flake8))
+    x = '{} test1 test2 test3'.format(runner.which('flake8'))
 
     assert x == flake8_instance._flake8_command
 
@@ -114,13 +114,13 @@ def test_execute_bakes(patched_run_command, flake8_instance):
 
     assert flake8_instance._flake8_command is not None
 
-    cmd = '{} test1 test2 test3'.format(str(sh.flake8))
+    cmd = '{} test1 test2 test3'.format(runner.which('flake8'))
     patched_run_command.assert_called_once_with(cmd, debug=None)
 
 
 def test_executes_catches_and_exits_return_code(patched_run_command,
                                                 flake8_instance):
-    patched_run_command.side_effect = sh.ErrorReturnCode_1(sh.flake8, b'', b'')
+    patched_run_command.side_effect = runner.ErrorReturnCode('flake8', 1)
     with pytest.raises(SystemExit) as e:
         flake8_instance.execute()
 
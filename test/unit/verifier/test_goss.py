@@ -115,7 +115,8 @@ def test_execute(patched_logger_info, patched_ansible_converge,
 
     goss_playbook = os.path.join(goss_instance._config.verifier.directory,
                                  'test_default.yml')
-    patched_ansible_converge.assert_called_once_with(goss_playbook)
+    patched_ansible_converge.assert_called_once_with(
+        goss_playbook, step='verify')
 
     msg = 'Executing Goss tests found in {}/...'.format(
         goss_instance.directory)
@@ -21,9 +21,9 @@
 import os
 
 import pytest
-import sh
 
 from molecule import config
+from molecule import runner
 from molecule.verifier import testinfra
 
 
@@ -143,7 +143,8 @@ def test_bake(inventory_file, testinfra_instance):
     testinfra_instance._tests = ['test1', 'test2', 'test3']
     testinfra_instance.bake()
     x = [
-        str(sh.testinfra), '--ansible-inventory={}'.format(inventory_file),
+        runner.which('testinfra'),
+        '--ansible-inventory={}'.format(inventory_file),
         '--connection=ansible', '-vvv', '--foo=bar', 'test1', 'test2', 'test3'
     ]
     result = str(testinfra_instance._testinfra_command).split()
@@ -203,8 +204,7 @@ def test_execute_bakes(patched_flake8, patched_run_command,
 def test_executes_catches_and_exits_return_code(
         patched_flake8, patched_run_command, patched_testinfra_get_tests,
         testinfra_instance):
-    patched_run_command.side_effect = sh.ErrorReturnCode_1(sh.testinfra, b'',
-                                                           b'')
+    patched_run_command.side_effect = runner.ErrorReturnCode('testinfra', 1)
     with pytest.raises(SystemExit) as e:
         testinfra_instance.execute()
 